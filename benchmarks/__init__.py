@@ -0,0 +1,5 @@
+"""Benchmarks for ccp.
+
+The benchmarks are written for airspeed velocity (asv). See the Benchmarks
+section in CONTRIBUTING.md for instructions on how to run them.
+"""
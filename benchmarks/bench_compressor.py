@@ -0,0 +1,236 @@
+"""Benchmarks for ccp.compressor.StraightThrough and BackToBack.
+
+The points are a subset of the points used in ccp/tests/test_compressor.py.
+"""
+
+from ccp import Q_, State, Point
+from ccp.compressor import (
+    BackToBack,
+    Point1Sec,
+    PointFirstSection,
+    PointSecondSection,
+    StraightThrough,
+)
+
+from .common import reset_eos, set_eos
+
+TEST_FLUID_ST = {
+    "carbon dioxide": 0.80218,
+    "R134a": 0.18842,
+    "nitrogen": 0.0091,
+    "oxygen": 0.0003,
+}
+
+# flow_m (kg/s), speed (RPM), ps (bar), Ts (K), pd (bar), Td (K),
+# balance_line_flow_m (kg/s), seal_gas_flow_m (kg/s), seal_gas_temperature (K)
+TEST_POINTS_ST = [
+    (7.737, 7894, 1.826, 296.7, 6.142, 392.1, 0.1076, 0.04982, 297.7),
+    (5.966, 7981, 1.51, 297, 6.306, 399.9, 0.1119, 0.0509, 297.9),
+    (4.538, 7981, 1.432, 296.3, 7.505, 415.3, 0.1338, 0.05935, 296.9),
+    (3.971, 7963, 1.375, 296, 7.473, 419.1, 0.1334, 0.05874, 296.6),
+]
+
+# flow_m, speed, ps, Ts, pd, Td, balance_line_flow_m, seal_gas_flow_m,
+# seal_gas_temperature, end_seal_upstream_temperature (K),
+# end_seal_upstream_pressure (bar), div_wall_upstream_temperature (K),
+# div_wall_upstream_pressure (bar)
+TEST_POINTS_SEC1 = [
+    (8.716, 9024, 7.083, 298.9, 14.16, 377.1, None, 0.06504, 299.5)
+    + (303.5, 13.1, 361.8, 23.13),
+    (5.724, 9057, 5.592, 298.7, 14.78, 389.8, None, 0.05942, 299.1)
+    + (304.1, 14.27, 363.7, 25.43),
+    (3.888, 9071, 5.16, 300.4, 15.07, 400.2, None, 0.06099, 300.6)
+    + (304.6, 14.66, 361.8, 25.99),
+    (3.277, 9123, 5.038, 300.9, 15.04, 404.3, None, 0.06143, 301)
+    + (304.8, 14.6, 363.7, 26.27),
+]
+
+# flow_m, speed, ps, Ts, pd, Td, balance_line_flow_m, seal_gas_flow_m
+TEST_POINTS_SEC2 = [
+    (4.927, 7739, 13.11, 305.1, 16.31, 335.1, 0.1066, 0.06367),
+    (4.105, 7330, 12.69, 304.5, 16.78, 333.3, 0.1079, 0.06692),
+    (3.36, 7412, 12.62, 304.4, 18.15, 339.9, 0.1222, 0.07412),
+    (2.587, 7449, 12.46, 304.5, 18.6, 344.1, 0.1171, 0.05892),
+]
+
+
+def section_states(ps, Ts, pd, Td, fluid):
+    suc = State(p=Q_(ps, "bar"), T=Q_(Ts, "degK"), fluid=fluid)
+    disch = State(p=Q_(pd, "bar"), T=Q_(Td, "degK"), fluid=fluid)
+    return suc, disch
+
+
+def straight_through_kwargs():
+    fluid_sp = {
+        "methane": 69.945,
+        "ethane": 9.729,
+        "propane": 5.570,
+        "butane": 1.780,
+        "isobutane": 1.020,
+        "pentane": 0.390,
+        "isopentane": 0.360,
+        "hexane": 0.180,
+        "nitrogen": 1.490,
+        "hydrogen sulfide": 0.017,
+        "carbon dioxide": 9.259,
+        "water": 0.200,
+    }
+    guarantee_point = Point(
+        suc=State(p=Q_(16.99, "bar"), T=Q_(38.4, "degC"), fluid=fluid_sp),
+        disch=State(p=Q_(80.38, "bar"), T=Q_(164.6, "degC"), fluid=fluid_sp),
+        flow_v=Q_(8765, "m³/h"),
+        speed=Q_(12361, "RPM"),
+        b=Q_(28.5, "mm"),
+        D=Q_(365, "mm"),
+    )
+
+    test_points = []
+    for flow_m, speed, ps, Ts, pd, Td, m_bal, m_seal, T_seal in TEST_POINTS_ST:
+        suc, disch = section_states(ps, Ts, pd, Td, TEST_FLUID_ST)
+        test_points.append(
+            Point1Sec(
+                flow_m=Q_(flow_m, "kg/s"),
+                speed=Q_(speed, "RPM"),
+                b=Q_(28.5, "mm"),
+                D=Q_(365, "mm"),
+                suc=suc,
+                disch=disch,
+                balance_line_flow_m=Q_(m_bal, "kg/s"),
+                seal_gas_flow_m=Q_(m_seal, "kg/s"),
+                seal_gas_temperature=Q_(T_seal, "degK"),
+                casing_area=7.5,
+                casing_temperature=Q_(31.309, "degC"),
+                ambient_temperature=Q_(0, "degC"),
+            )
+        )
+
+    return dict(
+        guarantee_point=guarantee_point,
+        test_points=test_points,
+        speed=Q_(12193.63898, "RPM"),
+    )
+
+
+def back_to_back_kwargs():
+    fluid_sp = {
+        "methane": 73.66,
+        "ethane": 11.53,
+        "propane": 7.38,
+        "butane": 1.87,
+        "isobutane": 1.1,
+        "pentane": 0.33,
+        "isopentane": 0.3,
+        "hexane": 0.06,
+        "nitrogen": 0.76,
+        "hydrogen sulfide": 0.02,
+        "carbon dioxide": 3,
+    }
+    guarantee_point_sec1 = Point(
+        suc=State(p=Q_(47.39, "bar"), T=Q_(40, "degC"), fluid=fluid_sp),
+        disch=State(p=Q_(136.27, "bar"), T=Q_(123.7, "degC"), fluid=fluid_sp),
+        flow_v=Q_(2283, "m³/h"),
+        speed=Q_(12360, "RPM"),
+        b=Q_(10.15, "mm"),
+        D=Q_(365, "mm"),
+    )
+    guarantee_point_sec2 = Point(
+        suc=State(p=Q_(135.38, "bar"), T=Q_(40, "degC"), fluid=fluid_sp),
+        disch=State(p=Q_(250.44, "bar"), T=Q_(86.7, "degC"), fluid=fluid_sp),
+        flow_v=Q_(726, "m³/h"),
+        speed=Q_(12360, "RPM"),
+        b=Q_(6.38, "mm"),
+        D=Q_(320, "mm"),
+    )
+
+    test_points_sec1 = []
+    for values in TEST_POINTS_SEC1:
+        flow_m, speed, ps, Ts, pd, Td, m_bal, m_seal, T_seal = values[:9]
+        T_end_seal, p_end_seal, T_div_wall, p_div_wall = values[9:]
+        suc, disch = section_states(ps, Ts, pd, Td, {"carbon dioxide": 1})
+        test_points_sec1.append(
+            PointFirstSection(
+                flow_m=Q_(flow_m, "kg/s"),
+                speed=Q_(speed, "RPM"),
+                b=Q_(10.5, "mm"),
+                D=Q_(365, "mm"),
+                suc=suc,
+                disch=disch,
+                balance_line_flow_m=m_bal,
+                seal_gas_flow_m=m_seal,
+                seal_gas_temperature=T_seal,
+                end_seal_upstream_temperature=T_end_seal,
+                end_seal_upstream_pressure=Q_(p_end_seal, "bar"),
+                div_wall_upstream_temperature=T_div_wall,
+                div_wall_upstream_pressure=Q_(p_div_wall, "bar"),
+                casing_area=5.5,
+                casing_temperature=Q_(23.895, "degC"),
+                ambient_temperature=Q_(0, "degC"),
+            )
+        )
+
+    test_points_sec2 = []
+    for flow_m, speed, ps, Ts, pd, Td, m_bal, m_seal in TEST_POINTS_SEC2:
+        suc, disch = section_states(ps, Ts, pd, Td, {"carbon dioxide": 1})
+        test_points_sec2.append(
+            PointSecondSection(
+                flow_m=Q_(flow_m, "kg/s"),
+                speed=Q_(speed, "RPM"),
+                b=Q_(6.38, "mm"),
+                D=Q_(320, "mm"),
+                suc=suc,
+                disch=disch,
+                balance_line_flow_m=m_bal,
+                seal_gas_flow_m=m_seal,
+                casing_area=5.5,
+                casing_temperature=Q_(17.97, "degC"),
+                ambient_temperature=Q_(0, "degC"),
+            )
+        )
+
+    return dict(
+        guarantee_point_sec1=guarantee_point_sec1,
+        guarantee_point_sec2=guarantee_point_sec2,
+        test_points_sec1=test_points_sec1,
+        test_points_sec2=test_points_sec2,
+        speed=Q_(12152.45187, "RPM"),
+    )
+
+
+class StraightThroughSuite:
+    timeout = 1200
+    number = 1
+    repeat = 3
+
+    def setup(self):
+        set_eos()
+        self.kwargs = straight_through_kwargs()
+        self.compressor = StraightThrough(**self.kwargs)
+
+    def teardown(self):
+        reset_eos()
+
+    def time_build(self):
+        StraightThrough(**self.kwargs)
+
+    def time_calculate_speed_to_match_discharge_pressure(self):
+        self.compressor.calculate_speed_to_match_discharge_pressure()
+
+
+class BackToBackSuite:
+    timeout = 1200
+    number = 1
+    repeat = 3
+
+    def setup(self):
+        set_eos()
+        self.kwargs = back_to_back_kwargs()
+        self.compressor = BackToBack(**self.kwargs)
+
+    def teardown(self):
+        reset_eos()
+
+    def time_build(self):
+        BackToBack(**self.kwargs)
+
+    def time_calculate_speed_to_match_discharge_pressure(self):
+        self.compressor.calculate_speed_to_match_discharge_pressure()
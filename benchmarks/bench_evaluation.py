@@ -0,0 +1,100 @@
+"""Benchmarks for ccp.Evaluation with the data in ccp/tests/data."""
+
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+import ccp
+from ccp import Q_
+
+from .common import DATA_DIR, reset_eos, set_eos
+
+OPERATION_FLUID = {
+    "methane": 44.04,
+    "ethane": 3.18,
+    "propane": 0.66,
+    "n-butane": 0.15,
+    "i-butane": 0.05,
+    "n-pentane": 0.03,
+    "i-pentane": 0.02,
+    "n2": 0.25,
+    "h2s": 0.06,
+    "co2": 51.55,
+}
+
+DATA_UNITS = {
+    "ps": "bar",
+    "Ts": "degC",
+    "pd": "bar",
+    "Td": "degC",
+    "flow_v": "m³/s",
+    "speed": "RPM",
+}
+
+
+def evaluation_impeller():
+    suc = ccp.State(
+        p=Q_(4, "bar"),
+        T=Q_(40, "degC"),
+        fluid={
+            "methane": 58.976,
+            "ethane": 3.099,
+            "propane": 0.6,
+            "n-butane": 0.08,
+            "i-butane": 0.05,
+            "n-pentane": 0.01,
+            "i-pentane": 0.01,
+            "n2": 0.55,
+            "h2s": 0.02,
+            "co2": 36.605,
+        },
+    )
+    return ccp.Impeller.load_from_engauge_csv(
+        suc=suc,
+        curve_name="eval-lp-sec1-caso-a",
+        curve_path=DATA_DIR,
+        flow_units="m³/h",
+        head_units="kJ/kg",
+        number_of_points=4,
+    )
+
+
+class EvaluationSuite:
+    timeout = 3600
+    number = 1
+    repeat = 1
+
+    def setup_cache(self):
+        set_eos()
+        evaluation = ccp.Evaluation(
+            data=pd.read_parquet(DATA_DIR / "data.parquet"),
+            operation_fluid=OPERATION_FLUID,
+            data_units=DATA_UNITS,
+            impellers=[evaluation_impeller()],
+            n_clusters=2,
+        )
+        file = Path(tempfile.mkdtemp()) / "evaluation.ccp_eval"
+        evaluation.save(file)
+        reset_eos()
+        return str(file)
+
+    def setup(self, file):
+        set_eos()
+        self.data = pd.read_parquet(DATA_DIR / "data.parquet")
+        self.impeller = evaluation_impeller()
+
+    def teardown(self, file):
+        reset_eos()
+
+    def time_evaluation(self, file):
+        ccp.Evaluation(
+            data=self.data,
+            operation_fluid=OPERATION_FLUID,
+            data_units=DATA_UNITS,
+            impellers=[self.impeller],
+            n_clusters=2,
+        )
+
+    def time_load(self, file):
+        ccp.Evaluation.load(file)
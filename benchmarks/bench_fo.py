@@ -0,0 +1,53 @@
+"""Benchmarks for ccp.FlowOrifice."""
+
+import numpy as np
+
+from ccp import Q_, FlowOrifice
+
+from .common import gas_state, reset_eos, set_eos
+
+
+class FlowOrificeSuite:
+    def setup(self):
+        set_eos()
+        self.state = gas_state()
+        self.D = Q_(250, "mm")
+        self.d = Q_(170, "mm")
+        self.delta_p = Q_(0.1, "bar")
+        self.flow_m = FlowOrifice(self.state, self.delta_p, self.D, self.d).qm
+        self.flow_m_array = Q_(
+            np.linspace(0.5, 1.5, 1000) * self.flow_m.to("kg/s").m, "kg/s"
+        )
+
+    def teardown(self):
+        reset_eos()
+
+    def time_flow(self):
+        FlowOrifice(self.state, self.delta_p, self.D, self.d)
+
+    def time_solve_d(self):
+        FlowOrifice.solve(
+            state=self.state,
+            D=self.D,
+            find="d",
+            delta_p=self.delta_p,
+            flow_m=self.flow_m,
+        )
+
+    def time_solve_delta_p(self):
+        FlowOrifice.solve(
+            state=self.state,
+            D=self.D,
+            find="delta_p",
+            d=self.d,
+            flow_m=self.flow_m,
+        )
+
+    def time_solve_d_array(self):
+        FlowOrifice.solve(
+            state=self.state,
+            D=self.D,
+            find="d",
+            delta_p=self.delta_p,
+            flow_m=self.flow_m_array,
+        )
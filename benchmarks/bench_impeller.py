@@ -0,0 +1,90 @@
+"""Benchmarks for ccp.Curve and ccp.Impeller."""
+
+import numpy as np
+
+import ccp
+from ccp import Q_, Curve, Impeller
+
+from .common import DATA_DIR, example_impeller, reset_eos, set_eos
+
+
+class CurveSuite:
+    timeout = 300
+
+    def setup(self):
+        set_eos()
+        self.curve = example_impeller().curves[0]
+        self.flow_v = Q_(
+            np.linspace(self.curve.flow_v.m.min(), self.curve.flow_v.m.max(), 100),
+            self.curve.flow_v.u,
+        )
+
+    def teardown(self):
+        reset_eos()
+
+    def time_create(self):
+        Curve(self.curve.points)
+
+    def time_head_interpolated(self):
+        self.curve.head_interpolated(self.flow_v)
+
+    def time_disch_T_interpolated(self):
+        self.curve.disch.T_interpolated(self.flow_v)
+
+
+class ImpellerSuite:
+    timeout = 300
+
+    def setup(self):
+        set_eos()
+        self.imp = example_impeller()
+        speeds = [c.speed.m for c in self.imp.curves]
+        self.speed = Q_(np.mean(speeds[:2]), "rad/s")
+        flows = self.imp.curves[0].flow_v.m
+        self.flow_v = Q_(np.mean(flows), "m³/s")
+
+    def teardown(self):
+        reset_eos()
+
+    def time_create(self):
+        Impeller(self.imp.points)
+
+    def time_load_from_engauge_csv(self):
+        Impeller.load_from_engauge_csv(
+            suc=self.imp.points[0].suc,
+            curve_name="lp-sec1-caso-a",
+            curve_path=DATA_DIR,
+            b=Q_(5.7, "mm"),
+            D=Q_(550, "mm"),
+            head_units="kJ/kg",
+            flow_units="m³/h",
+            number_of_points=7,
+        )
+
+    def time_curve(self):
+        self.imp.curve(self.speed)
+
+    def time_point(self):
+        self.imp.point(flow_v=self.flow_v, speed=self.speed)
+
+
+class ConvertSuite:
+    timeout = 1800
+    number = 1
+    repeat = 1
+
+    def setup(self):
+        set_eos()
+        self.imp = example_impeller()
+        self.suc = ccp.State(
+            p=Q_(5, "bar"), T=Q_(30, "degC"), fluid={"co2": 0.7, "n2": 0.3}
+        )
+
+    def teardown(self):
+        reset_eos()
+
+    def time_convert_from(self):
+        Impeller.convert_from(self.imp, suc=self.suc, find="speed")
+
+    def time_convert_from_same_speed(self):
+        Impeller.convert_from(self.imp, suc=self.suc, find="speed", speed="same")
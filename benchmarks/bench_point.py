@@ -0,0 +1,119 @@
+"""Benchmarks for ccp.Point."""
+
+import ccp
+import ccp.point
+from ccp import Q_, Point
+
+from .common import gas_point, reset_eos, set_eos
+
+# arguments used in the Point._calc_from_<arguments> methods
+POINT_ARGUMENTS = [
+    "suc",
+    "disch",
+    "disch_p",
+    "disch_T",
+    "flow_v",
+    "flow_m",
+    "speed",
+    "head",
+    "eff",
+    "power",
+    "power_shaft",
+    "power_losses",
+    "torque",
+    "phi",
+    "psi",
+    "volume_ratio",
+    "pressure_ratio",
+]
+
+CALC_PATHS = sorted(
+    name[len("_calc_from_") :] for name in dir(Point) if name.startswith("_calc_from_")
+)
+
+POLYTROPIC_METHODS = ["schultz", "mallen_saville", "sandberg_colby", "huntington"]
+
+
+def path_arguments(path):
+    """Split a _calc_from_ path (e.g. 'disch_flow_v_speed_suc') in arguments."""
+    arguments = []
+    tokens = sorted(POINT_ARGUMENTS, key=len, reverse=True)
+    while path:
+        for token in tokens:
+            if path == token or path.startswith(token + "_"):
+                arguments.append(token)
+                path = path[len(token) + 1 :]
+                break
+        else:
+            raise ValueError(f"Could not parse {path}")
+    return arguments
+
+
+class PointSuite:
+    """Create a point from each combination of arguments accepted by ccp.Point."""
+
+    params = [CALC_PATHS]
+    param_names = ["arguments"]
+    timeout = 120
+
+    def setup(self, path):
+        set_eos()
+        reference = gas_point(power_losses=Q_(0, "W"))
+        values = {
+            "suc": reference.suc,
+            "disch": reference.disch,
+            "disch_p": reference.disch.p(),
+            "disch_T": reference.disch.T(),
+            "pressure_ratio": reference.disch.p() / reference.suc.p(),
+        }
+        self.kwargs = {
+            arg: values[arg] if arg in values else getattr(reference, arg)
+            for arg in path_arguments(path)
+        }
+        self.kwargs.update(b=reference.b, D=reference.D)
+
+    def teardown(self, path):
+        reset_eos()
+
+    def time_point(self, path):
+        Point(**self.kwargs)
+
+
+class PolytropicSuite:
+    params = [POLYTROPIC_METHODS]
+    param_names = ["polytropic_method"]
+    timeout = 120
+
+    def setup(self, method):
+        set_eos()
+        self.point = gas_point(polytropic_method=method)
+        self.head_pol = getattr(ccp.point, f"head_pol_{method}")
+
+    def teardown(self, method):
+        reset_eos()
+
+    def time_head_pol(self, method):
+        self.head_pol(self.point.suc, self.point.disch)
+
+    def time_point_from_disch(self, method):
+        Point(
+            suc=self.point.suc,
+            disch=self.point.disch,
+            flow_v=self.point.flow_v,
+            speed=self.point.speed,
+            b=self.point.b,
+            D=self.point.D,
+            polytropic_method=method,
+        )
+
+    def time_point_from_head_eff(self, method):
+        Point(
+            suc=self.point.suc,
+            flow_v=self.point.flow_v,
+            speed=self.point.speed,
+            head=self.point.head,
+            eff=self.point.eff,
+            b=self.point.b,
+            D=self.point.D,
+            polytropic_method=method,
+        )
@@ -0,0 +1,44 @@
+"""Benchmarks for ccp.State."""
+
+import ccp
+from ccp import Q_
+
+from .common import EOS_LIST, GAS, reset_eos, set_eos
+
+
+class StateSuite:
+    params = [EOS_LIST]
+    param_names = ["EOS"]
+
+    def setup(self, EOS):
+        set_eos(EOS)
+        self.state = ccp.State(p=Q_(10, "bar"), T=Q_(40, "degC"), fluid=GAS)
+        self.p = self.state.p()
+        self.T = self.state.T()
+        self.h = self.state.h()
+        self.s = self.state.s()
+        self.rho = self.state.rho()
+
+    def teardown(self, EOS):
+        reset_eos()
+
+    def time_create(self, EOS):
+        ccp.State(p=self.p, T=self.T, fluid=GAS)
+
+    def time_update_p_T(self, EOS):
+        self.state.update(p=self.p, T=self.T)
+
+    def time_update_p_h(self, EOS):
+        self.state.update(p=self.p, h=self.h)
+
+    def time_update_p_s(self, EOS):
+        self.state.update(p=self.p, s=self.s)
+
+    def time_update_rho_T(self, EOS):
+        self.state.update(rho=self.rho, T=self.T)
+
+    def time_properties(self, EOS):
+        self.state.speed_sound()
+        self.state.z()
+        self.state.cp()
+        self.state.kv()
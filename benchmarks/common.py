@@ -0,0 +1,62 @@
+"""Objects shared by the benchmarks."""
+
+import os
+from pathlib import Path
+
+import ccp
+from ccp import Q_
+
+# EOS used in the benchmarks that are not parametrized by EOS.
+# Set the CCP_BENCHMARK_EOS environment variable to run them with another EOS.
+EOS = os.environ.get("CCP_BENCHMARK_EOS", "REFPROP")
+EOS_LIST = ["REFPROP", "HEOS"]
+
+DATA_DIR = Path(ccp.__file__).parent / "tests/data"
+
+GAS = {
+    "methane": 0.85,
+    "ethane": 0.08,
+    "propane": 0.03,
+    "nitrogen": 0.02,
+    "carbon dioxide": 0.02,
+}
+
+
+def set_eos(EOS=EOS):
+    """Set ccp.config.EOS.
+
+    Raises NotImplementedError, which makes asv skip the benchmark, if the EOS is
+    not available (e.g. REFPROP is not installed).
+    """
+    ccp.config.EOS = EOS
+    ccp.config.IMPELLER_CACHE = None
+    try:
+        ccp.State(p=Q_(1, "bar"), T=Q_(300, "degK"), fluid={"methane": 1})
+    except ValueError as e:
+        raise NotImplementedError(f"EOS {EOS} is not available.") from e
+
+
+def reset_eos():
+    ccp.config.EOS = "REFPROP"
+
+
+def gas_state(p=Q_(10, "bar"), T=Q_(40, "degC"), fluid=GAS):
+    return ccp.State(p=p, T=T, fluid=fluid)
+
+
+def gas_point(**kwargs):
+    """Point compressing GAS from 10 bar to 30 bar."""
+    point_kwargs = dict(
+        suc=gas_state(),
+        disch=gas_state(p=Q_(30, "bar"), T=Q_(147, "degC")),
+        flow_v=Q_(6500, "m³/h"),
+        speed=Q_(11145, "RPM"),
+        b=Q_(28.5, "mm"),
+        D=Q_(365, "mm"),
+    )
+    point_kwargs.update(kwargs)
+    return ccp.Point(**point_kwargs)
+
+
+def example_impeller():
+    return ccp.impeller_example()
@@ -55,54 +55,81 @@ imp.disch.T_plot()
 ```
 """
 
-
 ###############################################################################
-# set refprop path in the beginning to avoid strange behavior
+# set refprop path before the first state is created to avoid strange behavior
 ###############################################################################
 
+import importlib as _importlib
 import os as _os
+import threading as _threading
 import warnings as _warnings
 from pathlib import Path as _Path
 
-import CoolProp.CoolProp as _CP
-from ctREFPROP.ctREFPROP import REFPROPFunctionLibrary as _REFPROPFunctionLibrary
-
 # use _ to avoid polluting the namespace when importing
 
-try:
-    _path = _Path(_os.environ["RPPREFIX"])
-except KeyError:
-    if _os.path.exists("C:\\Users\\Public\\REFPROP"):
-        _os.environ["RPprefix"] = "C:\\Users\\Public\\REFPROP"
-        _path = _Path(_os.environ["RPPREFIX"])
+_RP = None
+# REFPROP has global state and ctREFPROP releases the GIL during the calls, so
+# direct calls to the library from different threads have to be serialized
+_refprop_lock = _threading.RLock()
+
+
+def _refprop():
+    """Configure REFPROP path and load the library.
+
+    This is called when the first ccp.State is created, so that CoolProp and
+    REFPROP are not loaded by ``import ccp``.
+
+    Returns
+    -------
+    RP : ctREFPROP.ctREFPROP.REFPROPFunctionLibrary
+        REFPROP library.
+    """
+    global _RP
+    if _RP is not None:
+        return _RP
+
+    with _refprop_lock:
+        if _RP is None:
+            _RP = _load_refprop()
+
+    return _RP
+
+
+def _load_refprop():
+    import CoolProp.CoolProp as CP
+    from ctREFPROP.ctREFPROP import REFPROPFunctionLibrary
+
+    try:
+        path = _Path(_os.environ["RPPREFIX"])
+    except KeyError:
+        if _os.path.exists("C:\\Users\\Public\\REFPROP"):
+            _os.environ["RPprefix"] = "C:\\Users\\Public\\REFPROP"
+            path = _Path(_os.environ["RPPREFIX"])
+        else:
+            path = _Path.cwd()
+
+    CP.set_config_string(CP.ALTERNATIVE_REFPROP_PATH, str(path))
+    try:
+        RP = REFPROPFunctionLibrary(path)
+        RP.SETPATHdll(str(path))
+    except TypeError:
+        RP = REFPROPFunctionLibrary
+
+    if _os.name == "posix":
+        shared_library = "librefprop.so"
     else:
-        _path = _Path.cwd()
+        shared_library = "REFPRP64.DLL"
 
-_CP.set_config_string(_CP.ALTERNATIVE_REFPROP_PATH, str(_path))
-try:
-    _RP = _REFPROPFunctionLibrary(_path)
-    _RP.SETPATHdll(str(_path))
-except TypeError:
-    _RP = _REFPROPFunctionLibrary
+    library_path = path / shared_library
 
-if _os.name == "posix":
-    _shared_library = "librefprop.so"
-else:
-    _shared_library = "REFPRP64.DLL"
+    if not library_path.is_file():
+        _warnings.warn(f"{library_path}.\nREFPROP not configured.")
 
-_library_path = _path / _shared_library
+    return RP
 
-if not _library_path.is_file():
-    _warnings.warn(f"{_library_path}.\nREFPROP not configured.")
 
 __version__ = "0.3.6"
 
-__version__full = (
-    f"ccp: {__version__} | "
-    + f'CP : {_CP.get_global_param_string("version")} | '
-    + f'REFPROP : {_CP.get_global_param_string("REFPROP_version")}'
-)
-
 ###############################################################################
 # pint
 ###############################################################################
@@ -119,36 +146,95 @@ if isinstance(ureg.get(), _pint.registry.LazyRegistry):
 Q_ = ureg.Quantity
 _warnings.filterwarnings("ignore", message="The unit of the quantity is stripped")
 
+from . import config
+
 ###############################################################################
-# plotly theme
+# lazy imports
 ###############################################################################
+# Modules are only imported when their objects are first accessed (e.g.
+# ccp.State), so that CoolProp, scipy, plotly, sklearn etc. are not loaded by
+# ``import ccp``. The plotly 'ccp' template is registered when the first plot is
+# created (see ccp.plotly_theme).
+
+_lazy_objects = {
+    "fluid_list": ".config.fluids",
+    "State": ".state",
+    "Point": ".point",
+    "PointTable": ".point",
+    "Curve": ".curve",
+    "Impeller": ".impeller",
+    "impeller_example": ".impeller",
+    "ImpellerCache": ".cache",
+    "ImpellerLibrary": ".library",
+    "Train": ".train",
+    "profile": ".profiling",
+    "FlowOrifice": ".fo",
+    "check_similarity": ".similarity",
+    "Evaluation": ".evaluation",
+}
 
-from plotly import io as _pio
-import ccp.plotly_theme
+# submodules used as ccp.<module>.<function> (e.g. ccp.impeller.impeller_example)
+_lazy_modules = [
+    "cache",
+    "compressor",
+    "curve",
+    "data_io",
+    "envelope",
+    "evaluation",
+    "fo",
+    "impeller",
+    "library",
+    "parallel",
+    "plotly_theme",
+    "point",
+    "polytropic",
+    "profiling",
+    "similarity",
+    "solvers",
+    "state",
+    "train",
+]
 
-_pio.templates.default = "ccp"
 
-###############################################################################
-# imports
-###############################################################################
+def __getattr__(name):
+    if name in _lazy_objects:
+        module = _importlib.import_module(_lazy_objects[name], __name__)
+        obj = getattr(module, name)
+        globals()[name] = obj
+        return obj
+
+    if name in _lazy_modules:
+        return _importlib.import_module(f".{name}", __name__)
+
+    if name == "__version__full":
+        import CoolProp.CoolProp as _CP
+
+        return (
+            f"ccp: {__version__} | "
+            + f'CP : {_CP.get_global_param_string("version")} | '
+            + f'REFPROP : {_CP.get_global_param_string("REFPROP_version")}'
+        )
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_objects) | set(_lazy_modules))
 
-from .config.fluids import fluid_list
-from .state import State
-from .point import Point
-from .curve import Curve
-from .impeller import Impeller, impeller_example
-from .fo import FlowOrifice
-from .similarity import check_similarity
-from .evaluation import Evaluation
 
 __all__ = [
     "State",
     "Point",
+    "PointTable",
     "Curve",
     "Impeller",
     "FlowOrifice",
     "fluid_list",
     "check_similarity",
     "impeller_example",
+    "ImpellerCache",
+    "ImpellerLibrary",
+    "Train",
     "Evaluation",
+    "profile",
 ]
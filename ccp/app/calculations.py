@@ -0,0 +1,167 @@
+"""Computation layer of the ccp app.
+
+The pages collect the inputs (gas composition, data sheet, test points and
+units) in plain dictionaries, which are normalized with :func:`normalize` to a
+canonical structure of builtins (quantities converted to base units, sorted
+keys). The functions in this module only depend on these normalized inputs and
+are cached with st.cache_resource. With the same inputs the cache returns the
+compressor object that was stored, without pickling or recalculating it (with
+st.cache_data each cache hit would unpickle the compressor, and every ccp.State
+in it would be flashed again). The cached objects are shared by all sessions in
+the same server, so they must be treated as read-only: pages can call methods
+that return new objects (e.g. point or calculate_speed_to_match_discharge_pressure)
+but must not modify the compressors or their points.
+
+The _callback argument, which is not part of the cache key, receives the
+progress of the calculation as _callback(done, total) (see ccp.app.jobs).
+"""
+
+import streamlit as st
+
+import ccp
+from ccp.compressor import (
+    Point1Sec,
+    PointFirstSection,
+    PointSecondSection,
+    StraightThrough,
+    BackToBack,
+)
+
+Q_ = ccp.Q_
+
+# maximum number of results of each function kept in the cache
+MAX_ENTRIES = 64
+
+
+def state_inputs(p, T, fluid):
+    """Inputs of a ccp.State, which is only created by the cached functions."""
+    return {"p": p, "T": T, "fluid": fluid}
+
+
+def normalize(value):
+    """Convert the inputs to a canonical structure used as cache key.
+
+    Quantities are converted to base units and stored as ("quantity", magnitude,
+    units), ccp.State objects are converted to their p, T and fluid, and
+    dictionaries are sorted by key.
+
+    Parameters
+    ----------
+    value : dict, list, pint.Quantity, ccp.State, float, str
+        Inputs to be normalized.
+
+    Returns
+    -------
+    normalized : dict, list, tuple, float, str
+        Normalized inputs, built only with builtin types.
+    """
+    if isinstance(value, ccp.State):
+        value = state_inputs(value.p(), value.T(), value.fluid)
+    if isinstance(value, Q_):
+        value = value.to_base_units()
+        return ("quantity", float(value.m), str(value.units))
+    if isinstance(value, dict):
+        if "fluid" in value:
+            value = {
+                **value,
+                "fluid": {k.lower(): float(v) for k, v in value["fluid"].items()},
+            }
+        return {k: normalize(v) for k, v in sorted(value.items())}
+    if isinstance(value, (list, tuple)):
+        return [normalize(v) for v in value]
+    if hasattr(value, "item"):
+        # numpy scalars
+        return value.item()
+    return value
+
+
+def denormalize(value):
+    """Convert normalized inputs back to quantities and ccp.State objects."""
+    if isinstance(value, tuple) and len(value) == 3 and value[0] == "quantity":
+        return Q_(value[1], value[2])
+    if isinstance(value, dict):
+        value = {k: denormalize(v) for k, v in value.items()}
+        if set(value) == {"p", "T", "fluid"}:
+            return ccp.State(**value)
+        return value
+    if isinstance(value, list):
+        return [denormalize(v) for v in value]
+    return value
+
+
+@st.cache_resource(show_spinner=False, max_entries=MAX_ENTRIES)
+def straight_through(inputs, _callback=None):
+    """Create a StraightThrough compressor.
+
+    Parameters
+    ----------
+    inputs : dict
+        Normalized inputs with the keys "guarantee_point" (Point kwargs),
+        "test_points" (list of Point1Sec kwargs) and "reynolds_correction".
+
+    Returns
+    -------
+    straight_through : ccp.compressor.StraightThrough
+    """
+    kwargs = denormalize(inputs)
+
+    return StraightThrough(
+        guarantee_point=ccp.Point(**kwargs["guarantee_point"]),
+        test_points=[Point1Sec(**kws) for kws in kwargs["test_points"]],
+        reynolds_correction=kwargs["reynolds_correction"],
+        callback=_callback,
+    )
+
+
+@st.cache_resource(show_spinner=False, max_entries=MAX_ENTRIES)
+def straight_through_speed(inputs, _callback=None):
+    """StraightThrough with the speed matching the guarantee discharge pressure.
+
+    The compressor is obtained from the straight_through cache.
+    """
+    return straight_through(
+        inputs, _callback=_callback
+    ).calculate_speed_to_match_discharge_pressure(callback=_callback)
+
+
+@st.cache_resource(show_spinner=False, max_entries=MAX_ENTRIES)
+def back_to_back(inputs, _callback=None):
+    """Create a BackToBack compressor.
+
+    Parameters
+    ----------
+    inputs : dict
+        Normalized inputs with the keys "guarantee_point_sec1",
+        "guarantee_point_sec2" (Point kwargs), "test_points_sec1" (list of
+        PointFirstSection kwargs), "test_points_sec2" (list of
+        PointSecondSection kwargs) and "reynolds_correction".
+
+    Returns
+    -------
+    back_to_back : ccp.compressor.BackToBack
+    """
+    kwargs = denormalize(inputs)
+
+    return BackToBack(
+        guarantee_point_sec1=ccp.Point(**kwargs["guarantee_point_sec1"]),
+        guarantee_point_sec2=ccp.Point(**kwargs["guarantee_point_sec2"]),
+        test_points_sec1=[
+            PointFirstSection(**kws) for kws in kwargs["test_points_sec1"]
+        ],
+        test_points_sec2=[
+            PointSecondSection(**kws) for kws in kwargs["test_points_sec2"]
+        ],
+        reynolds_correction=kwargs["reynolds_correction"],
+        callback=_callback,
+    )
+
+
+@st.cache_resource(show_spinner=False, max_entries=MAX_ENTRIES)
+def back_to_back_speed(inputs, _callback=None):
+    """BackToBack with the speed matching the guarantee discharge pressure.
+
+    The compressor is obtained from the back_to_back cache.
+    """
+    return back_to_back(
+        inputs, _callback=_callback
+    ).calculate_speed_to_match_discharge_pressure(callback=_callback)
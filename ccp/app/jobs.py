@@ -0,0 +1,191 @@
+"""Background execution of long calculations in the app.
+
+Compressor calculations are submitted to an executor shared by all sessions in
+the server (with at most MAX_WORKERS calculations running at the same time),
+so that the script thread is not blocked and other sessions are not stalled.
+Each session keeps a handle to its jobs in st.session_state, which is used to
+show the progress and to cancel the calculation.
+
+```{code-block} python
+job = jobs.submit("straight_through", calculations.straight_through, inputs)
+...
+job = jobs.get("straight_through")
+if job is not None and jobs.show_progress(job, key="straight_through"):
+    straight_through = jobs.pop("straight_through").result()
+```
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+
+import ccp
+
+# maximum number of calculations running at the same time in the server
+MAX_WORKERS = 2
+# interval (s) between page updates while a job is running
+POLL_INTERVAL = 0.5
+
+
+class JobCancelled(Exception):
+    """Raised in the calculation thread when the job is cancelled."""
+
+
+class Job:
+    """Handle to a calculation running in the background.
+
+    Parameters
+    ----------
+    text : str, optional
+        Text shown with the progress bar.
+    """
+
+    def __init__(self, text="Calculating..."):
+        self.text = text
+        self.done = 0
+        self.total = None
+        self.future = None
+        self._cancel_event = threading.Event()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(text={self.text!r}, status={self.status!r})"
+
+    def callback(self, done, total):
+        """Progress callback passed to the calculation.
+
+        Raises JobCancelled if the job was cancelled, which interrupts the
+        calculation.
+        """
+        if self._cancel_event.is_set():
+            raise JobCancelled
+        self.done = done
+        self.total = total
+
+    @property
+    def progress(self):
+        """Fraction of the current calculation that is complete (0 to 1)."""
+        if not self.total:
+            return 0.0
+        return min(self.done / self.total, 1.0)
+
+    @property
+    def status(self):
+        """Job status: 'queued', 'running', 'cancelled', 'failed' or 'done'."""
+        if self.future is None or not self.future.done():
+            if self.future is not None and self.future.running():
+                return "running"
+            return "queued"
+        if self.future.cancelled() or isinstance(self.future.exception(), JobCancelled):
+            return "cancelled"
+        if self.future.exception() is not None:
+            return "failed"
+        return "done"
+
+    @property
+    def finished(self):
+        return self.status in ("cancelled", "failed", "done")
+
+    def cancel(self):
+        """Cancel the job.
+
+        A queued job is removed from the executor. A running job is interrupted
+        at the next progress report.
+        """
+        self._cancel_event.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    def result(self):
+        """Result of the calculation (raises the calculation exception if any)."""
+        return self.future.result()
+
+    def exception(self):
+        return self.future.exception()
+
+
+@st.cache_resource
+def executor():
+    """Executor shared by all sessions in the server."""
+    return ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="ccp-app")
+
+
+def _run(job, options, func, args, kwargs):
+    # run with the ccp configuration of the session that submitted the job
+    with ccp.config.override(**options):
+        return func(*args, _callback=job.callback, **kwargs)
+
+
+def submit(name, func, *args, text="Calculating...", **kwargs):
+    """Submit a calculation to the background executor.
+
+    If the session already has a job with the same name, it is cancelled.
+
+    Parameters
+    ----------
+    name : str
+        Name of the job in this session.
+    func : callable
+        Function called as func(*args, _callback=callback, **kwargs).
+    text : str, optional
+        Text shown with the progress bar.
+
+    Returns
+    -------
+    job : Job
+        Handle to the job, also stored in st.session_state["jobs"][name].
+    """
+    jobs = st.session_state.setdefault("jobs", {})
+    if name in jobs:
+        jobs.pop(name).cancel()
+
+    job = Job(text=text)
+    job.future = executor().submit(_run, job, ccp.config.snapshot(), func, args, kwargs)
+    jobs[name] = job
+
+    return job
+
+
+def get(name):
+    """Return the job with this name in the session or None."""
+    return st.session_state.get("jobs", {}).get(name)
+
+
+def pop(name):
+    """Remove the job with this name from the session and return it."""
+    return st.session_state.get("jobs", {}).pop(name, None)
+
+
+def show_progress(job, key):
+    """Show the job progress and a cancel button.
+
+    While the job is not finished, the page is re-run every POLL_INTERVAL
+    seconds to update the progress bar.
+
+    Parameters
+    ----------
+    job : Job
+        Job to be shown.
+    key : str
+        Key used for the cancel button.
+
+    Returns
+    -------
+    finished : bool
+        True if the job is finished (done, failed or cancelled).
+    """
+    if job.finished:
+        return True
+
+    text = job.text
+    if job.status == "queued":
+        text = "Waiting for other calculations to finish..."
+    st.progress(job.progress, text=text)
+    if st.button("Cancel", key=f"cancel_{key}"):
+        job.cancel()
+        if job.finished:
+            return True
+
+    time.sleep(POLL_INTERVAL)
+    st.rerun()
@@ -9,6 +9,8 @@ import toml
 import time
 import sentry_sdk
 import logging
+from ccp.app import calculations, jobs, session
+from ccp.app.calculations import normalize, state_inputs
 from ccp.compressor import Point1Sec, StraightThrough
 from ccp.config.utilities import r_getattr
 from ccp.config.units import ureg
@@ -124,12 +126,9 @@ def main():
                     if name.endswith(".png"):
                         session_state_data[name.split(".")[0]] = my_zip.read(name)
                     elif name.endswith(".toml"):
-                        # create file object to read the toml file
-                        straight_through_file = io.StringIO(
-                            my_zip.read(name).decode("utf-8")
-                        )
-                        session_state_data[name.split(".")[0]] = StraightThrough.load(
-                            straight_through_file
+                        key = name.split(".")[0]
+                        session_state_data[key] = session.load_compressor(
+                            my_zip, key, StraightThrough
                         )
 
             session_state_data_copy = session_state_data.copy()
@@ -158,9 +157,7 @@ def main():
                             my_zip.writestr(f"{key}.png", value)
                         del session_state_dict_copy[key]
                     if isinstance(value, StraightThrough):
-                        my_zip.writestr(
-                            f"{key}.toml", toml.dumps(value._dict_to_save())
-                        )
+                        session.save_compressor(my_zip, key, value)
                         del session_state_dict_copy[key]
                 # then save the rest of the session state
                 session_state_json = json.dumps(session_state_dict_copy)
@@ -742,8 +739,6 @@ def main():
     kwargs = {}
 
     if calculate_button or calculate_speed_button:
-        progress_value = 0
-        progress_bar = st.progress(progress_value, text="Calculating...")
         # calculate guarantee point
         kwargs_guarantee = {}
 
@@ -769,7 +764,7 @@ def main():
                 float(st.session_state["flow_point_guarantee"]),
                 parameters_map["flow"]["points"]["data_sheet_units"],
             )
-        kwargs_guarantee["suc"] = ccp.State(
+        kwargs_guarantee["suc"] = state_inputs(
             p=Q_(
                 float(st.session_state["suction_pressure_point_guarantee"]),
                 parameters_map["suction_pressure"]["points"]["data_sheet_units"],
@@ -780,7 +775,7 @@ def main():
             ),
             fluid=gas_composition_data_sheet["point_guarantee"],
         )
-        kwargs_guarantee["disch"] = ccp.State(
+        kwargs_guarantee["disch"] = state_inputs(
             p=Q_(
                 float(st.session_state["discharge_pressure_point_guarantee"]),
                 parameters_map["discharge_pressure"]["points"]["data_sheet_units"],
@@ -806,13 +801,6 @@ def main():
             parameters_map["D"]["points"]["data_sheet_units"],
         )
 
-        time.sleep(0.1)
-        progress_value += 5
-        progress_bar.progress(progress_value, text="Calculating guarantee point...")
-        guarantee_point = ccp.Point(
-            **kwargs_guarantee,
-        )
-
         for i in range(1, number_of_test_points + 1):
             kwargs = {}
             # check if at least flow, suction pressure and suction temperature are filled
@@ -845,7 +833,7 @@ def main():
                         )
                     else:
                         kwargs["flow_v"] = None
-                kwargs["suc"] = ccp.State(
+                kwargs["suc"] = state_inputs(
                     p=Q_(
                         float(st.session_state[f"suction_pressure_point_{i}"]),
                         parameters_map["suction_pressure"]["points"]["test_units"],
@@ -860,7 +848,7 @@ def main():
                         default_components,
                     ),
                 )
-                kwargs["disch"] = ccp.State(
+                kwargs["disch"] = state_inputs(
                     p=Q_(
                         float(st.session_state[f"discharge_pressure_point_{i}"]),
                         parameters_map["discharge_pressure"]["points"]["test_units"],
@@ -944,42 +932,48 @@ def main():
                     float(st.session_state[f"surface_roughness_point_guarantee"]),
                     parameters_map["surface_roughness"]["points"]["data_sheet_units"],
                 )
-                time.sleep(0.1)
-                progress_value += 2
-                progress_bar.progress(progress_value, text="Calculating test points...")
-
-                test_points.append(
-                    Point1Sec(
-                        speed=Q_(
-                            float(st.session_state[f"speed_point_{i}"]),
-                            parameters_map["speed"]["points"]["test_units"],
-                        ),
-                        **kwargs,
-                    )
+                kwargs["speed"] = Q_(
+                    float(st.session_state[f"speed_point_{i}"]),
+                    parameters_map["speed"]["points"]["test_units"],
                 )
-
-        time.sleep(0.1)
-        progress_value += 10
-        progress_bar.progress(progress_value, text="Converting points...")
-        straight_through = StraightThrough(
-            guarantee_point=guarantee_point,
-            test_points=test_points,
-            reynolds_correction=reynolds_correction,
+                test_points.append(kwargs)
+
+        # the compressor is calculated only if these inputs were not calculated
+        # before (in this or in another session)
+        inputs = normalize(
+            {
+                "guarantee_point": kwargs_guarantee,
+                "test_points": test_points,
+                "reynolds_correction": reynolds_correction,
+            }
         )
-
+        # run in the background so that the server is not blocked
         if calculate_speed_button:
-            time.sleep(0.1)
-            progress_value += 10
-            progress_bar.progress(progress_value, text="Finding speed...")
-            straight_through = (
-                straight_through.calculate_speed_to_match_discharge_pressure()
+            jobs.submit(
+                "straight_through",
+                calculations.straight_through_speed,
+                inputs,
+                text="Finding speed...",
+            )
+        else:
+            jobs.submit(
+                "straight_through",
+                calculations.straight_through,
+                inputs,
+                text="Converting points...",
             )
 
-        time.sleep(0.1)
-        progress_bar.progress(100, text="Done!")
-
-        # add straight_through object to session state
-        st.session_state["straight_through"] = straight_through
+    job = jobs.get("straight_through")
+    if job is not None and jobs.show_progress(job, key="straight_through"):
+        jobs.pop("straight_through")
+        if job.status == "done":
+            # add straight_through object to session state
+            st.session_state["straight_through"] = job.result()
+        elif job.status == "cancelled":
+            st.warning("Calculation cancelled.")
+        else:
+            st.error("Calculation failed.")
+            st.exception(job.exception())
 
     # if straight_through is not defined, pickle the saved file
     if (
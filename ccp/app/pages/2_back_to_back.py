@@ -9,6 +9,8 @@ import toml
 import time
 import sentry_sdk
 import logging
+from ccp.app import calculations, jobs, session
+from ccp.app.calculations import normalize, state_inputs
 from ccp.compressor import PointFirstSection, PointSecondSection, BackToBack
 from ccp.config.utilities import r_getattr
 from ccp.config.units import ureg
@@ -126,12 +128,9 @@ def main():
                     if name.endswith(".png"):
                         session_state_data[name.split(".")[0]] = my_zip.read(name)
                     elif name.endswith(".toml"):
-                        # create file object to read the toml file
-                        back_to_back_file = io.StringIO(
-                            my_zip.read(name).decode("utf-8")
-                        )
-                        session_state_data[name.split(".")[0]] = BackToBack.load(
-                            back_to_back_file
+                        key = name.split(".")[0]
+                        session_state_data[key] = session.load_compressor(
+                            my_zip, key, BackToBack
                         )
 
             session_state_data_copy = session_state_data.copy()
@@ -160,9 +159,7 @@ def main():
                             my_zip.writestr(f"{key}.png", value)
                         del session_state_dict_copy[key]
                     if isinstance(value, BackToBack):
-                        my_zip.writestr(
-                            f"{key}.toml", toml.dumps(value._dict_to_save())
-                        )
+                        session.save_compressor(my_zip, key, value)
                         del session_state_dict_copy[key]
                 # then save the rest of the session state
                 session_state_json = json.dumps(session_state_dict_copy)
@@ -702,8 +699,6 @@ def main():
     kwargs = {}
 
     if calculate_button or calculate_speed_button:
-        progress_value = 0
-        progress_bar = st.progress(progress_value, text="Calculating...")
         # calculate guarantee point for first and second section
         kwargs_guarantee_section_1 = {}
         kwargs_guarantee_section_2 = {}
@@ -742,7 +737,7 @@ def main():
                     float(st.session_state[f"flow_{section}_point_guarantee"]),
                     parameters_map["flow"][section]["data_sheet_units"],
                 )
-            section_kws["suc"] = ccp.State(
+            section_kws["suc"] = state_inputs(
                 p=Q_(
                     float(
                         st.session_state[f"suction_pressure_{section}_point_guarantee"]
@@ -759,7 +754,7 @@ def main():
                 ),
                 fluid=gas_composition_data_sheet[f"{section}_point_guarantee"],
             )
-            section_kws["disch"] = ccp.State(
+            section_kws["disch"] = state_inputs(
                 p=Q_(
                     float(
                         st.session_state[
@@ -793,25 +788,8 @@ def main():
                 parameters_map["D"][section]["data_sheet_units"],
             )
 
-        time.sleep(0.1)
-        progress_value += 5
-        progress_bar.progress(progress_value, text="Calculating guarantee points...")
-        guarantee_point_section_1 = ccp.Point(
-            **kwargs_guarantee_section_1,
-        )
-        guarantee_point_section_2 = ccp.Point(
-            **kwargs_guarantee_section_2,
-        )
-
         for section in ["section_1", "section_2"]:
             for i in range(1, number_of_test_points + 1):
-                time.sleep(0.1)
-                progress_value += 1
-                progress_bar.progress(
-                    progress_value,
-                    text=f"Calculating test point: {section} point {i}...",
-                )
-
                 kwargs = {}
                 # check if at least flow, suction pressure and suction temperature are filled
                 if (
@@ -846,7 +824,7 @@ def main():
                             )
                         else:
                             kwargs["flow_v"] = None
-                    kwargs["suc"] = ccp.State(
+                    kwargs["suc"] = state_inputs(
                         p=Q_(
                             float(
                                 st.session_state[
@@ -871,7 +849,7 @@ def main():
                             default_components,
                         ),
                     )
-                    kwargs["disch"] = ccp.State(
+                    kwargs["disch"] = state_inputs(
                         p=Q_(
                             float(
                                 st.session_state[
@@ -1079,63 +1057,61 @@ def main():
                             "data_sheet_units"
                         ],
                     )
-                    time.sleep(0.1)
-                    progress_value += 2
-                    progress_bar.progress(
-                        progress_value, text="Calculating test points..."
+                    kwargs["speed"] = Q_(
+                        float(st.session_state[f"speed_{section}_point_{i}"]),
+                        parameters_map["speed"][section]["test_units"],
                     )
                     if section == "section_1":
-                        first_section_test_points.append(
-                            PointFirstSection(
-                                speed=Q_(
-                                    float(
-                                        st.session_state[f"speed_section_1_point_{i}"]
-                                    ),
-                                    parameters_map["speed"][section]["test_units"],
-                                ),
-                                oil_flow_journal_bearing_de=Q_(31.515, "l/min"),
-                                oil_flow_journal_bearing_nde=Q_(22.67, "l/min"),
-                                oil_flow_thrust_bearing_nde=Q_(126.729, "l/min"),
-                                oil_inlet_temperature=Q_(41.544, "degC"),
-                                oil_outlet_temperature_de=Q_(49.727, "degC"),
-                                oil_outlet_temperature_nde=Q_(50.621, "degC"),
-                                **kwargs,
-                            )
+                        kwargs.update(
+                            oil_flow_journal_bearing_de=Q_(31.515, "l/min"),
+                            oil_flow_journal_bearing_nde=Q_(22.67, "l/min"),
+                            oil_flow_thrust_bearing_nde=Q_(126.729, "l/min"),
+                            oil_inlet_temperature=Q_(41.544, "degC"),
+                            oil_outlet_temperature_de=Q_(49.727, "degC"),
+                            oil_outlet_temperature_nde=Q_(50.621, "degC"),
                         )
+                        first_section_test_points.append(kwargs)
                     elif section == "section_2":
-                        second_section_test_points.append(
-                            PointSecondSection(
-                                speed=Q_(
-                                    float(
-                                        st.session_state[f"speed_section_2_point_{i}"]
-                                    ),
-                                    parameters_map["speed"][section]["test_units"],
-                                ),
-                                **kwargs,
-                            )
-                        )
-        time.sleep(0.1)
-        progress_value += 10
-        progress_bar.progress(progress_value, text="Converting points...")
-        back_to_back = BackToBack(
-            guarantee_point_sec1=guarantee_point_section_1,
-            guarantee_point_sec2=guarantee_point_section_2,
-            test_points_sec1=first_section_test_points,
-            test_points_sec2=second_section_test_points,
-            reynolds_correction=reynolds_correction,
+                        second_section_test_points.append(kwargs)
+
+        # the compressor is calculated only if these inputs were not calculated
+        # before (in this or in another session)
+        inputs = normalize(
+            {
+                "guarantee_point_sec1": kwargs_guarantee_section_1,
+                "guarantee_point_sec2": kwargs_guarantee_section_2,
+                "test_points_sec1": first_section_test_points,
+                "test_points_sec2": second_section_test_points,
+                "reynolds_correction": reynolds_correction,
+            }
         )
-
+        # run in the background so that the server is not blocked
         if calculate_speed_button:
-            time.sleep(0.1)
-            progress_value += 10
-            progress_bar.progress(progress_value, text="Finding speed...")
-            back_to_back = back_to_back.calculate_speed_to_match_discharge_pressure()
-
-        time.sleep(0.1)
-        progress_bar.progress(100, text="Done!")
+            jobs.submit(
+                "back_to_back",
+                calculations.back_to_back_speed,
+                inputs,
+                text="Finding speed...",
+            )
+        else:
+            jobs.submit(
+                "back_to_back",
+                calculations.back_to_back,
+                inputs,
+                text="Converting points...",
+            )
 
-        # add back_to_back object to session state
-        st.session_state["back_to_back"] = back_to_back
+    job = jobs.get("back_to_back")
+    if job is not None and jobs.show_progress(job, key="back_to_back"):
+        jobs.pop("back_to_back")
+        if job.status == "done":
+            # add back_to_back object to session state
+            st.session_state["back_to_back"] = job.result()
+        elif job.status == "cancelled":
+            st.warning("Calculation cancelled.")
+        else:
+            st.error("Calculation failed.")
+            st.exception(job.exception())
 
     # if back_to_back is not defined, pickle the saved file
     if (
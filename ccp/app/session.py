@@ -0,0 +1,186 @@
+"""Compressors stored in the .ccp session files of the app.
+
+Each compressor in the session is saved as two files in the zip:
+
+- {key}.toml: the inputs (guarantee and test points), as written by the
+  compressor _dict_to_save method.
+- {key}.parquet: the calculated compressor (guarantee, test, rotor and flange
+  points), stored as a table with one row per point. The file metadata has a
+  hash of the inputs file, the ccp version and the configuration used in the
+  calculation.
+
+When the session is loaded and the hash matches, the compressor is created
+directly from the table, without converting the test points again. Otherwise
+(files saved with other versions of ccp, or without the results), the
+compressor is calculated from the inputs.
+"""
+
+import hashlib
+import io
+import json
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import toml
+
+import ccp
+from ccp.compressor import (
+    Point1Sec,
+    PointFirstSection,
+    PointSecondSection,
+)
+from ccp.point import _results_from_frame, _results_to_frame
+
+SESSION_FORMAT_VERSION = 1
+
+_point_classes = {
+    cls.__name__: cls
+    for cls in [ccp.Point, Point1Sec, PointFirstSection, PointSecondSection]
+}
+
+
+def inputs_hash(inputs):
+    """Hash of the compressor inputs and of everything that affects the results.
+
+    Parameters
+    ----------
+    inputs : str
+        Content of the inputs toml file.
+
+    Returns
+    -------
+    hash : str
+        Hexadecimal sha256 hash.
+    """
+    content = {
+        "inputs": inputs,
+        "EOS": ccp.config.EOS,
+        "polytropic_method": ccp.config.POLYTROPIC_METHOD,
+        "warm_start": ccp.config.WARM_START,
+        "mixing_rtol": ccp.config.MIXING_RTOL,
+        "version": ccp.__version__,
+    }
+    content = json.dumps(content, sort_keys=True)
+
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def results_to_frame(points):
+    """Create a table with one row per point (see ccp.point._results_to_frame).
+
+    Parameters
+    ----------
+    points : dict
+        Dict with the name of the group and the list of points.
+
+    Returns
+    -------
+    table : pandas.DataFrame
+        Table with the points, with the group and the index of each point.
+    units : dict
+        Units of each column.
+    """
+    frames = []
+    units = {}
+    for group, point_list in points.items():
+        frame, units = _results_to_frame(point_list, units)
+        frame.insert(0, "group", group)
+        frame.insert(1, "index", range(len(point_list)))
+        frames.append(frame)
+
+    return pd.concat(frames, ignore_index=True), units
+
+
+def results_from_frame(table, units):
+    """Create the points from a table created by results_to_frame.
+
+    Parameters
+    ----------
+    table : pandas.DataFrame
+        Table with the points.
+    units : dict
+        Units of each column.
+
+    Returns
+    -------
+    points : dict
+        Dict with the name of the group and the list of points.
+    """
+    return {
+        group: _results_from_frame(
+            group_table.drop(columns=["group", "index"]), units, _point_classes
+        )
+        for group, group_table in table.groupby("group", sort=False)
+    }
+
+
+def save_compressor(zip_file, key, compressor):
+    """Save the compressor inputs and results to the session zip file.
+
+    Parameters
+    ----------
+    zip_file : zipfile.ZipFile
+        Session file opened for writing.
+    key : str
+        Key of the compressor in the session state.
+    compressor : ccp.compressor.StraightThrough, ccp.compressor.BackToBack
+        Compressor to be saved.
+    """
+    inputs = toml.dumps(compressor._dict_to_save())
+    zip_file.writestr(f"{key}.toml", inputs)
+
+    points, values = compressor._results_to_save()
+    frame, units = results_to_frame(points)
+    metadata = {
+        "format": SESSION_FORMAT_VERSION,
+        "compressor": compressor.__class__.__name__,
+        "hash": inputs_hash(inputs),
+        "version": ccp.__version__,
+        "units": units,
+        "values": values,
+    }
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    table = table.replace_schema_metadata(
+        {**table.schema.metadata, b"ccp": json.dumps(metadata).encode()}
+    )
+    buffer = io.BytesIO()
+    pq.write_table(table, buffer)
+    zip_file.writestr(f"{key}.parquet", buffer.getvalue())
+
+
+def load_compressor(zip_file, key, cls):
+    """Load a compressor from the session zip file.
+
+    The compressor is created from the saved results if they were calculated
+    with the same inputs, ccp version and configuration. Otherwise it is
+    calculated from the inputs.
+
+    Parameters
+    ----------
+    zip_file : zipfile.ZipFile
+        Session file opened for reading.
+    key : str
+        Key of the compressor in the session state.
+    cls : type
+        ccp.compressor.StraightThrough or ccp.compressor.BackToBack.
+
+    Returns
+    -------
+    compressor : ccp.compressor.StraightThrough, ccp.compressor.BackToBack
+        The compressor.
+    """
+    inputs = zip_file.read(f"{key}.toml").decode("utf-8")
+
+    if f"{key}.parquet" in zip_file.namelist():
+        table = pq.read_table(io.BytesIO(zip_file.read(f"{key}.parquet")))
+        metadata = json.loads(table.schema.metadata[b"ccp"])
+        if (
+            metadata["format"] <= SESSION_FORMAT_VERSION
+            and metadata["compressor"] == cls.__name__
+            and metadata["hash"] == inputs_hash(inputs)
+        ):
+            points = results_from_frame(table.to_pandas(), metadata["units"])
+            return cls._from_results(points, metadata["values"])
+
+    return cls.load(io.StringIO(inputs))
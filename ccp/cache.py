@@ -0,0 +1,197 @@
+"""Module with a persistent disk cache for converted impellers.
+
+Converting an impeller map to a new suction condition (see
+:meth:`ccp.Impeller.convert_from`) requires a large number of EOS calls.
+The :class:`ImpellerCache` stores the converted impellers on disk, keyed by a
+hash of everything that affects the result, so that the same conversion is
+only calculated once.
+
+The cache is enabled by setting it in the ccp configuration:
+
+```{code-block} python
+import ccp
+
+ccp.config.IMPELLER_CACHE = ccp.ImpellerCache("path/to/cache_dir")
+```
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+import ccp.config
+from ccp.config.units import Q_
+
+
+class ImpellerCache:
+    """Content-addressed disk cache for converted impellers.
+
+    Each entry is a pickled :class:`ccp.Impeller` stored in a file named after
+    the sha256 hash of the original impeller points, the target suction state,
+    the conversion arguments, the EOS, the polytropic method and the ccp
+    version. When the cache size goes above max_size, the least recently used
+    entries are removed.
+
+    Parameters
+    ----------
+    directory : str or pathlib.Path
+        Directory where the cache files are stored. It is created if it does not
+        exist.
+    max_size : int, str, pint.Quantity, optional
+        Maximum size of the cache. If an int is given the value is in bytes.
+        Strings such as "500 MB" are also accepted.
+        Default is "1 GB".
+
+    Examples
+    --------
+    >>> import ccp
+    >>> import tempfile
+    >>> cache = ccp.ImpellerCache(tempfile.mkdtemp(), max_size="100 MB")
+    >>> cache.max_size
+    100000000
+    """
+
+    suffix = ".pkl"
+
+    def __init__(self, directory, max_size="1 GB"):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        if isinstance(max_size, str):
+            max_size = Q_(max_size)
+        if hasattr(max_size, "to"):
+            max_size = max_size.to("byte").m
+        self.max_size = int(max_size)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(directory={str(self.directory)!r}, "
+            f"max_size={self.max_size})"
+        )
+
+    def __len__(self):
+        return len(self._entries())
+
+    def __contains__(self, key):
+        return self._path(key).is_file()
+
+    @staticmethod
+    def key(original_impeller, suc, find="speed", speed=None):
+        """Hash of the inputs of an impeller conversion.
+
+        Parameters
+        ----------
+        original_impeller : ccp.Impeller
+            The original impeller.
+        suc : ccp.State
+            The new suction condition.
+        find : str, optional
+            Conversion method passed to convert_from.
+        speed : float, pint.Quantity, str, optional
+            Speed passed to convert_from.
+
+        Returns
+        -------
+        key : str
+            Hexadecimal sha256 hash.
+        """
+        content = {
+            "points": [p._dict_to_save() for p in original_impeller.points],
+            "suc": {
+                "p": repr(float(suc.p().m)),
+                "T": repr(float(suc.T().m)),
+                "fluid": {k: repr(float(v)) for k, v in sorted(suc.fluid.items())},
+            },
+            "find": find,
+            "speed": str(speed),
+            "EOS": ccp.config.EOS,
+            "polytropic_method": ccp.config.POLYTROPIC_METHOD,
+            "warm_start": ccp.config.WARM_START,
+            "version": ccp.__version__,
+        }
+        content = json.dumps(content, sort_keys=True, default=str)
+
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def get(self, key):
+        """Get an impeller from the cache.
+
+        Parameters
+        ----------
+        key : str
+            Key obtained with ImpellerCache.key().
+
+        Returns
+        -------
+        impeller : ccp.Impeller or None
+            The cached impeller or None if the key is not in the cache.
+        """
+        path = self._path(key)
+        try:
+            with open(path, mode="rb") as f:
+                impeller = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+        # update access time used for the lru eviction
+        os.utime(path)
+
+        return impeller
+
+    def put(self, key, impeller):
+        """Store an impeller in the cache.
+
+        Parameters
+        ----------
+        key : str
+            Key obtained with ImpellerCache.key().
+        impeller : ccp.Impeller
+            Impeller to be stored.
+        """
+        # write to a temporary file first so that other processes never read
+        # a partially written entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, mode="wb") as f:
+                pickle.dump(impeller, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        self.evict()
+
+    @property
+    def size(self):
+        """Current size of the cache in bytes."""
+        return sum(path.stat().st_size for path in self._entries())
+
+    def evict(self):
+        """Remove least recently used entries until size <= max_size."""
+        entries = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        for path in self._entries():
+            path.unlink(missing_ok=True)
+
+    def _path(self, key):
+        return self.directory / f"{key}{self.suffix}"
+
+    def _entries(self):
+        return list(self.directory.glob(f"*{self.suffix}"))
@@ -1,16 +1,28 @@
 """Module to define compressors with 1 or 2 sections."""
 
+import multiprocessing
+import warnings
 from copy import copy
 
 import ccp
 import toml
+from ccp import parallel
 from ccp.impeller import Impeller
-from ccp.point import Point, flow_from_phi
+from ccp.point import (
+    Point,
+    PointTable,
+    flow_from_phi,
+    _results_settings,
+    _use_saved_results,
+)
 from ccp.state import State
 from ccp.config.units import check_units
+from ccp.config.utilities import lazy_import
 from ccp import Q_
 import numpy as np
-from scipy.optimize import newton
+from ccp.profiling import fixed_point, newton
+
+pd = lazy_import("pandas")
 
 
 class Point1Sec(Point):
@@ -115,9 +127,9 @@ class Point1Sec(Point):
         self.oil_outlet_temperature_de = oil_outlet_temperature_de
         self.oil_outlet_temperature_nde = oil_outlet_temperature_nde
 
-    def _dict_to_save(self):
+    def _dict_to_save(self, results=False):
         """Returns a dict that will be saved to a toml file."""
-        dict_to_save = super()._dict_to_save()
+        dict_to_save = super()._dict_to_save(results=results)
         for param in [
             "balance_line_flow_m",
             "seal_gas_flow_m",
@@ -136,11 +148,32 @@ class Point1Sec(Point):
 
 
 class StraightThrough(Impeller):
-    """Straight Through compressor"""
+    """Straight Through compressor.
+
+    Parameters
+    ----------
+    guarantee_point : ccp.Point
+        Guarantee point.
+    test_points : list
+        List of ccp.compressor.Point1Sec with the test points.
+    speed : float, pint.Quantity, optional
+        Speed (rad/s). Default is the guarantee point speed.
+    reynolds_correction : bool, optional
+        If True, the Reynolds correction is applied to the conversion.
+    callback : callable, optional
+        Function called as callback(done, total) after each test point is
+        calculated in the rotor and in the specified conditions. An exception
+        raised by the callback interrupts the calculation.
+    """
 
     @check_units
     def __init__(
-        self, guarantee_point, test_points, speed=None, reynolds_correction=False
+        self,
+        guarantee_point,
+        test_points,
+        speed=None,
+        reynolds_correction=False,
+        callback=None,
     ):
         self.guarantee_point = guarantee_point
         self.test_points = test_points
@@ -152,134 +185,68 @@ class StraightThrough(Impeller):
         # points for test flange conditions
         self.points_flange_t = test_points
 
+        done = 0
+        total = 2 * len(test_points)
+
         # calculate rotor condition
-        test_points_rotor = []
+        self.points_rotor_t = []
         self.k_end_seal = []  # list with seal constants
         for point in test_points:
-            ms1f = point.flow_m
-            mbal = point.balance_line_flow_m
-            mseal = point.seal_gas_flow_m
-            if mbal == None:
-                mbal = Q_(0, "kg/s")
-            if mseal == None:
-                mseal = Q_(0, "kg/s")
-
-            mend = mbal - (0.95 * mseal) / 2
-            ms1r = ms1f + mend
-
-            Ts1f = point.suc.T()
-            # dummy state to calculate Tend
-            dummy_state = copy(point.disch)
-            dummy_state.update(p=point.suc.p(), h=dummy_state.h())
-            Tend = dummy_state.T()
-            Tseal = point.seal_gas_temperature
-            if Tseal == None:
-                Tseal = Q_(0, "kelvin")
-            Ts1r = (ms1f * Ts1f + mend * Tend + 0.95 * mseal * Tseal) / (
-                ms1f + mend + 0.95 * mseal
-            )
-            point.Ts1r = Ts1r
-            k_end = k_seal(flow_m=mend, state_up=point.disch, state_down=point.suc)
+            point_rotor, k_end = _test_point_rotor(point)
+            self.points_rotor_t.append(point_rotor)
             self.k_end_seal.append(k_end)
-            suc_rotor = State(p=point.suc.p(), T=point.Ts1r, fluid=point.suc.fluid)
-            test_points_rotor.append(
-                Point(
-                    suc=suc_rotor,
-                    disch=point.disch,
-                    flow_m=ms1r,
-                    speed=point.speed,
-                    b=point.b,
-                    D=point.D,
-                    surface_roughness=point.surface_roughness,
-                    casing_area=point.casing_area,
-                    casing_temperature=point.casing_temperature,
-                    ambient_temperature=point.ambient_temperature,
-                    convection_constant=point.convection_constant,
-                )
-            )
-
-        self.points_rotor_t = test_points_rotor
+            done += 1
+            if callback is not None:
+                callback(done, total)
 
         # convert points_rotor_t to points_rotor_sp
         self.points_rotor_sp = []
         self.points_flange_sp = []
-        # calculate ms1r for the guarantee point
         for point, k in zip(self.points_rotor_t, self.k_end_seal):
-            error = 1
-            # initial estimate of Ts1r_sp with Ts1f_sp
-            Ts1r_sp = guarantee_point.suc.T()
-            initial_suc = copy(guarantee_point.suc)
-            i = 0
-            while error > 1e-5 and i < 5:
-                initial_suc.update(p=initial_suc.p(), T=Ts1r_sp)
-                initial_point_rotor_sp = Point.convert_from(
-                    original_point=point,
-                    suc=initial_suc,
-                    speed=self.speed,
-                    find="volume_ratio",
-                    reynolds_correction=self.reynolds_correction,
-                )
-                ms1r_sp = initial_point_rotor_sp.flow_m
-                mend_sp = flow_m_seal(
-                    k,
-                    state_up=initial_point_rotor_sp.disch,
-                    state_down=initial_point_rotor_sp.suc,
-                )
-                ms1f_sp = ms1r_sp - mend_sp
-                Ts1f_sp = guarantee_point.suc.T()
-                # dummy state to calculate Tend
-                dummy_state = copy(initial_point_rotor_sp.disch)
-                dummy_state.update(p=initial_point_rotor_sp.suc.p(), h=dummy_state.h())
-                Tend_sp = dummy_state.T()
-                Ts1r_sp_new = (ms1f_sp * Ts1f_sp + mend_sp * Tend_sp) / (
-                    ms1f_sp + mend_sp
-                )
-                i += 1
-                error = abs(Ts1r_sp_new.m - Ts1r_sp.m)
-                Ts1r_sp = Ts1r_sp_new
-            self.points_rotor_sp.append(initial_point_rotor_sp)
-            self.points_flange_sp.append(
-                Point(
-                    suc=guarantee_point.suc,
-                    disch=initial_point_rotor_sp.disch,
-                    flow_m=ms1f_sp,
-                    speed=speed,
-                    b=guarantee_point.b,
-                    D=guarantee_point.D,
-                    surface_roughness=guarantee_point.surface_roughness,
-                    casing_area=guarantee_point.casing_area,
-                    casing_temperature=guarantee_point.casing_temperature,
-                    ambient_temperature=guarantee_point.ambient_temperature,
-                    convection_constant=guarantee_point.convection_constant,
-                )
+            point_rotor_sp, point_flange_sp = _convert_rotor_point(
+                (point, k, guarantee_point, speed, reynolds_correction)
             )
+            self.points_rotor_sp.append(point_rotor_sp)
+            self.points_flange_sp.append(point_flange_sp)
+            done += 1
+            if callback is not None:
+                callback(done, total)
 
         super().__init__(self.points_flange_sp)
 
-    def _dict_to_save(self):
+    def _dict_to_save(self, results=False):
         dict_to_save = {
             "reynolds_correction": self.reynolds_correction,
             "speed": str(self.speed),
         }
         # add points to file
-        dict_to_save["guarantee_point"] = self.guarantee_point._dict_to_save()
+        dict_to_save["guarantee_point"] = self.guarantee_point._dict_to_save(
+            results=results
+        )
 
         dict_to_save["test_points"] = {
-            f"Point{i}": point._dict_to_save()
+            f"Point{i}": point._dict_to_save(results=results)
             for i, point in enumerate(self.test_points)
         }
+        if results:
+            dict_to_save["results"] = _compressor_results_to_save(self)
+
         return dict_to_save
 
-    def save(self, file):
+    def save(self, file, results=False):
         """Save compressor as .toml file.
 
         Parameters
         ----------
         file : str
             File name.
+        results : bool, optional
+            If True, the calculated compressor (rotor and flange points) is also
+            saved, and the compressor is loaded without converting the test
+            points again. Default is False.
         """
         with open(file, mode="w") as f:
-            toml.dump(self._dict_to_save(), f)
+            toml.dump(self._dict_to_save(results=results), f)
 
     @classmethod
     def load(cls, file):
@@ -291,19 +258,69 @@ class StraightThrough(Impeller):
             File name.
         """
         parameters = toml.load(file)
+        results = parameters.pop("results", None)
         kwargs = {"speed": Q_(parameters.pop("speed", None))}
         # guarantee_point, test_points, speed=None, reynolds_correction=False
 
         for k, v in parameters.items():
             if "guarantee_point" in k:
-                kwargs[k] = Point(**Point._dict_from_load(v))
+                kwargs[k] = Point._from_load(v)
             elif "test_points" in k:
-                kwargs[k] = [Point1Sec(**Point._dict_from_load(v)) for v in v.values()]
+                kwargs[k] = [Point1Sec._from_load(v) for v in v.values()]
             else:
                 kwargs[k] = v
 
+        if results is not None:
+            return _compressor_from_load(cls, kwargs, results)
+
         return cls(**kwargs)
 
+    def _results_to_save(self):
+        """Returns the calculated points and values used by _from_results.
+
+        Returns
+        -------
+        points : dict
+            Dict with the lists of points (guarantee point, test points, rotor
+            and flange points).
+        values : dict
+            Dict with the other attributes as strings.
+        """
+        points = {
+            "guarantee_point": [self.guarantee_point],
+            "test_points": self.test_points,
+            "points_rotor_t": self.points_rotor_t,
+            "points_rotor_sp": self.points_rotor_sp,
+            "points_flange_sp": self.points_flange_sp,
+        }
+        values = {
+            "speed": str(self.speed),
+            "reynolds_correction": self.reynolds_correction,
+            "k_end_seal": [str(k) for k in self.k_end_seal],
+        }
+
+        return points, values
+
+    @classmethod
+    def _from_results(cls, points, values):
+        """Create the compressor from the results returned by _results_to_save.
+
+        The conversion of the test points is not calculated again.
+        """
+        compressor = cls.__new__(cls)
+        compressor.guarantee_point = points["guarantee_point"][0]
+        compressor.test_points = points["test_points"]
+        compressor.points_flange_t = compressor.test_points
+        compressor.points_rotor_t = points["points_rotor_t"]
+        compressor.points_rotor_sp = points["points_rotor_sp"]
+        compressor.points_flange_sp = points["points_flange_sp"]
+        compressor.speed = Q_(values["speed"])
+        compressor.reynolds_correction = values["reynolds_correction"]
+        compressor.k_end_seal = [Q_(k) for k in values["k_end_seal"]]
+        Impeller.__init__(compressor, compressor.points_flange_sp)
+
+        return compressor
+
     def __eq__(self, other):
         if isinstance(other, self.__class__):
             if (
@@ -317,8 +334,15 @@ class StraightThrough(Impeller):
                     if test_points_self == test_points_other:
                         return True
 
-    def calculate_speed_to_match_discharge_pressure(self):
-        """Calculate the speed to match the discharge pressure of the guarantee point."""
+    def calculate_speed_to_match_discharge_pressure(self, callback=None):
+        """Calculate the speed to match the discharge pressure of the guarantee point.
+
+        Parameters
+        ----------
+        callback : callable, optional
+            Function passed to each StraightThrough created during the speed
+            iterations, called as callback(done, total).
+        """
 
         def calculate_disch_pressure_delta(x):
             compressor = StraightThrough(
@@ -326,6 +350,7 @@ class StraightThrough(Impeller):
                 test_points=self.test_points,
                 speed=x,
                 reynolds_correction=self.reynolds_correction,
+                callback=callback,
             )
 
             point = compressor.point(flow_m=self.guarantee_point.flow_m, speed=x)
@@ -338,8 +363,124 @@ class StraightThrough(Impeller):
             test_points=self.test_points,
             speed=new_speed,
             reynolds_correction=self.reynolds_correction,
+            callback=callback,
         )
 
+    @classmethod
+    def sweep(
+        cls,
+        test_points,
+        guarantee_points,
+        speed=None,
+        reynolds_correction=False,
+        processes=None,
+        backend=None,
+        callback=None,
+    ):
+        """Calculate the compressor for several guarantee points (what-if study).
+
+        The rotor condition of the test points (seal constants and mixing
+        temperatures) depends only on the test points, so it is calculated once.
+        The conversions of each test point to each guarantee point are then
+        calculated in a single pool.
+
+        Parameters
+        ----------
+        test_points : list
+            List of ccp.compressor.Point1Sec with the test points.
+        guarantee_points : list
+            List of ccp.Point with the guarantee points (e.g. different suction
+            conditions and compositions).
+        speed : float, pint.Quantity, optional
+            Speed (rad/s) used for all guarantee points.
+            Default is the speed of each guarantee point.
+        reynolds_correction : bool, optional
+            If True, the Reynolds correction is applied to the conversion.
+        processes : int, optional
+            Maximum number of workers. Default is the number of CPUs,
+            limited to the number of conversions.
+        backend : str, optional
+            Parallel backend, "process" or "thread".
+            Default is ccp.config.PARALLEL_BACKEND.
+        callback : callable, optional
+            Function called as callback(done, total) each time a test point
+            conversion is completed.
+
+        Returns
+        -------
+        results : pandas.DataFrame
+            Table with one row for each guarantee point, with the suction
+            conditions ("ps" (Pa), "Ts" (degK)), "flow_m" (kg/s) and "speed"
+            (rad/s) of the guarantee point, the results of the compressor at this
+            flow and speed ("pd" (Pa), "Td" (degK), "head" (J/kg), "eff",
+            "power" (W)) and the StraightThrough object ("compressor").
+        """
+        if speed is not None and not isinstance(speed, Q_):
+            speed = Q_(speed, "rad/s")
+
+        points_rotor_t = []
+        k_end_seal = []
+        for point in test_points:
+            point_rotor, k_end = _test_point_rotor(point)
+            points_rotor_t.append(point_rotor)
+            k_end_seal.append(k_end)
+
+        speeds = [gp.speed if speed is None else speed for gp in guarantee_points]
+        args = [
+            (point, k, guarantee_point, speed_, reynolds_correction)
+            for guarantee_point, speed_ in zip(guarantee_points, speeds)
+            for point, k in zip(points_rotor_t, k_end_seal)
+        ]
+        total = len(args)
+
+        if processes is None:
+            processes = multiprocessing.cpu_count()
+        processes = max(1, min(processes, total))
+        chunksize = max(1, total // (4 * processes))
+
+        converted = []
+        with parallel.pool(processes, backend) as pool:
+            for result in pool.imap(_convert_rotor_point, args, chunksize):
+                converted.append(result)
+                if callback is not None:
+                    callback(len(converted), total)
+
+        n = len(test_points)
+        rows = []
+        for i, (guarantee_point, speed_) in enumerate(zip(guarantee_points, speeds)):
+            points_rotor_sp, points_flange_sp = zip(*converted[i * n : (i + 1) * n])
+            compressor = cls._from_results(
+                {
+                    "guarantee_point": [guarantee_point],
+                    "test_points": test_points,
+                    "points_rotor_t": points_rotor_t,
+                    "points_rotor_sp": list(points_rotor_sp),
+                    "points_flange_sp": list(points_flange_sp),
+                },
+                {
+                    "speed": str(speed_),
+                    "reynolds_correction": reynolds_correction,
+                    "k_end_seal": [str(k) for k in k_end_seal],
+                },
+            )
+            point = compressor.point(flow_m=guarantee_point.flow_m, speed=speed_)
+            rows.append(
+                {
+                    "ps": guarantee_point.suc.p().to("Pa").m,
+                    "Ts": guarantee_point.suc.T().to("degK").m,
+                    "flow_m": guarantee_point.flow_m.to("kg/s").m,
+                    "speed": speed_.to("rad/s").m,
+                    "pd": point.disch.p().to("Pa").m,
+                    "Td": point.disch.T().to("degK").m,
+                    "head": point.head.to("J/kg").m,
+                    "eff": point.eff.m,
+                    "power": point.power.to("W").m,
+                    "compressor": compressor,
+                }
+            )
+
+        return pd.DataFrame(rows)
+
 
 class PointFirstSection(Point):
     """Point class for a compressor with 2 sections in a back-to-back configuration.
@@ -494,9 +635,9 @@ class PointFirstSection(Point):
             p=self.div_wall_downstream_state.p(), h=self.div_wall_upstream_state.h()
         )
 
-    def _dict_to_save(self):
+    def _dict_to_save(self, results=False):
         """Returns a dict that will be saved to a toml file."""
-        dict_to_save = super()._dict_to_save()
+        dict_to_save = super()._dict_to_save(results=results)
         parameters = [
             "balance_line_flow_m",
             "first_section_discharge_flow_m",
@@ -534,7 +675,28 @@ class PointSecondSection(Point1Sec):
 
 
 class BackToBack(Impeller):
-    """Back to Back compressor"""
+    """Back to Back compressor.
+
+    Parameters
+    ----------
+    guarantee_point_sec1, guarantee_point_sec2 : ccp.Point
+        Guarantee points of the first and second sections.
+    test_points_sec1 : list
+        List of ccp.compressor.PointFirstSection with the first section test
+        points.
+    test_points_sec2 : list
+        List of ccp.compressor.PointSecondSection with the second section test
+        points.
+    reynolds_correction : bool, optional
+        If True, the Reynolds correction is applied to the conversion.
+    speed : float, pint.Quantity, optional
+        Speed (rad/s). Default is the first section guarantee point speed.
+    callback : callable, optional
+        Function called as callback(done, total) after each test point is
+        converted to the specified conditions (seal flow and division wall
+        mixing loops). An exception raised by the callback interrupts the
+        calculation.
+    """
 
     @check_units
     def __init__(
@@ -545,6 +707,7 @@ class BackToBack(Impeller):
         test_points_sec2,
         reynolds_correction=False,
         speed=None,
+        callback=None,
     ):
         self.guarantee_point_sec1 = guarantee_point_sec1
         self.guarantee_point_sec2 = guarantee_point_sec2
@@ -753,6 +916,9 @@ class BackToBack(Impeller):
         self.points_rotor_sp_sec2 = []
         self.points_flange_sp_sec2 = []
 
+        done = 0
+        total = 2 * len(self.points_rotor_t_sec1) + len(self.points_rotor_t_sec2)
+
         # calculate rotor specified conditions for sec1
         self.points_rotor_sp_sec1 = []
         ms1f_sp_array = np.zeros(len(self.points_rotor_t_sec1), dtype=object)
@@ -793,26 +959,30 @@ class BackToBack(Impeller):
             vs1f_sp = guarantee_point_sec1.suc.v()
             dummy_suc = copy(guarantee_point_sec1.suc)
 
-            error = 1
-            dm = Q_(1, "kg/s")
-            ms1f_sp = qs1r_sp / vs1f_sp  # initial guess
-            while error > 0.00001:
+            def rotor_flow_v_delta(ms1f_sp):
+                ms1f_sp = Q_(ms1f_sp, "kg/s")
                 ms1r_sp = ms1f_sp + mend_sp
                 Ts1r_sp = (mend_sp * Tend_sp + ms1f_sp * Ts1f_sp) / ms1r_sp
                 dummy_suc.update(p=ps1r_sp, T=Ts1r_sp)
-                vs1r_sp = dummy_suc.v()
-                qs1r_sp_1 = ms1r_sp * vs1r_sp
-
-                fx = -qs1r_sp + qs1r_sp_1
-                ms1f_sp_new = ms1f_sp + dm
-                ms1r_sp_new = ms1f_sp_new + mend_sp
-                Ts1r_sp_new = (ms1f_sp_new * Ts1f_sp + mend_sp * Tend_sp) / ms1r_sp_new
-                dummy_suc.update(p=ps1r_sp, T=Ts1r_sp_new)
-                vs1r_sp_new = dummy_suc.v()
-                qs1r_sp_1_new = ms1r_sp_new * vs1r_sp_new
-                dfx = (qs1r_sp_1_new - qs1r_sp_1) / dm
-                ms1f_sp = ms1f_sp - (fx / dfx)
-                error = ((fx**2) ** 0.5).m
+                return (ms1r_sp * dummy_suc.v() - qs1r_sp).to("m³/s").m
+
+            # secant iterations, starting with the flange suction volume
+            ms1f_sp, result = newton(
+                rotor_flow_v_delta,
+                (qs1r_sp / vs1f_sp).to("kg/s").m,
+                tol=1e-12,
+                rtol=ccp.config.MIXING_RTOL,
+                maxiter=50,
+                full_output=True,
+                disp=False,
+            )
+            if not result.converged:
+                warnings.warn(
+                    f"Rotor suction flow for test point {i} did not converge "
+                    f"in {result.iterations} iterations."
+                )
+            ms1f_sp = Q_(ms1f_sp, "kg/s")
+            Ts1r_sp = (mend_sp * Tend_sp + ms1f_sp * Ts1f_sp) / (ms1f_sp + mend_sp)
 
             ms1f_sp_array[i] = ms1f_sp
 
@@ -829,6 +999,9 @@ class BackToBack(Impeller):
                 reynolds_correction=self.reynolds_correction,
             )
             self.points_rotor_sp_sec1.append(point_r_sp)
+            done += 1
+            if callback is not None:
+                callback(done, total)
         self.imp_rotor_sp_sec1 = Impeller(self.points_rotor_sp_sec1)
 
         # estimate rotor guarantee flow using fd conditions
@@ -876,6 +1049,9 @@ class BackToBack(Impeller):
                 D=point_r_sp.D,
             )
             self.points_flange_sp_sec2.append(point_sp)
+            done += 1
+            if callback is not None:
+                callback(done, total)
         # change points_flange power to real power calculated in rotor point
         for p_flange, p_rotor in zip(
             self.points_flange_sp_sec2, self.points_rotor_sp_sec2
@@ -938,7 +1114,28 @@ class BackToBack(Impeller):
                 self.points_flange_sp_sec1, self.points_rotor_sp_sec1
             ):
                 p_flange.power = p_rotor.power
+            done += 1
+            if callback is not None:
+                callback(done, total)
         self.imp_flange_sp_sec1 = Impeller(self.points_flange_sp_sec1)
+        self._calc_interpolation_tables()
+
+    def _calc_interpolation_tables(self):
+        """Calculate the tables used to interpolate Mach and Reynolds.
+
+        For each section, the phi, Mach and Reynolds of the test points are stored
+        as arrays sorted by phi, so that point_sec1 and point_sec2 do not need to
+        build them for each point.
+        """
+        self._interpolation_tables = {}
+        for sec in ["sec1", "sec2"]:
+            points = getattr(self, f"points_flange_t_{sec}")
+            table = {}
+            for attr in ["phi", "mach", "reynolds"]:
+                values, units = _magnitude([getattr(p, attr) for p in points])
+                table[attr] = Q_(values, units)
+            order = np.argsort(table["phi"].m, kind="stable")
+            self._interpolation_tables[sec] = {k: v[order] for k, v in table.items()}
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
@@ -969,34 +1166,45 @@ class BackToBack(Impeller):
                     ):
                         return True
 
-    def _dict_to_save(self):
+    def _dict_to_save(self, results=False):
         dict_to_save = {
             "reynolds_correction": self.reynolds_correction,
             "speed": str(self.speed),
         }
         # add points to file
-        dict_to_save["guarantee_point_sec1"] = self.guarantee_point_sec1._dict_to_save()
-        dict_to_save["guarantee_point_sec2"] = self.guarantee_point_sec2._dict_to_save()
+        dict_to_save["guarantee_point_sec1"] = self.guarantee_point_sec1._dict_to_save(
+            results=results
+        )
+        dict_to_save["guarantee_point_sec2"] = self.guarantee_point_sec2._dict_to_save(
+            results=results
+        )
         dict_to_save["test_points_sec1"] = {
-            f"Point{i}": point._dict_to_save()
+            f"Point{i}": point._dict_to_save(results=results)
             for i, point in enumerate(self.test_points_sec1)
         }
         dict_to_save["test_points_sec2"] = {
-            f"Point{i}": point._dict_to_save()
+            f"Point{i}": point._dict_to_save(results=results)
             for i, point in enumerate(self.test_points_sec2)
         }
+        if results:
+            dict_to_save["results"] = _compressor_results_to_save(self)
+
         return dict_to_save
 
-    def save(self, file):
+    def save(self, file, results=False):
         """Save compressor as .toml file.
 
         Parameters
         ----------
         file : str
             File name.
+        results : bool, optional
+            If True, the calculated compressor (rotor and flange points) is also
+            saved, and the compressor is loaded without converting the test
+            points again. Default is False.
         """
         with open(file, mode="w") as f:
-            toml.dump(self._dict_to_save(), f)
+            toml.dump(self._dict_to_save(results=results), f)
 
     @classmethod
     def load(cls, file):
@@ -1008,116 +1216,232 @@ class BackToBack(Impeller):
             File name.
         """
         parameters = toml.load(file)
+        results = parameters.pop("results", None)
         kwargs = {"speed": Q_(parameters.pop("speed", None))}
 
         for k, v in parameters.items():
             if "guarantee_point" in k:
-                kwargs[k] = Point(**Point._dict_from_load(v))
+                kwargs[k] = Point._from_load(v)
             elif "test_points_sec1" in k:
-                kwargs[k] = [
-                    PointFirstSection(**Point._dict_from_load(v)) for v in v.values()
-                ]
+                kwargs[k] = [PointFirstSection._from_load(v) for v in v.values()]
             elif "test_points_sec2" in k:
-                kwargs[k] = [
-                    PointSecondSection(**Point._dict_from_load(v)) for v in v.values()
-                ]
+                kwargs[k] = [PointSecondSection._from_load(v) for v in v.values()]
             else:
                 kwargs[k] = v
 
+        if results is not None:
+            return _compressor_from_load(cls, kwargs, results)
+
         return cls(**kwargs)
 
-    def point_sec1(self, *args, **kwargs):
-        # calculate flange point from impeller object
-        p_sec1 = self.imp_flange_sp_sec1.point(*args, **kwargs)
+    def _results_to_save(self):
+        """Returns the calculated points and values used by _from_results.
 
-        # calculate rotor flow
-        ps2f_sp = p_sec1.disch.p() - (
-            self.guarantee_point_sec1.disch.p() - self.guarantee_point_sec2.suc.p()
-        )
-        suc2f_sp = State(
-            p=ps2f_sp,
-            T=self.guarantee_point_sec2.suc.T(),
-            fluid=self.guarantee_point_sec2.suc.fluid,
-        )
-        end_seal_flow_m_sp = flow_m_seal(
-            k_seal=self.k_end_seal_mean,
-            state_up=suc2f_sp,
-            state_down=p_sec1.suc,
-        )
-        ms1r_sp = p_sec1.flow_m + end_seal_flow_m_sp
+        Returns
+        -------
+        points : dict
+            Dict with the lists of points (guarantee points, test points, rotor
+            and flange points for each section).
+        values : dict
+            Dict with the other attributes as strings.
+        """
+        points = {
+            "guarantee_point_sec1": [self.guarantee_point_sec1],
+            "guarantee_point_sec2": [self.guarantee_point_sec2],
+            "test_points_sec1": self.test_points_sec1,
+            "test_points_sec2": self.test_points_sec2,
+        }
+        for name in ["points_rotor_t", "points_rotor_sp", "points_flange_sp"]:
+            for sec in ["sec1", "sec2"]:
+                points[f"{name}_{sec}"] = list(getattr(self, f"{name}_{sec}"))
+        values = {
+            "speed": str(self.speed),
+            "reynolds_correction": self.reynolds_correction,
+            "k_end_seal": [str(k) for k in self.k_end_seal],
+            "k_div_wall": [str(k) for k in self.k_div_wall],
+            "k_end_seal_mean": str(self.k_end_seal_mean),
+            "k_div_wall_mean": str(self.k_div_wall_mean),
+        }
 
-        # calculate 'real' power from rotor conditions
-        p_sec1_rotor = self.imp_rotor_sp_sec1.point(flow_m=ms1r_sp, speed=p_sec1.speed)
-        p_sec1.power = p_sec1_rotor.power
-
-        # set mach number and mach_diff
-        mach_interpolation = parameter_interpolation(
-            p_sec1.phi,
-            [p.phi for p in self.points_flange_t_sec1],
-            [p.mach for p in self.points_flange_t_sec1],
-        )
-        p_sec1.mach = mach_interpolation
-        p_sec1.mach_diff = mach_interpolation - self.guarantee_point_sec1.mach
+        return points, values
 
-        # set reynolds number and reynolds_ratio
-        reynolds_interpolation = parameter_interpolation(
-            p_sec1.phi,
-            [p.phi for p in self.points_flange_t_sec1],
-            [p.reynolds for p in self.points_flange_t_sec1],
-        )
-        p_sec1.reynolds = reynolds_interpolation
-        p_sec1.reynolds_ratio = (
-            reynolds_interpolation / self.guarantee_point_sec1.reynolds
-        )
+    @classmethod
+    def _from_results(cls, points, values):
+        """Create the compressor from the results returned by _results_to_save.
 
-        # set new volume ratio ratio
-        p_sec1.volume_ratio_ratio = (
-            p_sec1.volume_ratio / self.guarantee_point_sec1.volume_ratio
-        )
+        The conversion of the test points is not calculated again.
+        """
+        compressor = cls.__new__(cls)
+        for name, point_list in points.items():
+            if name.startswith("guarantee_point"):
+                setattr(compressor, name, point_list[0])
+            elif name.startswith("points_rotor_t"):
+                setattr(compressor, name, _object_array(point_list))
+            else:
+                setattr(compressor, name, point_list)
+        compressor.points_flange_t_sec1 = compressor.test_points_sec1
+        compressor.points_flange_t_sec2 = compressor.test_points_sec2
+        compressor.speed = Q_(values["speed"])
+        compressor.reynolds_correction = values["reynolds_correction"]
+        for name in ["k_end_seal", "k_div_wall"]:
+            setattr(compressor, name, _object_array([Q_(k) for k in values[name]]))
+        for name in ["k_end_seal_mean", "k_div_wall_mean"]:
+            setattr(compressor, name, Q_(values[name]))
+        for name in ["rotor_sp_sec1", "flange_sp_sec2", "flange_sp_sec1"]:
+            setattr(compressor, f"imp_{name}", Impeller(points[f"points_{name}"]))
+        compressor._calc_interpolation_tables()
+
+        return compressor
+
+    def point_sec1(self, *args, **kwargs):
+        # calculate flange point from impeller object
+        p_sec1 = self.imp_flange_sp_sec1.point(*args, **kwargs)
+        self._calc_points_sec1([p_sec1])
 
         return p_sec1
 
     def point_sec2(self, *args, **kwargs):
         # calculate flange point from impeller object
         p_sec2 = self.imp_flange_sp_sec2.point(*args, **kwargs)
+        self._calc_points_sec2([p_sec2])
 
-        # calculate 'real' power from rotor conditions
-        end_seal_flow_m_sp = flow_m_seal(
-            k_seal=self.k_end_seal_mean,
-            state_up=p_sec2.suc,
-            state_down=self.guarantee_point_sec1.suc,
+        return p_sec2
+
+    @check_units
+    def point_sec1_many(self, flow_v=None, flow_m=None, speed=None):
+        """Calculate several points of the first section with the same speed.
+
+        This is equivalent to calling point_sec1 for each flow, but the flange and
+        rotor curves are interpolated once for the whole sweep and the Mach and
+        Reynolds interpolations are done for all points at the same time.
+
+        Parameters
+        ----------
+        flow_v : pint.Quantity, array
+            Volumetric flows (m³/s).
+        flow_m : pint.Quantity, array
+            Mass flows (kg/s).
+        speed : pint.Quantity, float
+            Speed (rad/s).
+
+        Returns
+        -------
+        points : ccp.PointTable
+            Points of the first section, in the same order as the flows.
+        """
+        points = self.imp_flange_sp_sec1.point_many(
+            flow_v=flow_v, flow_m=flow_m, speed=speed
         )
-        ms2r_sp = p_sec2.flow_m - end_seal_flow_m_sp
-        p_sec2.power = ms2r_sp * p_sec2.head / p_sec2.eff
-
-        # set mach number and mach_diff
-        mach_interpolation = parameter_interpolation(
-            p_sec2.phi,
-            [p.phi for p in self.points_flange_t_sec2],
-            [p.mach for p in self.points_flange_t_sec2],
+        self._calc_points_sec1(points.points)
+
+        return PointTable(points.points)
+
+    @check_units
+    def point_sec2_many(self, flow_v=None, flow_m=None, speed=None):
+        """Calculate several points of the second section with the same speed.
+
+        This is equivalent to calling point_sec2 for each flow, but the flange
+        curve is interpolated once for the whole sweep and the Mach and Reynolds
+        interpolations are done for all points at the same time.
+
+        Parameters
+        ----------
+        flow_v : pint.Quantity, array
+            Volumetric flows (m³/s).
+        flow_m : pint.Quantity, array
+            Mass flows (kg/s).
+        speed : pint.Quantity, float
+            Speed (rad/s).
+
+        Returns
+        -------
+        points : ccp.PointTable
+            Points of the second section, in the same order as the flows.
+        """
+        points = self.imp_flange_sp_sec2.point_many(
+            flow_v=flow_v, flow_m=flow_m, speed=speed
         )
-        p_sec2.mach = mach_interpolation
-        p_sec2.mach_diff = mach_interpolation - self.guarantee_point_sec2.mach
+        self._calc_points_sec2(points.points)
 
-        # set reynolds number and reynolds_ratio
-        reynolds_interpolation = parameter_interpolation(
-            p_sec2.phi,
-            [p.phi for p in self.points_flange_t_sec2],
-            [p.reynolds for p in self.points_flange_t_sec2],
+        return PointTable(points.points)
+
+    def _calc_points_sec1(self, points):
+        """Set rotor power, Mach, Reynolds and ratios of first section points."""
+        # calculate rotor flow
+        delta_p = (
+            self.guarantee_point_sec1.disch.p() - self.guarantee_point_sec2.suc.p()
         )
-        p_sec2.reynolds = reynolds_interpolation
-        p_sec2.reynolds_ratio = (
-            reynolds_interpolation / self.guarantee_point_sec2.reynolds
+        end_seal_flow_m_sp = []
+        for p_sec1 in points:
+            suc2f_sp = State(
+                p=p_sec1.disch.p() - delta_p,
+                T=self.guarantee_point_sec2.suc.T(),
+                fluid=self.guarantee_point_sec2.suc.fluid,
+            )
+            end_seal_flow_m_sp.append(
+                flow_m_seal(
+                    k_seal=self.k_end_seal_mean,
+                    state_up=suc2f_sp,
+                    state_down=p_sec1.suc,
+                ).m
+            )
+        flow_m = Q_([p.flow_m.m for p in points], points[0].flow_m.units)
+        ms1r_sp = flow_m + Q_(end_seal_flow_m_sp, flow_m.units)
+
+        # calculate 'real' power from rotor conditions
+        points_rotor = self.imp_rotor_sp_sec1.point_many(
+            flow_m=ms1r_sp, speed=points[0].speed
         )
-        # set new volume ratio ratio
-        p_sec2.volume_ratio_ratio = (
-            p_sec2.volume_ratio / self.guarantee_point_sec2.volume_ratio
+        for p_sec1, p_sec1_rotor in zip(points, points_rotor):
+            p_sec1.power = p_sec1_rotor.power
+
+        self._set_interpolated_parameters(points, "sec1", self.guarantee_point_sec1)
+
+    def _calc_points_sec2(self, points):
+        """Set rotor power, Mach, Reynolds and ratios of second section points."""
+        # calculate 'real' power from rotor conditions
+        for p_sec2 in points:
+            end_seal_flow_m_sp = flow_m_seal(
+                k_seal=self.k_end_seal_mean,
+                state_up=p_sec2.suc,
+                state_down=self.guarantee_point_sec1.suc,
+            )
+            ms2r_sp = p_sec2.flow_m - end_seal_flow_m_sp
+            p_sec2.power = ms2r_sp * p_sec2.head / p_sec2.eff
+
+        self._set_interpolated_parameters(points, "sec2", self.guarantee_point_sec2)
+
+    def _set_interpolated_parameters(self, points, sec, guarantee_point):
+        table = self._interpolation_tables[sec]
+        phi = Q_([p.phi.m for p in points], points[0].phi.units)
+        mach_interpolation = parameter_interpolation(phi, table["phi"], table["mach"])
+        reynolds_interpolation = parameter_interpolation(
+            phi, table["phi"], table["reynolds"]
         )
 
-        return p_sec2
+        for point, mach, reynolds in zip(
+            points, mach_interpolation, reynolds_interpolation
+        ):
+            # set mach number and mach_diff
+            point.mach = mach
+            point.mach_diff = mach - guarantee_point.mach
+
+            # set reynolds number and reynolds_ratio
+            point.reynolds = reynolds
+            point.reynolds_ratio = reynolds / guarantee_point.reynolds
 
-    def calculate_speed_to_match_discharge_pressure(self):
-        """Calculate the speed to match the discharge pressure of the guarantee point."""
+            # set new volume ratio ratio
+            point.volume_ratio_ratio = point.volume_ratio / guarantee_point.volume_ratio
+
+    def calculate_speed_to_match_discharge_pressure(self, callback=None):
+        """Calculate the speed to match the discharge pressure of the guarantee point.
+
+        Parameters
+        ----------
+        callback : callable, optional
+            Function passed to each BackToBack created during the speed
+            iterations, called as callback(done, total).
+        """
 
         def calculate_disch_pressure_delta(x):
             compressor = BackToBack(
@@ -1127,6 +1451,7 @@ class BackToBack(Impeller):
                 test_points_sec2=self.test_points_sec2,
                 speed=x,
                 reynolds_correction=self.reynolds_correction,
+                callback=callback,
             )
 
             point = compressor.point_sec2(
@@ -1145,6 +1470,7 @@ class BackToBack(Impeller):
             test_points_sec2=self.test_points_sec2,
             speed=new_speed,
             reynolds_correction=self.reynolds_correction,
+            callback=callback,
         )
 
 
@@ -1215,36 +1541,255 @@ def flow_m_seal(k_seal, state_up, state_down):
     return flow_m_seal
 
 
+def _test_point_rotor(point):
+    """Rotor condition of a StraightThrough test point.
+
+    The suction temperature in the rotor (Ts1r) is calculated by mixing the
+    suction flow with the end seal leakage and the seal gas injection.
+
+    Returns
+    -------
+    point_rotor : ccp.Point
+        Test point in the rotor condition.
+    k_end : pint.Quantity
+        End seal constant (see k_seal).
+    """
+    ms1f = point.flow_m
+    mbal = point.balance_line_flow_m
+    mseal = point.seal_gas_flow_m
+    if mbal == None:
+        mbal = Q_(0, "kg/s")
+    if mseal == None:
+        mseal = Q_(0, "kg/s")
+
+    mend = mbal - (0.95 * mseal) / 2
+    ms1r = ms1f + mend
+
+    Ts1f = point.suc.T()
+    # dummy state to calculate Tend
+    dummy_state = copy(point.disch)
+    dummy_state.update(p=point.suc.p(), h=dummy_state.h())
+    Tend = dummy_state.T()
+    Tseal = point.seal_gas_temperature
+    if Tseal == None:
+        Tseal = Q_(0, "kelvin")
+    Ts1r = (ms1f * Ts1f + mend * Tend + 0.95 * mseal * Tseal) / (
+        ms1f + mend + 0.95 * mseal
+    )
+    point.Ts1r = Ts1r
+    k_end = k_seal(flow_m=mend, state_up=point.disch, state_down=point.suc)
+    suc_rotor = State(p=point.suc.p(), T=point.Ts1r, fluid=point.suc.fluid)
+    point_rotor = Point(
+        suc=suc_rotor,
+        disch=point.disch,
+        flow_m=ms1r,
+        speed=point.speed,
+        b=point.b,
+        D=point.D,
+        surface_roughness=point.surface_roughness,
+        casing_area=point.casing_area,
+        casing_temperature=point.casing_temperature,
+        ambient_temperature=point.ambient_temperature,
+        convection_constant=point.convection_constant,
+    )
+
+    return point_rotor, k_end
+
+
+def _convert_rotor_point(args):
+    """Convert a StraightThrough rotor test point to the guarantee conditions.
+
+    The rotor suction temperature in the guarantee conditions is calculated
+    iteratively with the end seal leakage given by the seal constant.
+
+    Parameters
+    ----------
+    args : tuple
+        (point_rotor_t, k_end, guarantee_point, speed, reynolds_correction).
+
+    Returns
+    -------
+    point_rotor_sp : ccp.Point
+        Point in the rotor for the guarantee conditions.
+    point_flange_sp : ccp.Point
+        Point in the flange for the guarantee conditions.
+    """
+    point, k, guarantee_point, speed, reynolds_correction = args
+    Ts1f_sp = guarantee_point.suc.T()
+    initial_suc = copy(guarantee_point.suc)
+    # results of the last conversion
+    last = {}
+
+    def mixing_temperature(Ts1r_sp):
+        initial_suc.update(p=initial_suc.p(), T=Q_(Ts1r_sp, "degK"))
+        point_rotor_sp = Point.convert_from(
+            original_point=point,
+            suc=initial_suc,
+            speed=speed,
+            find="volume_ratio",
+            reynolds_correction=reynolds_correction,
+        )
+        ms1r_sp = point_rotor_sp.flow_m
+        mend_sp = flow_m_seal(
+            k,
+            state_up=point_rotor_sp.disch,
+            state_down=point_rotor_sp.suc,
+        )
+        ms1f_sp = ms1r_sp - mend_sp
+        # dummy state to calculate Tend
+        dummy_state = copy(point_rotor_sp.disch)
+        dummy_state.update(p=point_rotor_sp.suc.p(), h=dummy_state.h())
+        Tend_sp = dummy_state.T()
+        last.update(point_rotor_sp=point_rotor_sp, ms1f_sp=ms1f_sp)
+
+        return (
+            ((ms1f_sp * Ts1f_sp + mend_sp * Tend_sp) / (ms1f_sp + mend_sp)).to("degK").m
+        )
+
+    # initial estimate of Ts1r_sp with Ts1f_sp
+    _, converged = fixed_point(
+        mixing_temperature, Ts1f_sp.to("degK").m, rtol=ccp.config.MIXING_RTOL
+    )
+    if not converged:
+        warnings.warn(
+            f"Rotor suction temperature did not converge for the test point with "
+            f"flow_m={point.flow_m:.3f~P}."
+        )
+    initial_point_rotor_sp = last["point_rotor_sp"]
+    ms1f_sp = last["ms1f_sp"]
+
+    point_flange_sp = Point(
+        suc=guarantee_point.suc,
+        disch=initial_point_rotor_sp.disch,
+        flow_m=ms1f_sp,
+        speed=speed,
+        b=guarantee_point.b,
+        D=guarantee_point.D,
+        surface_roughness=guarantee_point.surface_roughness,
+        casing_area=guarantee_point.casing_area,
+        casing_temperature=guarantee_point.casing_temperature,
+        ambient_temperature=guarantee_point.ambient_temperature,
+        convection_constant=guarantee_point.convection_constant,
+    )
+
+    return initial_point_rotor_sp, point_flange_sp
+
+
 def parameter_interpolation(phi, phi_values, parameter_values):
     """Function used to make a linear interpolation for Mach and Reynolds numbers.
 
+    Values of phi outside the range of phi_values are linearly extrapolated from
+    the first (or last) two points.
+
     Parameters
     ----------
-    phi : float
-        Value of phi to interpolate.
-    phi_values : list
+    phi : float, pint.Quantity, array
+        Value (or array of values) of phi to interpolate.
+    phi_values : list, pint.Quantity, array
         List of phi values.
-    parameter_values : list
+    parameter_values : list, pint.Quantity, array
         List of parameter values (Mach or Reynolds).
-    """
 
-    if phi < min(phi_values):
-        phi_0 = phi_values[0]
-        phi_1 = phi_values[1]
-    elif phi > max(phi_values):
-        phi_0 = phi_values[-2]
-        phi_1 = phi_values[-1]
-    else:
-        phi_0 = [phi_ for phi_ in phi_values if (phi_ - phi) < 0][-1]
-        phi_1 = [phi_ for phi_ in phi_values if (phi_ - phi) > 0][0]
-
-    # get phi_values index
-    idx0 = phi_values.index(phi_0)
-    idx1 = phi_values.index(phi_1)
+    Returns
+    -------
+    result : float, pint.Quantity, array
+        Interpolated parameter, with the same shape as phi.
+
+    Examples
+    --------
+    >>> parameter_interpolation(0.15, [0.1, 0.2, 0.3], [0.5, 0.7, 0.8])
+    0.6
+    >>> phi = np.array([0.05, 0.35])
+    >>> parameter_interpolation(phi, [0.1, 0.2, 0.3], [0.5, 0.7, 0.8])
+    array([0.4 , 0.85])
+    """
+    phi, _ = _magnitude(phi)
+    phi_values, _ = _magnitude(phi_values)
+    parameter_values, units = _magnitude(parameter_values)
+
+    order = np.argsort(phi_values, kind="stable")
+    phi_values = phi_values[order]
+    parameter_values = parameter_values[order]
+
+    # index of the upper point of the segment used for each phi
+    idx1 = np.clip(np.searchsorted(phi_values, phi), 1, len(phi_values) - 1)
+    idx0 = idx1 - 1
+    phi_0 = phi_values[idx0]
+    phi_1 = phi_values[idx1]
     parameter0 = parameter_values[idx0]
     parameter1 = parameter_values[idx1]
 
     # do linear interpolation for phi and parameter
     result = parameter0 + (parameter1 - parameter0) * (phi - phi_0) / (phi_1 - phi_0)
+    if result.ndim == 0:
+        result = result.item()
+
+    if units is not None:
+        result = Q_(result, units)
 
     return result
+
+
+def _magnitude(values):
+    """Returns the magnitude (as float array) and units of values.
+
+    The values can be a number, an array, a pint.Quantity or a list of
+    pint.Quantity. The units are None if values is not a quantity.
+    """
+    if isinstance(values, Q_):
+        return np.asarray(values.m, dtype=float), values.units
+    if isinstance(values, (list, tuple, np.ndarray)) and len(values):
+        first = values[0]
+        if isinstance(first, Q_):
+            return (
+                np.array([v.to(first.units).m for v in values], dtype=float),
+                first.units,
+            )
+
+    return np.asarray(values, dtype=float), None
+
+
+def _compressor_results_to_save(compressor):
+    """Returns a dict with the compressor results that will be saved to a toml file.
+
+    The guarantee and test points are already saved as inputs.
+    """
+    points, values = compressor._results_to_save()
+
+    return {
+        **_results_settings(compressor.guarantee_point),
+        "values": values,
+        "points": {
+            name: {
+                f"Point{i}": point._dict_to_save(results=True)
+                for i, point in enumerate(point_list)
+            }
+            for name, point_list in points.items()
+            if not name.startswith(("guarantee_point", "test_points"))
+        },
+    }
+
+
+def _compressor_from_load(cls, kwargs, results):
+    """Create the compressor from the loaded inputs and results."""
+    if not _use_saved_results(results):
+        return cls(**kwargs)
+
+    points = {
+        k: v if isinstance(v, list) else [v]
+        for k, v in kwargs.items()
+        if k.startswith(("guarantee_point", "test_points"))
+    }
+    for name, point_list in results["points"].items():
+        points[name] = [Point._from_load(v) for v in point_list.values()]
+
+    return cls._from_results(points, results["values"])
+
+
+def _object_array(values):
+    """Create a numpy array with dtype=object from a list of points or quantities."""
+    array = np.zeros(len(values), dtype=object)
+    for i, value in enumerate(values):
+        array[i] = value
+
+    return array
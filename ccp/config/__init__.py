@@ -1,2 +1,98 @@
+"""ccp configuration.
+
+Options set as module attributes (e.g. ``ccp.config.EOS = "HEOS"``) are global
+and shared by all threads. Use :func:`override` to change options only for the
+current thread, for example when several calculations with different EOS run
+concurrently in a server.
+"""
+
+import sys
+import threading
+import types
+from contextlib import contextmanager
+
 POLYTROPIC_METHOD = "schultz"
 EOS = "REFPROP"
+# set to a ccp.ImpellerCache to reuse converted impellers in Impeller.convert_from
+IMPELLER_CACHE = None
+# default backend for parallel calculations: "process" or "thread"
+PARALLEL_BACKEND = "process"
+# solve the points of each curve in order of flow, starting each discharge state
+# calculation from the previous point (fewer iterations, but results differ
+# from the default within the solver tolerance)
+WARM_START = False
+# relative tolerance of the seal leakage mixing iterations in the StraightThrough
+# and BackToBack conversions (rotor suction temperature and flow)
+MIXING_RTOL = 1e-8
+
+OPTIONS = (
+    "POLYTROPIC_METHOD",
+    "EOS",
+    "IMPELLER_CACHE",
+    "PARALLEL_BACKEND",
+    "WARM_START",
+    "MIXING_RTOL",
+)
+
+_thread_local = threading.local()
+
+
+class _ConfigModule(types.ModuleType):
+    """Module type that returns the thread-local overrides of the options."""
+
+    def __getattribute__(self, name):
+        if name in OPTIONS:
+            overrides = getattr(_thread_local, "overrides", None)
+            if overrides and name in overrides:
+                return overrides[name]
+        return super().__getattribute__(name)
+
+
+sys.modules[__name__].__class__ = _ConfigModule
+
+
+@contextmanager
+def override(**options):
+    """Override configuration options for the current thread.
+
+    Other threads keep using the global values. Overrides can be nested.
+
+    Parameters
+    ----------
+    **options
+        Options to override, e.g. EOS="HEOS" or POLYTROPIC_METHOD="huntington".
+
+    Examples
+    --------
+    >>> import ccp
+    >>> with ccp.config.override(EOS="HEOS"):
+    ...     ccp.config.EOS
+    'HEOS'
+    >>> ccp.config.EOS
+    'REFPROP'
+    """
+    invalid = set(options) - set(OPTIONS)
+    if invalid:
+        raise ValueError(f"Invalid config options: {sorted(invalid)}")
+
+    previous = getattr(_thread_local, "overrides", None)
+    _thread_local.overrides = {**(previous or {}), **options}
+    try:
+        yield
+    finally:
+        _thread_local.overrides = previous
+
+
+def snapshot():
+    """Return the options as seen by the current thread.
+
+    The result can be passed to :func:`override` in another thread so that it
+    runs with the same configuration.
+
+    Returns
+    -------
+    options : dict
+        Dictionary with the value of each option.
+    """
+    module = sys.modules[__name__]
+    return {name: getattr(module, name) for name in OPTIONS}
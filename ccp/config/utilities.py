@@ -1,3 +1,5 @@
+import importlib
+import types
 from functools import reduce
 
 
@@ -16,3 +18,67 @@ def r_getattr(obj, attr, *args):
         return getattr(obj, attr, *args)
 
     return reduce(_getattr, [obj] + attr.split("."))
+
+
+class LazyModule(types.ModuleType):
+    """Module that is only imported when one of its attributes is accessed.
+
+    Parameters
+    ----------
+    name : str
+        Full name of the module, e.g. 'plotly.graph_objects'.
+    on_import : callable, optional
+        Function called (without arguments) after the module is imported for the
+        first time.
+    """
+
+    def __init__(self, name, on_import=None):
+        super().__init__(name)
+        self._lazy_on_import = on_import
+        self._lazy_module = None
+
+    def _load(self):
+        if self._lazy_module is None:
+            module = importlib.import_module(self.__name__)
+            if self._lazy_on_import is not None:
+                self._lazy_on_import()
+            self._lazy_module = module
+        return self._lazy_module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        status = "loaded" if self._lazy_module is not None else "not loaded"
+        return f"<lazy module {self.__name__!r} ({status})>"
+
+
+def lazy_import(name, on_import=None):
+    """Return a module that is only imported on first attribute access.
+
+    This is used for optional or heavy dependencies (e.g. plotly) so that they do
+    not add to the time of ``import ccp``.
+
+    Parameters
+    ----------
+    name : str
+        Full name of the module, e.g. 'plotly.graph_objects'.
+    on_import : callable, optional
+        Function called (without arguments) after the module is imported for the
+        first time.
+
+    Returns
+    -------
+    module : LazyModule
+        Proxy to the module.
+
+    Examples
+    --------
+    >>> json = lazy_import("json")
+    >>> json.dumps([1, 2])
+    '[1, 2]'
+    """
+    return LazyModule(name, on_import=on_import)
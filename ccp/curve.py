@@ -3,9 +3,12 @@ import csv
 import numpy as np
 import toml
 from scipy.interpolate import interp1d
-import plotly.graph_objects as go
 
+import ccp.config
 from ccp import Q_, ureg, Point
+from ccp.config.units import check_units
+from ccp.plotly_theme import go
+from ccp.point import reynolds_correction_eff_psi
 
 
 class StateParameter:
@@ -297,10 +300,108 @@ class Curve:
             else:
                 return True
 
-    def _dict_to_save(self):
-        return {f"point{i}": point._dict_to_save() for i, point in enumerate(self)}
+    @check_units
+    def convert_to(self, suc, find="speed", speed=None, reynolds_correction=False):
+        """Convert the curve to a new suction condition.
 
-    def save(self, file_name, file_type="toml"):
+        The conversion is done in two steps, as in Impeller.convert_from:
+
+        1. Each point is converted with Point.convert_from (with find="speed" the
+           volume ratio is kept and a new speed is calculated for each point);
+        2. The converted points are converted again with find="volume_ratio" at
+           the mean speed of the first step (or at the given speed), so that all
+           points of the curve have the same speed.
+
+        The Reynolds correction is calculated for all points at once, with the
+        suction density and viscosity calculated only once. With
+        ccp.config.WARM_START, the discharge state of each point is used as
+        initial guess for the next one.
+
+        Parameters
+        ----------
+        suc : ccp.State
+            New suction condition.
+        find : str, optional
+            "speed" or "volume_ratio" for the first step (see Point.convert_from).
+            Default is "speed".
+        speed : float, pint.Quantity, optional
+            Speed of the converted curve (rad/s). Default is the mean speed of the
+            points after the first step.
+        reynolds_correction : bool, optional
+            If True, the ASME PTC 10 Reynolds correction is applied in both
+            steps. Default is False.
+
+        Returns
+        -------
+        curve : ccp.Curve
+            Converted curve.
+        """
+        points = self._converted_points(
+            self.points, suc, find, None, reynolds_correction
+        )
+
+        if speed is None:
+            speed = Q_(
+                np.mean([p.speed.magnitude for p in points]), points[0].speed.units
+            )
+        points = self._converted_points(
+            points, suc, "volume_ratio", speed, reynolds_correction
+        )
+
+        return self.__class__(points)
+
+    @staticmethod
+    def _converted_points(original_points, suc, find, speed, reynolds_correction):
+        """Convert points to suc, with the Reynolds correction for all points."""
+        if speed is None:
+            speeds = [p.speed for p in original_points]
+        else:
+            speeds = [speed] * len(original_points)
+
+        effs = [p.eff for p in original_points]
+        psis = [p.psi for p in original_points]
+        if reynolds_correction:
+            b = np.array([p.b.to("m").m for p in original_points])
+            D = np.array([p.D.to("m").m for p in original_points])
+            u = np.array([s.to("rad/s").m for s in speeds]) * D / 2
+            rho_mu = (suc.rho() / suc.viscosity()).to("s/m²").m
+            eff, psi = reynolds_correction_eff_psi(
+                eff=np.array([e.m for e in effs]),
+                psi=np.array([p.m for p in psis]),
+                reynolds_original=np.array([p.reynolds.m for p in original_points]),
+                reynolds_converted=u * b * rho_mu,
+                b=b / 0.3048,
+                surface_roughness=np.array(
+                    [p.surface_roughness.to("in").m for p in original_points]
+                ),
+            )
+            effs = Q_(eff, "dimensionless")
+            psis = Q_(psi, "dimensionless")
+
+        def convert(i, disch_guess):
+            return Point._convert_from(
+                original_points[i],
+                suc=suc,
+                find=find,
+                speed=speeds[i],
+                eff=effs[i],
+                psi=psis[i],
+                disch_guess=disch_guess if ccp.config.WARM_START else None,
+            )
+
+        return _warm_started(
+            convert,
+            list(range(len(original_points))),
+            [p.flow_v.m for p in original_points],
+        )
+
+    def _dict_to_save(self, results=False):
+        return {
+            f"point{i}": point._dict_to_save(results=results)
+            for i, point in enumerate(self)
+        }
+
+    def save(self, file_name, file_type="toml", results=False):
         """Save curve to a file.
 
         Parameters
@@ -309,10 +410,14 @@ class Curve:
             Name of the file.
         file_type: str
             File type can be: toml.
+        results: bool, optional
+            If True, the calculated points are also saved, and the curve is
+            loaded without solving the points again (see Point.save).
+            Default is False.
         """
         if file_type == "toml":
             with open(file_name, mode="w") as f:
-                toml.dump(self._dict_to_save(), f)
+                toml.dump(self._dict_to_save(results=results), f)
 
     def save_hysys_csv(self, curve_path):
         """Save curve to a csv with hysys format.
@@ -339,6 +444,34 @@ class Curve:
         with open(file_name) as f:
             parameters = toml.load(f)
 
-        return cls(
-            [Point(**Point._dict_from_load(kwargs)) for kwargs in parameters.values()]
-        )
+        return cls([Point._from_load(kwargs) for kwargs in parameters.values()])
+
+
+def _warm_started(create, items, flows):
+    """Create the points of a curve in order of flow.
+
+    The discharge state of each point is used as initial guess for the next one,
+    which reduces the number of iterations since points next to each other in a
+    curve have similar discharge states.
+
+    Parameters
+    ----------
+    create : callable
+        Function called as create(item, disch_guess) that returns a ccp.Point.
+    items : list
+        Items used to create the points.
+    flows : list
+        Flow of each item, used to order the calculation.
+
+    Returns
+    -------
+    points : list
+        The points, in the same order as items.
+    """
+    points = [None] * len(items)
+    disch_guess = None
+    for i in np.argsort(flows, kind="stable"):
+        points[i] = create(items[i], disch_guess)
+        disch_guess = points[i].disch
+
+    return points
@@ -5,4 +5,11 @@ before beeing loaded.
 
 """
 
-from .processing import fluctuation, fluctuation_data, mean_data, filter_data
+from .processing import (
+    fluctuation,
+    fluctuation_data,
+    mean_data,
+    filter_data,
+    filter_chunks,
+)
+from .read_xl import HistorianReader
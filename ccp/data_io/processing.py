@@ -1,6 +1,9 @@
 """Data processing functions for ccp."""
 
-import pandas as pd
+from ccp.config.utilities import lazy_import
+
+# pandas is only needed for data processing, so it is not loaded on import ccp
+pd = lazy_import("pandas")
 
 
 def fluctuation(x):
@@ -227,3 +230,46 @@ def filter_data(
                 )
             mean_df.loc[fluctuation_df[column] > max_fluctuation, "valid"] = False
     return mean_df
+
+
+def filter_chunks(chunks, window=3, **kwargs):
+    """Filter data read in chunks.
+
+    Each chunk is filtered with filter_data together with the last window - 1
+    rows of the previous chunks, so that the rolling windows across the chunk
+    boundaries are the same as the ones calculated with all the data at once.
+    Only one chunk is kept in memory.
+
+    Parameters
+    ----------
+    chunks : iterable
+        Iterable of pandas.DataFrame (e.g. ccp.data_io.HistorianReader).
+    window : int, optional
+        Window size for rolling calculation. The default is 3.
+    **kwargs
+        Other arguments passed to filter_data (data_type, fluctuations and
+        drop_invalid_values).
+
+    Yields
+    ------
+    pandas.DataFrame
+        Filtered data of each chunk.
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> df = pd.DataFrame({'a': [1, 2, 3, 3, 3, 3], 'b': [4, 5, 6, 6, 6, 6]})
+    >>> data_type = {'a': 'pressure', 'b': 'temperature'}
+    >>> chunks = [df[:3], df[3:]]
+    >>> pd.concat(filter_chunks(chunks, window=3, data_type=data_type))
+         a    b  valid
+    4  3.0  6.0   True
+    5  3.0  6.0   True
+    """
+    overlap = None
+    for chunk in chunks:
+        if overlap is not None:
+            chunk = pd.concat([overlap, chunk])
+        if len(chunk) >= window:
+            yield filter_data(chunk, window=window, **kwargs)
+        overlap = chunk.iloc[len(chunk) - (window - 1) :]
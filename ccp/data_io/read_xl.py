@@ -1 +1,135 @@
-"""Module to implement IO from excel using xlwings."""
+"""Module to read historian data from csv and Excel files in chunks.
+
+Historian exports can have millions of rows, so the data is read in chunks with
+a bounded number of rows, which can be filtered with
+ccp.data_io.filter_chunks or given directly to ccp.Evaluation.
+
+```{code-block} python
+import ccp
+
+reader = ccp.data_io.HistorianReader(
+    "historian.csv",
+    columns={"PIT_203": "ps", "TIT_202": "Ts", "PIT_204": "pd", ...},
+    units={"ps": "bar", "Ts": "degC", "pd": "bar", ...},
+)
+evaluation = ccp.Evaluation(data=reader, ...)
+```
+"""
+
+from pathlib import Path
+
+from ccp.config.utilities import lazy_import
+
+pd = lazy_import("pandas")
+openpyxl = lazy_import("openpyxl")
+
+
+class HistorianReader:
+    """Reader for historian data in csv or xlsx files.
+
+    The first column of the file is the timestamp, which is used as index, and
+    the first row has the tag of each column. Iterating over the reader yields
+    DataFrames with at most chunksize rows, so the memory used to read the file
+    does not depend on its size. The reader can be iterated more than once.
+    Notice that ccp.Evaluation keeps all the rows that are valid after filtering.
+
+    Parameters
+    ----------
+    path : str, pathlib.Path
+        Path to the .csv or .xlsx file.
+    columns : dict, optional
+        Dict with the tag of each column in the file and the name used by ccp
+        (e.g. {"PIT_203": "ps"}). Only these columns are read.
+        Default is all columns with the names in the file.
+    units : dict, optional
+        Units of each column, with the names used by ccp (e.g. {"ps": "bar"}).
+        Used as data_units by ccp.Evaluation.
+    chunksize : int, optional
+        Maximum number of rows in each chunk. Default is 100000.
+    sheet_name : str, optional
+        Sheet with the data in xlsx files. Default is the active sheet.
+
+    Examples
+    --------
+    >>> reader = HistorianReader("historian.csv", columns={"PIT_203": "ps"})
+    >>> for chunk in reader:  # doctest: +SKIP
+    ...     print(chunk["ps"].mean())
+    """
+
+    def __init__(
+        self, path, columns=None, units=None, chunksize=100_000, sheet_name=None
+    ):
+        self.path = Path(path)
+        if self.path.suffix.lower() not in [".csv", ".xlsx"]:
+            raise ValueError(
+                f"File type {self.path.suffix} not supported. Use .csv or .xlsx."
+            )
+        self.columns = columns
+        self.data_units = units
+        self.chunksize = chunksize
+        self.sheet_name = sheet_name
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({str(self.path)!r})"
+
+    def __iter__(self):
+        if self.path.suffix.lower() == ".csv":
+            return self._read_csv()
+        return self._read_xlsx()
+
+    def _positions(self, header):
+        """Position of the index and of the columns read from the file."""
+        if self.columns is None:
+            return list(range(len(header)))
+        missing = [tag for tag in self.columns if tag not in header]
+        if missing:
+            raise ValueError(f"Columns {missing} not found in {self.path.name}.")
+        return [0] + [header.index(tag) for tag in self.columns]
+
+    def _to_frame(self, index, data, tags):
+        # values that are not numbers (e.g. "Bad" or "I/O Timeout" in historian
+        # exports) are read as NaN and removed by filter_data
+        df = pd.DataFrame(data, index=pd.to_datetime(index), columns=tags).apply(
+            pd.to_numeric, errors="coerce"
+        )
+        if self.columns is not None:
+            df = df.rename(columns=self.columns)
+        return df
+
+    def _read_csv(self):
+        header = list(pd.read_csv(self.path, nrows=0).columns)
+        positions = self._positions(header)
+        tags = [header[i] for i in positions[1:]]
+        with pd.read_csv(
+            self.path,
+            usecols=positions,
+            index_col=0,
+            chunksize=self.chunksize,
+        ) as chunks:
+            for chunk in chunks:
+                yield self._to_frame(chunk.index, chunk[tags].to_numpy(), tags)
+
+    def _read_xlsx(self):
+        workbook = openpyxl.load_workbook(self.path, read_only=True, data_only=True)
+        try:
+            sheet = (
+                workbook.active
+                if self.sheet_name is None
+                else workbook[self.sheet_name]
+            )
+            rows = sheet.iter_rows(values_only=True)
+            header = list(next(rows))
+            positions = self._positions(header)
+            tags = [header[i] for i in positions[1:]]
+
+            index, data = [], []
+            for row in rows:
+                index.append(row[0])
+                data.append([row[i] for i in positions[1:]])
+                if len(data) == self.chunksize:
+                    yield self._to_frame(index, data, tags)
+                    index, data = [], []
+            if data:
+                yield self._to_frame(index, data, tags)
+        finally:
+            workbook.close()
@@ -0,0 +1,289 @@
+"""Module with the operating envelope of an impeller.
+
+The envelope is calculated in the volumetric flow x head plane from the curves
+of the impeller map. Its boundary is made of the minimum and maximum speed
+curves, the surge line (first point of each curve) and the right limit of each
+curve, which is the stonewall (last point of the curve) or, if given, the flow
+where the curve reaches the minimum head or the maximum power.
+
+```{code-block} python
+import ccp
+
+imp = ccp.impeller_example()
+envelope = imp.envelope(min_head=Q_(50, "kJ/kg"), max_power=Q_(15, "MW"))
+inside = envelope.contains(flow_v=samples_flow_v, head=samples_head)
+```
+"""
+
+import numpy as np
+
+from ccp.config.units import check_units, Q_
+from ccp.plotly_theme import go
+
+_flow_v_units = "m³/s"
+_head_units = "J/kg"
+
+
+class Envelope:
+    """Operating envelope of an impeller in the volumetric flow x head plane.
+
+    Envelopes are created with Impeller.envelope.
+
+    Parameters
+    ----------
+    lines : dict
+        Dict with the name and the (flow_v, head) arrays (m³/s, J/kg) of each
+        line: "surge", "stonewall", "min_speed", "max_speed" and, if the limits
+        are given, "min_head" and "max_power".
+    boundary : tuple
+        (flow_v, head) arrays of the closed boundary of the envelope.
+    right_limits : list
+        Name of the limit that defines the maximum flow of each curve.
+    speed : np.array
+        Speed of each curve (rad/s).
+
+    Attributes
+    ----------
+    lines : dict
+        Dict with the name and the (flow_v, head) pint.Quantity arrays of each line.
+    flow_v, head : pint.Quantity
+        Closed boundary of the envelope.
+    right_limits : list
+        Name of the limit ("stonewall", "min_head" or "max_power") that defines
+        the maximum flow of each curve, from the minimum to the maximum speed.
+    speed : pint.Quantity
+        Speed of each curve.
+    """
+
+    def __init__(self, lines, boundary, right_limits, speed):
+        self.lines = {
+            name: (Q_(flow_v, _flow_v_units), Q_(head, _head_units))
+            for name, (flow_v, head) in lines.items()
+        }
+        self._boundary = np.asarray(boundary[0]), np.asarray(boundary[1])
+        self.flow_v = Q_(self._boundary[0], _flow_v_units)
+        self.head = Q_(self._boundary[1], _head_units)
+        self.right_limits = right_limits
+        self.speed = Q_(speed, "rad/s")
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(speed={self.speed.min():.0f~P} ~ "
+            f"{self.speed.max():.0f~P}, lines={list(self.lines)})"
+        )
+
+    @check_units
+    def contains(self, flow_v, head):
+        """Check if points are inside the envelope.
+
+        The check is vectorized, so thousands of samples (e.g. from historian
+        data) can be checked with a single call.
+
+        Parameters
+        ----------
+        flow_v : pint.Quantity, float, array
+            Volumetric flow (m³/s).
+        head : pint.Quantity, float, array
+            Polytropic head (J/kg).
+
+        Returns
+        -------
+        inside : bool or np.array
+            True for the points inside the envelope.
+        """
+        x = np.asarray(flow_v.m, dtype=float)
+        y = np.asarray(head.m, dtype=float)
+        shape = np.broadcast(x, y).shape
+        x, y = np.broadcast_to(x, shape).ravel(), np.broadcast_to(y, shape).ravel()
+
+        # even-odd rule with a horizontal ray to the right of each point
+        x1, y1 = self._boundary
+        x2, y2 = np.roll(x1, -1), np.roll(y1, -1)
+        x_, y_ = x[:, None], y[:, None]
+        crosses = (y1 > y_) != (y2 > y_)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_cross = x1 + (y_ - y1) * (x2 - x1) / (y2 - y1)
+        inside = np.logical_xor.reduce(crosses & (x_ < x_cross), axis=1)
+
+        inside = inside.reshape(shape)
+        if inside.ndim == 0:
+            return bool(inside)
+        return inside
+
+    def plot(self, fig=None, flow_v_units="m³/s", head_units="J/kg", **kwargs):
+        """Plot the envelope lines.
+
+        Parameters
+        ----------
+        fig : go.Figure, optional
+            Figure where the lines are added (e.g. from Impeller.head_plot).
+        flow_v_units : str, optional
+            Volumetric flow units. Default is m³/s.
+        head_units : str, optional
+            Head units. Default is J/kg.
+
+        Returns
+        -------
+        fig : go.Figure
+            Plotly figure with the envelope.
+        """
+        if fig is None:
+            fig = go.Figure()
+
+        for name, (flow_v, head) in self.lines.items():
+            fig.add_trace(
+                go.Scatter(
+                    x=flow_v.to(flow_v_units).m,
+                    y=head.to(head_units).m,
+                    name=name,
+                    mode="lines",
+                    line=dict(dash="dash"),
+                    **kwargs,
+                )
+            )
+        fig.update_layout(
+            xaxis=dict(title=f"Volume flow ({Q_(1, flow_v_units).units:~H})"),
+            yaxis=dict(title=f"Head ({Q_(1, head_units).units:~H})"),
+        )
+
+        return fig
+
+
+def calc_envelope(curves, min_head=None, max_power=None, extrapolate=False):
+    """Calculate the envelope from a list of curves.
+
+    Parameters
+    ----------
+    curves : list
+        List of ccp.Curve.
+    min_head : float, optional
+        Minimum head (J/kg).
+    max_power : float, optional
+        Maximum power (W).
+    extrapolate : bool, optional
+        If True, the curves are linearly extrapolated after the last point (choke
+        region) to find the min_head and max_power limits, and the last point
+        is not used as a limit.
+
+    Returns
+    -------
+    envelope : Envelope
+    """
+    curves = sorted(curves, key=lambda c: c.speed.m)
+
+    speeds = []
+    curve_values = []
+    lines = {"surge": ([], []), "stonewall": ([], [])}
+    if min_head is not None:
+        lines["min_head"] = ([], [])
+    if max_power is not None:
+        lines["max_power"] = ([], [])
+    right = ([], [])
+    right_limits = []
+
+    for curve in curves:
+        flow_v = curve.flow_v.to(_flow_v_units).m
+        head = curve.head.to(_head_units).m
+        power = curve.power.to("W").m
+
+        limits = {}
+        if not extrapolate:
+            limits["stonewall"] = flow_v[-1]
+        if min_head is not None:
+            flow = _crossing(flow_v, head - min_head, extrapolate)
+            if flow is not None:
+                limits["min_head"] = flow
+        if max_power is not None:
+            flow = _crossing(flow_v, max_power - power, extrapolate)
+            if flow is not None:
+                limits["max_power"] = flow
+
+        # curves that are completely outside the limits are not in the envelope
+        if (min_head is not None and head.max() <= min_head) or (
+            max_power is not None and power[0] >= max_power
+        ):
+            continue
+        if not limits:
+            raise ValueError(
+                f"Curve at {curve.speed:.0f~P} does not reach the limits. "
+                f"Use extrapolate=False or give min_head/max_power."
+            )
+
+        lines["surge"][0].append(flow_v[0])
+        lines["surge"][1].append(head[0])
+        lines["stonewall"][0].append(flow_v[-1])
+        lines["stonewall"][1].append(head[-1])
+        for name in ["min_head", "max_power"]:
+            if name in limits:
+                lines[name][0].append(limits[name])
+                lines[name][1].append(_interp(limits[name], flow_v, head))
+
+        right_limit = min(limits, key=limits.get)
+        flow_max = limits[right_limit]
+        right[0].append(flow_max)
+        right[1].append(_interp(flow_max, flow_v, head))
+        right_limits.append(right_limit)
+
+        speeds.append(curve.speed.to("rad/s").m)
+        curve_values.append((flow_v, head, flow_max))
+
+    if not curve_values:
+        raise ValueError("All curves are outside the limits.")
+
+    for name, (flow_v, head, flow_max) in zip(
+        ["min_speed", "max_speed"], [curve_values[0], curve_values[-1]]
+    ):
+        lines[name] = _clip(flow_v, head, flow_max)
+
+    # counterclockwise: min speed curve, right limits, max speed curve, surge line
+    min_speed = lines["min_speed"]
+    max_speed = lines["max_speed"]
+    boundary_flow_v = np.concatenate(
+        [min_speed[0], right[0][1:-1], max_speed[0][::-1], lines["surge"][0][-2:0:-1]]
+    )
+    boundary_head = np.concatenate(
+        [min_speed[1], right[1][1:-1], max_speed[1][::-1], lines["surge"][1][-2:0:-1]]
+    )
+
+    return Envelope(
+        lines={k: (np.array(v[0]), np.array(v[1])) for k, v in lines.items()},
+        boundary=(boundary_flow_v, boundary_head),
+        right_limits=right_limits,
+        speed=np.array(speeds),
+    )
+
+
+def _crossing(flow_v, values, extrapolate):
+    """First flow where values changes from positive to negative or None.
+
+    If extrapolate is True, the last segment is extrapolated when values is still
+    positive at the last point.
+    """
+    idx = np.nonzero((values[:-1] > 0) & (values[1:] <= 0))[0]
+    if len(idx):
+        i = idx[0]
+    elif extrapolate and values[-1] > 0 and values[-1] < values[-2]:
+        i = len(values) - 2
+    else:
+        return None
+
+    return flow_v[i] + values[i] * (flow_v[i + 1] - flow_v[i]) / (
+        values[i] - values[i + 1]
+    )
+
+
+def _interp(flow, flow_v, values):
+    """Linear interpolation, extrapolating with the last segment."""
+    if flow <= flow_v[-1]:
+        return np.interp(flow, flow_v, values)
+    slope = (values[-1] - values[-2]) / (flow_v[-1] - flow_v[-2])
+    return values[-1] + slope * (flow - flow_v[-1])
+
+
+def _clip(flow_v, head, flow_max):
+    """Curve points with flow lower than flow_max and the point at flow_max."""
+    keep = flow_v < flow_max
+    return (
+        np.append(flow_v[keep], flow_max),
+        np.append(head[keep], _interp(flow_max, flow_v, head)),
+    )
@@ -1,19 +1,20 @@
 """Module for performance evaluation based on historical data."""
 
-import multiprocessing
 import zipfile
 import toml
 import pandas as pd
 import io
 import pickle
-from .data_io import filter_data
+import warnings
+from collections.abc import Sequence
+import ccp.config
+from . import parallel
+from .data_io import filter_data, filter_chunks
 from .state import State
-from .point import Point
+from .point import Point, _results_from_frame, _results_settings, _results_to_frame
 from .fo import FlowOrifice
 from .impeller import Impeller
 from . import Q_
-from sklearn.cluster import KMeans
-from tqdm.auto import tqdm
 
 
 class Evaluation:
@@ -35,13 +36,16 @@ class Evaluation:
         verbose=False,
         n_clusters=5,
         calculate_points=True,
+        processes=None,
+        backend=None,
+        progress_callback=None,
         **kwargs,
     ):
         """Initialize the evaluation class.
 
         Parameters
         ----------
-        data : pandas.DataFrame
+        data : pandas.DataFrame, ccp.data_io.HistorianReader
             Historical data of the following parameters below. Notice that if the units
             are not provided in the data_units dictionary, the units will be assumed as
             SI units:
@@ -52,12 +56,20 @@ class Evaluation:
             - Suction temperature: should be 'Ts' (degK) in the DataFrame;
             - Discharge temperature: should be 'Td' (degK) in the DataFrame;
             - Speed: should be 'speed' (rad/s) in the DataFrame.
+            The data can also be an iterable of DataFrames (e.g. a
+            ccp.data_io.HistorianReader), which is read and filtered one chunk
+            at a time. All the valid rows after filtering are still kept in
+            Evaluation.data and Evaluation.df (the clustering and the points
+            use every row), so the memory used grows with the number of valid
+            rows, but not with the rows dropped by the filter.
         window : int, optional
             Window size for rolling calculation, meaning how many rolls will be used
             to calculate the fluctuation.
             The default is 3.
         data_units : dict
             Dictionary with data units for each column.
+            Default is data.data_units if available (see
+            ccp.data_io.HistorianReader).
         temperature_fluctuation : float, optional
             Maximum fluctuation for temperature data.
             The default is 0.5.
@@ -84,6 +96,16 @@ class Evaluation:
             The default is True.
         verbose : bool, optional
             If True, shows progress bar.
+        processes : int, optional
+            Maximum number of worker processes used to convert the impellers.
+            Default is the number of CPUs.
+        backend : str, optional
+            Parallel backend, "process" or "thread".
+            Default is ccp.config.PARALLEL_BACKEND.
+        progress_callback : callable, optional
+            Function called as progress_callback(done, total) during the
+            impellers conversion. If not provided and verbose is True, a progress
+            bar is shown.
 
         Returns
         -------
@@ -99,6 +121,8 @@ class Evaluation:
             "Td": "temperature",
             "speed": "speed",
         }
+        if data_units is None:
+            data_units = getattr(data, "data_units", None)
         self.data_units = data_units
         self.temperature_fluctuation = temperature_fluctuation
         self.pressure_fluctuation = pressure_fluctuation
@@ -108,6 +132,10 @@ class Evaluation:
         self.d = d
         self.tappings = tappings
         self.n_clusters = n_clusters
+        self.verbose = verbose
+        self.processes = processes
+        self.backend = backend
+        self.progress_callback = progress_callback
 
         # check if we are loading from a zip file where the impellers are available
         if kwargs.get("impellers_new") is None:
@@ -120,15 +148,9 @@ class Evaluation:
             self.df = kwargs.get("df")
 
     def _run(self):
-        df = self.data.copy()
-        df = filter_data(
-            df,
-            data_type=self.data_type,
-            window=self.window,
-            temperature_fluctuation=self.temperature_fluctuation,
-            pressure_fluctuation=self.pressure_fluctuation,
-            speed_fluctuation=self.speed_fluctuation,
-        )
+        df = self._filter(self.data)
+        if not isinstance(self.data, pd.DataFrame):
+            self.data = df.copy()
 
         df = self.calculate_flow(df)
 
@@ -142,6 +164,8 @@ class Evaluation:
         self.data_std = data_std
 
         # Using sklearn
+        from sklearn.cluster import KMeans
+
         kmeans = KMeans(n_clusters=self.n_clusters, n_init="auto")
         kmeans.fit(data_norm)
         self.kmeans = kmeans
@@ -156,24 +180,62 @@ class Evaluation:
                 kmeans.cluster_centers_[i][1] * data_std["ps"]
             ) + data_mean["ps"]
             df.loc[df["cluster"] == i, "Ts_center"] = (
-                kmeans.cluster_centers_[i][0] * data_std["Ts"]
+                kmeans.cluster_centers_[i][2] * data_std["Ts"]
             ) + data_mean["Ts"]
 
-        self.impellers_new = []
-
-        print("Converting curves")
-        for i in tqdm(range(kmeans.n_clusters)):
-            cluster_series = df[df["cluster"] == 0].iloc[0]
+        sucs_new = []
+        for i in range(kmeans.n_clusters):
+            cluster_series = df[df["cluster"] == i].iloc[0]
             suc_new = State(
                 p=Q_(cluster_series.ps_center, self.data_units["ps"]),
                 T=Q_(cluster_series.Ts_center, self.data_units["Ts"]),
                 fluid=self.operation_fluid,
             )
-            imp_new = Impeller.convert_from(self.impellers, suc=suc_new, speed="same")
-            self.impellers_new.append(imp_new)
+            sucs_new.append(suc_new)
+
+        callback = self.progress_callback
+        progress_bar = None
+        if callback is None and self.verbose:
+            from tqdm.auto import tqdm
+
+            progress_bar = tqdm(desc="Converting curves")
+
+            def callback(done, total):
+                progress_bar.total = total
+                progress_bar.update(done - progress_bar.n)
+
+        self.impellers_new = Impeller.convert_from_many(
+            self.impellers,
+            sucs_new,
+            speed="same",
+            processes=self.processes,
+            backend=self.backend,
+            callback=callback,
+        )
+        if progress_bar is not None:
+            progress_bar.close()
 
         self.df = df
 
+    def _filter(self, data, drop_invalid_values=True):
+        """Filter data given as a DataFrame or as an iterable of DataFrames.
+
+        For an iterable, each chunk is filtered separately (see
+        ccp.data_io.filter_chunks), but the filtered chunks are concatenated in
+        a single DataFrame.
+        """
+        kwargs = dict(
+            data_type=self.data_type,
+            window=self.window,
+            temperature_fluctuation=self.temperature_fluctuation,
+            pressure_fluctuation=self.pressure_fluctuation,
+            speed_fluctuation=self.speed_fluctuation,
+            drop_invalid_values=drop_invalid_values,
+        )
+        if isinstance(data, pd.DataFrame):
+            return filter_data(data.copy(), **kwargs)
+        return pd.concat(filter_chunks(data, **kwargs))
+
     def calculate_flow(self, data=None):
         df = data
         calculate_flow = False
@@ -181,12 +243,12 @@ class Evaluation:
             calculate_flow = True
 
         # create density column
-        df["v_s"] = 0
-        df["speed_sound"] = 0
+        df["v_s"] = 0.0
+        df["speed_sound"] = 0.0
 
         state = State(
-            p=Q_(df.ps[0], self.data_units["ps"]),
-            T=Q_(df.Ts[0], self.data_units["Ts"]),
+            p=Q_(df.ps.iloc[0], self.data_units["ps"]),
+            T=Q_(df.Ts.iloc[0], self.data_units["Ts"]),
             fluid=self.operation_fluid,
         )
 
@@ -274,16 +336,7 @@ class Evaluation:
         if data is None:
             df = self.df
         else:
-            df = data.copy()
-            df = filter_data(
-                df,
-                data_type=self.data_type,
-                window=self.window,
-                temperature_fluctuation=self.temperature_fluctuation,
-                pressure_fluctuation=self.pressure_fluctuation,
-                speed_fluctuation=self.speed_fluctuation,
-                drop_invalid_values=drop_invalid_values,
-            )
+            df = self._filter(data, drop_invalid_values=drop_invalid_values)
 
         df = self.calculate_flow(df)
 
@@ -320,25 +373,27 @@ class Evaluation:
 
             args_list.append(arg_dict)
 
-        with multiprocessing.Pool() as pool:
+        from tqdm.auto import tqdm
+
+        with parallel.pool(self.processes, self.backend) as pool:
             print("Calculating points...")
             points += tqdm(pool.imap(create_points_parallel, args_list))
             print("Calculating expected points...")
             expected_points += tqdm(pool.imap(get_interpolated_point, args_list))
 
         # start column with -1, if this value remains, it means that the point was not calculated due to invalid data
-        df["eff"] = -1
-        df["head"] = -1
-        df["power"] = -1
-        df["p_disch"] = -1
-        df["expected_eff"] = -1
-        df["expected_head"] = -1
-        df["expected_power"] = -1
-        df["expected_p_disch"] = -1
-        df["delta_eff"] = -1
-        df["delta_head"] = -1
-        df["delta_power"] = -1
-        df["delta_p_disch"] = -1
+        df["eff"] = -1.0
+        df["head"] = -1.0
+        df["power"] = -1.0
+        df["p_disch"] = -1.0
+        df["expected_eff"] = -1.0
+        df["expected_head"] = -1.0
+        df["expected_power"] = -1.0
+        df["expected_p_disch"] = -1.0
+        df["delta_eff"] = -1.0
+        df["delta_head"] = -1.0
+        df["delta_power"] = -1.0
+        df["delta_p_disch"] = -1.0
 
         for i, point_op, point_expected in zip(df.index, points, expected_points):
             # if point_op is None, it means that the point was not calculated due to invalid data
@@ -364,7 +419,7 @@ class Evaluation:
         total_time = df.index[-1] - df.index[0]
 
         # create column for timescale
-        df["timescale"] = 0
+        df["timescale"] = 0.0
 
         if len(df) > 1:
             for i, row in df.iterrows():
@@ -375,17 +430,47 @@ class Evaluation:
         return df
 
     def save(self, path):
-        # create zip file and save dataframe as parquet and impellers
+        """Save evaluation to a zip file.
+
+        The data and results are saved as parquet files and the impellers are
+        saved as a table with one row per point, with the calculated values of
+        each point (see Point._results). The points are loaded from these values
+        without being solved again, which is much faster than pickled impellers.
+
+        Parameters
+        ----------
+        path : str or pathlib.Path
+            Path to the file.
+        """
+        frames = []
+        units = {}
+        for group, impellers in [
+            ("impellers", self.impellers),
+            ("impellers_new", self.impellers_new),
+        ]:
+            for i, imp in enumerate(impellers):
+                frame, units = _results_to_frame(imp.points, units)
+                frame.insert(0, "group", group)
+                frame.insert(1, "impeller", i)
+                frames.append(frame)
+        impellers_table = pd.concat(frames, ignore_index=True)
+
         with zipfile.ZipFile(path, "w") as zip_file:
+            zip_file.writestr(
+                "format.toml",
+                toml.dumps(
+                    {
+                        "format": "ccp.Evaluation",
+                        "version": EVALUATION_FORMAT_VERSION,
+                        # EOS and polytropic method used in the saved points
+                        **_results_settings(self.impellers[0].points[0]),
+                        "units": units,
+                    }
+                ),
+            )
             zip_file.writestr("data.parquet", self.data.to_parquet())
             zip_file.writestr("df.parquet", self.df.to_parquet())
-            for i, imp in enumerate(self.impellers):
-                # write pickle file to zip
-                with zip_file.open(f"imp_{i}.pickle", "w") as pickle_file:
-                    pickle.dump(imp, pickle_file)
-            for i, imp in enumerate(self.impellers_new):
-                with zip_file.open(f"imp_new_{i}.pickle", "w") as pickle_file:
-                    pickle.dump(imp, pickle_file)
+            zip_file.writestr("impellers.parquet", impellers_table.to_parquet())
             # create dict with arguments and save to toml
             args_dict = {
                 "operation_fluid": self.operation_fluid,
@@ -399,7 +484,37 @@ class Evaluation:
 
     @classmethod
     def load(cls, path):
+        """Load evaluation from a zip file.
+
+        Impellers are only created when they are accessed for the first time,
+        from the saved values of their points. The points keep the EOS and
+        polytropic method used when they were saved, so that they match the
+        saved results (a warning is raised if these are different from the
+        current ones in ccp.config). Files saved with previous versions of ccp
+        (with pickled impellers) can also be loaded.
+
+        Parameters
+        ----------
+        path : str or pathlib.Path
+            Path to the file.
+
+        Returns
+        -------
+        evaluation : ccp.Evaluation
+            Evaluation object.
+        """
         with zipfile.ZipFile(path, "r") as zip_file:
+            file_names = zip_file.namelist()
+            file_format = {"version": 1}
+            if "format.toml" in file_names:
+                file_format = toml.loads(zip_file.read("format.toml").decode("utf-8"))
+            version = file_format["version"]
+            if version > EVALUATION_FORMAT_VERSION:
+                raise ValueError(
+                    f"Evaluation file version {version} is not supported by this "
+                    f"version of ccp (max. version {EVALUATION_FORMAT_VERSION})."
+                )
+
             # load args
             # create file object to read the toml file
             args_dict = toml.loads(zip_file.read("args.toml").decode("utf-8"))
@@ -407,50 +522,121 @@ class Evaluation:
             data = pd.read_parquet(zip_file.open("data.parquet"))
             # load dataframe
             df = pd.read_parquet(zip_file.open("df.parquet"))
-            # load impellers
-            impellers = []
-            for i in range(len(zip_file.filelist)):
-                if (
-                    zip_file.filelist[i].filename.startswith("imp_")
-                    and "new" not in zip_file.filelist[i].filename
-                ):
-                    with zip_file.open(
-                        zip_file.filelist[i].filename, "r"
-                    ) as pickle_file:
-                        impellers.append(pickle.load(pickle_file))
-            # load impellers_new
-            impellers_new = []
-            for i in range(len(zip_file.filelist)):
-                if zip_file.filelist[i].filename.startswith("imp_new_"):
-                    with zip_file.open(
-                        zip_file.filelist[i].filename, "r"
-                    ) as pickle_file:
-                        impellers_new.append(pickle.load(pickle_file))
-            evaluation = cls(
-                data=data,
-                impellers=impellers,
-                operation_fluid=args_dict["operation_fluid"],
-                data_units=args_dict["data_units"],
-                window=args_dict["window"],
-                temperature_fluctuation=args_dict["temperature_fluctuation"],
-                pressure_fluctuation=args_dict["pressure_fluctuation"],
-                speed_fluctuation=args_dict["speed_fluctuation"],
-                impellers_new=impellers_new,
-                df=df,
+
+            if version == 1:
+                impellers, impellers_new = _load_pickled_impellers(zip_file, file_names)
+            else:
+                _warn_different_settings(file_format)
+                impellers_table = pd.read_parquet(zip_file.open("impellers.parquet"))
+                units = file_format["units"]
+                impellers = LazyImpellerList(
+                    impellers_table[impellers_table["group"] == "impellers"], units
+                )
+                impellers_new = LazyImpellerList(
+                    impellers_table[impellers_table["group"] == "impellers_new"],
+                    units,
+                )
+
+        evaluation = cls(
+            data=data,
+            impellers=impellers,
+            operation_fluid=args_dict["operation_fluid"],
+            data_units=args_dict["data_units"],
+            window=args_dict["window"],
+            temperature_fluctuation=args_dict["temperature_fluctuation"],
+            pressure_fluctuation=args_dict["pressure_fluctuation"],
+            speed_fluctuation=args_dict["speed_fluctuation"],
+            impellers_new=impellers_new,
+            df=df,
+        )
+        evaluation.impellers_new = impellers_new
+
+        return evaluation
+
+
+# version 1: pickled impellers, version 2: table with the results of the points
+EVALUATION_FORMAT_VERSION = 2
+
+
+class LazyImpellerList(Sequence):
+    """Read-only list of impellers created from a table of points on first access.
+
+    Parameters
+    ----------
+    table : pandas.DataFrame
+        Table with one row per point, as created by Evaluation.save.
+    units : dict
+        Units of the columns of the table.
+    """
+
+    def __init__(self, table, units):
+        self._tables = [
+            impeller_table.drop(columns=["group", "impeller"])
+            for _, impeller_table in table.groupby("impeller", sort=True)
+        ]
+        self._units = units
+        self._impellers = {}
+
+    def __len__(self):
+        return len(self._tables)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self[i] for i in range(*item.indices(len(self)))]
+        if item < 0:
+            item += len(self)
+        if item not in self._impellers:
+            self._impellers[item] = Impeller(
+                _results_from_frame(self._tables[item], self._units)
             )
-            evaluation.impellers_new = impellers_new
+        return self._impellers[item]
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(n_impellers={len(self)})"
+
+
+def _warn_different_settings(file_format):
+    """Warn if the file was saved with another EOS or polytropic method."""
+    current = {
+        "EOS": ccp.config.EOS,
+        "polytropic_method": ccp.config.POLYTROPIC_METHOD,
+    }
+    different = {
+        k: (file_format[k], v) for k, v in current.items() if file_format[k] != v
+    }
+    if different:
+        warnings.warn(
+            f"Evaluation saved with different settings (saved, current): "
+            f"{different}. The saved points keep the saved settings."
+        )
+
+
+def _load_pickled_impellers(zip_file, file_names):
+    """Load impellers saved as pickle files (version 1 of the evaluation file)."""
+    impellers = {}
+    impellers_new = {}
+    for file_name in file_names:
+        if not file_name.endswith(".pickle"):
+            continue
+        name, index = file_name[: -len(".pickle")].rsplit("_", 1)
+        target = {"imp": impellers, "imp_new": impellers_new}[name]
+        with zip_file.open(file_name, "r") as pickle_file:
+            target[int(index)] = pickle.load(pickle_file)
 
-            return evaluation
+    return (
+        [impellers[i] for i in sorted(impellers)],
+        [impellers_new[i] for i in sorted(impellers_new)],
+    )
 
 
 def create_points_parallel(x):
     if not x["valid"]:
         return None
-    # delete arguments not used for point calculation
-    del x["imp_new"]
-    del x["valid"]
+    # remove arguments not used for point calculation without changing x, which
+    # is shared with get_interpolated_point when using the thread backend
+    point_args = {k: v for k, v in x.items() if k not in ["imp_new", "valid"]}
     try:
-        p = Point(**x)
+        p = Point(**point_args)
     except:
         print("Error for point with args:", x)
         return None
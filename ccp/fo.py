@@ -1,7 +1,10 @@
 """Flow orifice."""
 
+import warnings
+from copy import copy
+
 import numpy as np
-from scipy.optimize import newton
+from ccp.profiling import newton
 from ccp.config.units import check_units
 from ccp import Q_
 
@@ -65,10 +68,7 @@ class FlowOrifice:
         if not state_upstream:
             self.state.update(p=state.p() + delta_p, T=state.T())
 
-        if tappings == "corner" or tappings == "D D/2" or tappings == "flange":
-            pass
-        else:
-            raise ValueError('tappings must be "corner", "D D/2" or "flange"')
+        _check_tappings(tappings)
         if flow_m is None and flow_v is None and qm is None:
             self.flow_m = getattr(self, "calc_flow")()
             # keep qm as attribute for backward compatibility
@@ -87,40 +87,14 @@ class FlowOrifice:
         state = self.state
         p1 = state.p()
         p2 = p1 - delta_p
-        beta = d / D
+        beta = (d / D).to("dimensionless").m
         mu = state.viscosity()
         rho = state.rho()
         k = state.kv()
-        e = 1 - (0.351 + 0.256 * (beta**4) + 0.93 * (beta**8)) * (
-            1 - (p2 / p1) ** (1 / k)
-        )
-        if tappings == "corner":
-            L1 = L2 = 0
-        elif tappings == "D D/2":
-            L1 = 1
-            L2 = 0.47
-        elif tappings == "flange":
-            L1 = L2 = Q_(0.0254, "m") / D
-        M2 = 2 * L2 / (1 - beta)
+        e = expansibility(beta, p1.m, p2.m, k.m)
 
         def update_Reyn(Reyn):
-            Reyn = Q_(Reyn, "dimensionless")
-            # calc C
-            C = (
-                0.5961
-                + 0.0261 * beta**2
-                - 0.216 * beta**8
-                + 0.000521 * (1e6 * beta / Reyn) ** 0.7
-                + (0.0188 + 0.0063 * (19000 * beta / Reyn) ** 0.8)
-                * beta**3.5
-                * (1e6 / Reyn) ** 0.3
-                + (0.043 + 0.080 * np.e ** (-10 * L1) - 0.123 * np.e ** (-7 * L1))
-                * (1 - 0.11 * (19000 * beta / Reyn) ** 0.8)
-                * (beta**4 / (1 - beta**4))
-                - 0.031 * (M2 - 0.8 * M2**1.1) * beta**1.3
-            )
-            if D < Q_(71.12, "mm"):
-                C += 0.011 * (0.75 - beta) * (2.8 - D / Q_(25.4, "mm"))
+            C = discharge_coefficient(beta, Reyn, D.m, tappings)
             self.flow_m = (
                 C
                 / (np.sqrt(1 - beta**4))
@@ -130,7 +104,278 @@ class FlowOrifice:
                 * np.sqrt(2 * delta_p * rho)
             )
             Reyn_qm = (4 * self.flow_m / (mu * np.pi * D)).to("dimensionless").magnitude
-            return abs(Reyn_qm - Reyn.magnitude)
+            return abs(Reyn_qm - Reyn)
 
         newton(update_Reyn, 1e8, tol=1e-5)
         return self.flow_m.to("kg/s")
+
+    @classmethod
+    @check_units
+    def solve(
+        cls,
+        state=None,
+        D=None,
+        find="d",
+        d=None,
+        delta_p=None,
+        flow_m=None,
+        flow_v=None,
+        tappings="flange",
+        state_upstream=True,
+    ):
+        """Solve the orifice equation for the bore or the pressure drop.
+
+        The forward calculation done when a FlowOrifice is instantiated returns the
+        flow for a given bore and pressure drop. This method solves the same
+        Reader-Harris/Gallagher equation the other way around, which is useful to
+        size the orifice bore for a test stand or to predict the pressure drop
+        across the whole compressor map. Flows, pressure drops and bores can be
+        given as arrays and all of them are solved in a single vectorized pass.
+
+        Parameters
+        ----------
+        state : ccp.State, list
+            State of the fluid. A list of states (one for each flow) can also be
+            given.
+        D : float, pint.Quantity
+            Pipe diameter (m).
+        find : str, optional
+            Parameter to be calculated. Options are "d" (orifice diameter) or
+            "delta_p" (pressure drop across the orifice).
+            Default is "d".
+        d : float, pint.Quantity, array, optional
+            Orifice diameter (m). Required if find="delta_p".
+        delta_p : float, pint.Quantity, array, optional
+            Pressure drop across the orifice (Pa). Required if find="d".
+        flow_m : float, pint.Quantity, array, optional
+            Mass flow (kg/s).
+        flow_v : float, pint.Quantity, array, optional
+            Volumetric flow at the upstream condition (m³/s).
+        tappings : str, optional
+            Tappings of the orifice.
+            Default is "flange".
+        state_upstream : bool, optional
+            If the state given is upstream the flow orifice the value is True.
+            If it is downstream, the value should be false.
+            Default is True.
+
+        Returns
+        -------
+        result : pint.Quantity
+            Orifice diameter (m) if find="d" or pressure drop (Pa) if
+            find="delta_p".
+
+        Examples
+        --------
+        >>> import ccp
+        >>> Q_ = ccp.Q_
+        >>> fluid = {"R134A": 0.018, "R1234ZE": 31.254, "N2": 67.588, "o2": 1.14}
+        >>> state = ccp.State(p=Q_(10, "bar"), T=Q_(40, "degC"), fluid=fluid)
+        >>> d = ccp.FlowOrifice.solve(
+        ...     state=state,
+        ...     D=Q_(250, "mm"),
+        ...     find="d",
+        ...     delta_p=Q_(0.1, "bar"),
+        ...     flow_m=Q_(36408.68715534, "kg/h"),
+        ... )
+        >>> round(d.to("mm").m, 3)
+        170.0
+        """
+        _check_tappings(tappings)
+        if find not in ("d", "delta_p"):
+            raise ValueError('find must be "d" or "delta_p"')
+        if flow_m is None and flow_v is None:
+            raise ValueError("Either flow_m or flow_v must be defined.")
+        given = delta_p if find == "d" else d
+        if given is None:
+            missing = "delta_p" if find == "d" else "d"
+            raise ValueError(f'{missing} must be given to solve for find="{find}".')
+
+        if isinstance(state, (list, tuple, np.ndarray)):
+            states = list(state)
+            states_shape = (len(states),)
+        else:
+            states = [state]
+            states_shape = ()
+        flow = flow_m if flow_m is not None else flow_v
+        shape = np.broadcast_shapes(np.shape(flow.m), np.shape(given.m), states_shape)
+        D = D.m
+
+        def upstream_properties(delta_p):
+            """Arrays with p1, rho, mu and k for the upstream condition."""
+            if state_upstream:
+                # one flash per state, shared by all flows
+                properties = np.array([_state_properties(s) for s in states]).T
+                if not states_shape:
+                    properties = properties[:, 0]
+                return [np.broadcast_to(x, shape) for x in properties]
+
+            properties = np.empty((4,) + shape)
+            delta_p = np.broadcast_to(delta_p, shape)
+            for i in np.ndindex(shape):
+                s = copy(states[i[-1]] if states_shape else states[0])
+                s.update(p=s.p().m + delta_p[i], T=s.T())
+                properties[(slice(None),) + i] = _state_properties(s)
+            return properties
+
+        def mass_flow(rho):
+            if flow_m is not None:
+                return np.broadcast_to(flow_m.m, shape)
+            return np.broadcast_to(flow_v.m, shape) * rho
+
+        if find == "d":
+            delta_p = np.broadcast_to(delta_p.m, shape)
+            p1, rho, mu, k = upstream_properties(delta_p)
+            qm = mass_flow(rho)
+            # pipe reynolds depends only on the flow, not on the orifice bore
+            reynolds = 4 * qm / (mu * np.pi * D)
+
+            def residual(beta):
+                C = discharge_coefficient(beta, reynolds, D, tappings)
+                return _flow_m(C, beta, D, delta_p, p1, rho, k) / qm - 1
+
+            # flow increases monotonically with beta, so bisection is robust for
+            # every flow in the array at once
+            lower = np.full(shape, 1e-3)
+            upper = np.full(shape, 1 - 1e-3)
+            for _ in range(60):
+                beta = (lower + upper) / 2
+                too_small = residual(beta) < 0
+                lower = np.where(too_small, beta, lower)
+                upper = np.where(too_small, upper, beta)
+            beta = np.where(residual(upper) < 0, np.nan, (lower + upper) / 2)
+
+            if np.any(np.isnan(beta)):
+                warnings.warn(
+                    "No orifice diameter can pass the required flow with the given "
+                    "delta_p. Result is nan for these flows."
+                )
+            if np.any((beta < 0.1) | (beta > 0.75)):
+                warnings.warn(
+                    "Diameter ratio outside the 0.1 ~ 0.75 range covered by the "
+                    "Reader-Harris/Gallagher equation."
+                )
+            result = Q_(beta * D, "m")
+        else:
+            beta = np.broadcast_to(d.m, shape) / D
+            # first pass uses the given state, which is exact if it is upstream
+            delta_p = np.zeros(shape)
+            for _ in range(10):
+                p1, rho, mu, k = upstream_properties(delta_p)
+                qm = mass_flow(rho)
+                reynolds = 4 * qm / (mu * np.pi * D)
+                C = discharge_coefficient(beta, reynolds, D, tappings)
+
+                def residual(x):
+                    return _flow_m(C, beta, D, x, p1, rho, k) / qm - 1
+
+                # incompressible estimate (e = 1) as initial guess
+                x0 = (
+                    qm * np.sqrt(1 - beta**4) / (C * (np.pi / 4) * (beta * D) ** 2)
+                ) ** 2 / (2 * rho)
+                delta_p_new = newton(residual, x0, tol=1e-6, maxiter=100)
+                converged = np.allclose(delta_p_new, delta_p, rtol=1e-9)
+                delta_p = delta_p_new
+                if state_upstream or converged:
+                    break
+
+            result = Q_(delta_p, "Pa")
+
+        if result.m.ndim == 0:
+            result = Q_(float(result.m), result.units)
+
+        return result
+
+
+def _state_properties(state):
+    """Pressure, density, viscosity and isentropic exponent in SI units."""
+    return state.p().m, state.rho().m, state.viscosity().m, state.kv().m
+
+
+def _check_tappings(tappings):
+    if tappings not in ("corner", "D D/2", "flange"):
+        raise ValueError('tappings must be "corner", "D D/2" or "flange"')
+
+
+def _tapping_lengths(tappings, D):
+    """Return the L1 and L2 tapping spacing ratios for a pipe diameter D (m)."""
+    if tappings == "corner":
+        L1 = L2 = 0
+    elif tappings == "D D/2":
+        L1 = 1
+        L2 = 0.47
+    elif tappings == "flange":
+        L1 = L2 = 0.0254 / D
+    return L1, L2
+
+
+def expansibility(beta, p1, p2, k):
+    """Expansibility factor as per ISO 5167-2.
+
+    Parameters
+    ----------
+    beta : float, array
+        Diameter ratio d/D.
+    p1 : float, array
+        Upstream pressure (Pa).
+    p2 : float, array
+        Downstream pressure (Pa).
+    k : float, array
+        Isentropic exponent.
+
+    Returns
+    -------
+    e : float, array
+        Expansibility factor (dimensionless).
+    """
+    return 1 - (0.351 + 0.256 * (beta**4) + 0.93 * (beta**8)) * (
+        1 - (p2 / p1) ** (1 / k)
+    )
+
+
+def discharge_coefficient(beta, reynolds, D, tappings="flange"):
+    """Discharge coefficient from the Reader-Harris/Gallagher equation.
+
+    Parameters
+    ----------
+    beta : float, array
+        Diameter ratio d/D.
+    reynolds : float, array
+        Pipe Reynolds number.
+    D : float
+        Pipe diameter (m).
+    tappings : str, optional
+        Tappings of the orifice.
+        Default is "flange".
+
+    Returns
+    -------
+    C : float, array
+        Discharge coefficient (dimensionless).
+    """
+    L1, L2 = _tapping_lengths(tappings, D)
+    M2 = 2 * L2 / (1 - beta)
+    C = (
+        0.5961
+        + 0.0261 * beta**2
+        - 0.216 * beta**8
+        + 0.000521 * (1e6 * beta / reynolds) ** 0.7
+        + (0.0188 + 0.0063 * (19000 * beta / reynolds) ** 0.8)
+        * beta**3.5
+        * (1e6 / reynolds) ** 0.3
+        + (0.043 + 0.080 * np.e ** (-10 * L1) - 0.123 * np.e ** (-7 * L1))
+        * (1 - 0.11 * (19000 * beta / reynolds) ** 0.8)
+        * (beta**4 / (1 - beta**4))
+        - 0.031 * (M2 - 0.8 * M2**1.1) * beta**1.3
+    )
+    if D < 0.07112:
+        C += 0.011 * (0.75 - beta) * (2.8 - D / 0.0254)
+    return C
+
+
+def _flow_m(C, beta, D, delta_p, p1, rho, k):
+    """Mass flow (kg/s) from the orifice equation with all values in SI units."""
+    e = expansibility(beta, p1, p1 - delta_p, k)
+    return (C / np.sqrt(1 - beta**4) * e * (np.pi / 4) * (beta * D) ** 2) * np.sqrt(
+        2 * delta_p * rho
+    )
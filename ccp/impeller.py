@@ -10,16 +10,18 @@ from itertools import groupby
 from pathlib import Path
 
 import numpy as np
-import plotly.graph_objects as go
-from openpyxl import Workbook
 from scipy.interpolate import interp1d, UnivariateSpline, PchipInterpolator
-from scipy.optimize import fsolve
 
-from ccp import Q_, State, Point, Curve
+import ccp.config
+from ccp import Q_, State, Point, PointTable, Curve, parallel, polytropic
 from ccp.config.units import check_units
 from ccp.config.utilities import r_getattr, r_setattr
+from ccp.curve import _warm_started
+from ccp.point import disch_from_suc_disch_p_eff
+from ccp.profiling import fixed_point, fsolve
 from ccp.data_io.read_csv import read_data_from_engauge_csv
-from ccp.plotly_theme import tableau_colors
+from ccp.envelope import calc_envelope
+from ccp.plotly_theme import go, tableau_colors
 
 
 class ImpellerStateParameter:
@@ -443,6 +445,49 @@ class Impeller:
         if flow_m:
             flow_v = current_curve.points[0].suc.v() * flow_m
 
+        (point,) = self._points_from_curve(
+            current_curve, Q_([flow_v.m], flow_v.units), speed
+        )
+
+        return point
+
+    @check_units
+    def point_many(self, flow_v=None, flow_m=None, speed=None):
+        """Calculate several points with the same speed in the performance map.
+
+        This is equivalent to calling Impeller.point for each flow, but the curve
+        for this speed is calculated only once and the discharge conditions are
+        interpolated for all flows at the same time.
+
+        Parameters
+        ----------
+        flow_v : pint.Quantity, array
+            Volumetric flows (m³/s).
+        flow_m : pint.Quantity, array
+            Mass flows (kg/s).
+        speed : pint.Quantity, float
+            Speed (rad/s).
+
+        Returns
+        -------
+        points : ccp.PointTable
+            Points in the performance map, in the same order as the flows.
+        """
+        if speed is None:
+            raise ValueError("Speed must be defined.")
+        if flow_v is None and flow_m is None:
+            raise ValueError("Either flow_v or flow_m must be defined.")
+
+        current_curve = self.curve(speed)
+        if flow_m is not None:
+            flow_v = current_curve.points[0].suc.v() * np.atleast_1d(flow_m)
+
+        return PointTable(
+            self._points_from_curve(current_curve, np.atleast_1d(flow_v), speed)
+        )
+
+    def _points_from_curve(self, current_curve, flow_v, speed):
+        """Points of current_curve for an array of volumetric flows."""
         func_T = interp1d(
             current_curve.flow_v.m, current_curve.disch.T().m, fill_value="extrapolate"
         )
@@ -452,11 +497,11 @@ class Impeller:
 
         min_flow_v = min(current_curve.flow_v)
         max_flow_v = max(current_curve.flow_v)
-        if flow_v < min_flow_v or max_flow_v < flow_v:
+        for flow in flow_v[(flow_v < min_flow_v) | (max_flow_v < flow_v)]:
             warnings.warn(
                 f"Expected point is being extrapolated.\n"
                 f"Interpolation limits: {min_flow_v:.3f~P} ~ {max_flow_v:.3f~P}\n"
-                f"Expected point flow: {flow_v:.3f~P}"
+                f"Expected point flow: {flow:.3f~P}"
             )
 
         flow_at_min_p = (
@@ -471,46 +516,311 @@ class Impeller:
         ) / 4
 
         # Extrapolation code for choke region
-        if flow_v <= max_flow_v:
-            disch_p = func_p(flow_v)
-        elif flow_v.m < flow_at_min_p:
-            disch_p = round(
-                current_curve[-1].disch.p().m
-                + np.exp(4 * current_curve[-1].flow_v.m)
-                - np.exp(4 * flow_v.m),
-                2,
+        flow = flow_v.to(current_curve.flow_v.units).m
+        interpolated = flow <= max_flow_v.m
+        choke = np.exp(4 * current_curve[-1].flow_v.m) - np.exp(4 * flow)
+        disch_p = np.select(
+            [interpolated, flow < flow_at_min_p],
+            [
+                func_p(flow),
+                np.round(current_curve[-1].disch.p().m + choke, 2),
+            ],
+            default=0.001,
+        )
+        disch_T = np.select(
+            [interpolated, flow < flow_at_min_T],
+            [
+                func_T(flow),
+                np.round(current_curve[-1].disch.T().m + choke, 2),
+            ],
+            default=current_curve.points[0].suc.T().m,
+        )
+
+        p0 = self.points[0]
+        power_losses = current_curve.power_losses
+
+        points = []
+        for flow_v_, disch_p_, disch_T_ in zip(flow_v, disch_p, disch_T):
+            disch = State(p=disch_p_, T=disch_T_, fluid=p0.suc.fluid)
+            point = Point(
+                suc=p0.suc,
+                disch=disch,
+                flow_v=flow_v_,
+                speed=speed,
+                b=p0.b,
+                D=p0.D,
+                power_losses=power_losses,
             )
-        else:
-            disch_p = 0.001
+            points.append(point)
 
-        if flow_v <= max_flow_v:
-            disch_T = func_T(flow_v)
-        elif flow_v.m < flow_at_min_T:
-            disch_T = round(
-                current_curve[-1].disch.T().m
-                + np.exp(4 * current_curve[-1].flow_v.m)
-                - np.exp(4 * flow_v.m),
-                2,
+        return points
+
+    @check_units
+    def envelope(self, min_head=None, max_power=None, extrapolate=False):
+        """Calculate the operating envelope in the volumetric flow x head plane.
+
+        The envelope is limited by the minimum and maximum speed curves, the surge
+        line and, for each curve, the lowest flow between the stonewall (last point
+        of the curve), the flow where the head reaches min_head and the flow where
+        the power reaches max_power. The result is cached for each set of
+        arguments.
+
+        Parameters
+        ----------
+        min_head : pint.Quantity, float, optional
+            Minimum head (J/kg).
+        max_power : pint.Quantity, float, optional
+            Maximum power (W).
+        extrapolate : bool, optional
+            If True, the curves are linearly extrapolated after the last point
+            (choke region) until they reach min_head or max_power, instead of
+            being limited by the stonewall. Default is False.
+
+        Returns
+        -------
+        envelope : ccp.envelope.Envelope
+            The envelope, with the lines (surge, stonewall etc.) and the contains
+            method to check if points are inside the envelope.
+
+        Examples
+        --------
+        >>> import ccp
+        >>> imp = ccp.impeller_example()
+        >>> envelope = imp.envelope(min_head=Q_(40, "kJ/kg"))
+        >>> envelope.contains(flow_v=Q_(5, "m³/s"), head=Q_(90, "kJ/kg"))
+        True
+        """
+        key = (
+            None if min_head is None else min_head.m,
+            None if max_power is None else max_power.m,
+            extrapolate,
+        )
+        # impellers pickled by older versions (e.g. in an ImpellerCache) do not
+        # have the cache attribute
+        envelopes = self.__dict__.setdefault("_envelopes", {})
+        if key not in envelopes:
+            envelopes[key] = calc_envelope(
+                self.curves,
+                min_head=key[0],
+                max_power=key[1],
+                extrapolate=extrapolate,
+            )
+
+        return envelopes[key]
+
+    @check_units
+    def locate(
+        self,
+        flow_v=None,
+        flow_m=None,
+        head=None,
+        disch_p=None,
+        suc=None,
+        suc_p=None,
+        suc_T=None,
+    ):
+        """Locate samples on the performance map (inverse of Impeller.point).
+
+        For each sample with a flow and a head (or discharge pressure) the speed
+        and the expected efficiency are calculated. The curves between each pair
+        of speeds are interpolated as in Impeller.curve, and these curves are
+        calculated once and cached, so arrays with many samples (e.g. historian
+        data) are located with vectorized interpolations, without creating states
+        or points.
+
+        Impeller.curve interpolates the discharge pressure and temperature, while
+        here the head and efficiency of the interpolated curves are interpolated
+        directly, so located speeds differ slightly (~0.1 %) from Impeller.point
+        when the head is used, and match it when the discharge pressure is used
+        without a suction.
+
+        Parameters
+        ----------
+        flow_v : pint.Quantity, array, optional
+            Volumetric flow (m³/s).
+        flow_m : pint.Quantity, array, optional
+            Mass flow (kg/s), converted to volumetric flow with the suction of
+            each sample (or the map suction if no suction is given).
+        head : pint.Quantity, array, optional
+            Polytropic head (J/kg).
+        disch_p : pint.Quantity, array, optional
+            Discharge pressure (Pa). Without a suction, the samples must have the
+            same suction as the map. With a suction, the head of each sample is
+            calculated iteratively with the efficiency located on the map, which
+            solves the discharge state of each sample.
+        suc : ccp.State, list, optional
+            Suction state of all samples or of each sample.
+        suc_p, suc_T : pint.Quantity, array, optional
+            Suction pressure (Pa) and temperature (degK) of each sample, with the
+            fluid of the map, used instead of suc.
+
+        Returns
+        -------
+        location : dict
+            Dict with "speed", "eff", "flow_v" and the head or disch_p arrays
+            (and head, if disch_p and a suction are given), and "extrapolated",
+            which is True for samples outside the speed range of the map or with
+            flows below the surge or above the stonewall flow at their speed.
+
+        Examples
+        --------
+        >>> import ccp
+        >>> imp = ccp.impeller_example()
+        >>> p = imp.point(flow_v=Q_(5, "m³/s"), speed=Q_(9000, "RPM"))
+        >>> location = imp.locate(flow_v=[p.flow_v.m], head=[p.head.m])
+        >>> location["speed"].to("RPM").m.round(-2)
+        array([9000.])
+        """
+        if (flow_v is None) == (flow_m is None):
+            raise ValueError("Either flow_v or flow_m must be defined.")
+        if (head is None) == (disch_p is None):
+            raise ValueError("Either head or disch_p must be defined.")
+        if suc is not None and (suc_p is not None or suc_T is not None):
+            raise ValueError("Either suc or suc_p and suc_T must be defined.")
+        if (suc_p is None) != (suc_T is None):
+            raise ValueError("suc_p and suc_T must be defined together.")
+
+        sucs = None
+        if suc is not None:
+            sucs = [suc] if isinstance(suc, State) else list(suc)
+            suc_properties = polytropic.properties(sucs)
+        elif suc_p is not None:
+            suc_properties = polytropic.properties_from_pT(
+                suc_p.m, suc_T.m, self.points[0].suc.fluid
             )
+
+        if flow_m is None:
+            x = np.atleast_1d(flow_v.m).astype(float)
+        elif sucs is None and suc_p is None:
+            x = np.atleast_1d((flow_m * self.points[0].suc.v()).m).astype(float)
         else:
-            disch_T = current_curve.points[0].suc.T().m
+            x = np.atleast_1d(flow_m.m) / suc_properties["rho"]
+        if head is not None:
+            attr, value = "head", head
+        else:
+            attr, value = "disch.p", disch_p
+        y = np.atleast_1d(value.m).astype(float)
+        x, y = np.broadcast_arrays(x, y)
+
+        location = {}
+        if attr == "disch.p" and (sucs is not None or suc_p is not None):
+            location["disch_p"] = value
+            y = self._head_from_disch_p(x, y, sucs, suc_properties)
+            attr, value = "head", Q_(y, "J/kg")
+
+        speed, eff, extrapolated = self._locate(attr, x, y)
+
+        return {
+            "speed": Q_(speed, "rad/s"),
+            "eff": Q_(eff, "dimensionless"),
+            "flow_v": Q_(x, "m³/s"),
+            **location,
+            attr.replace(".", "_"): value,
+            "extrapolated": extrapolated,
+        }
 
-        p0 = self.points[0]
-        disch = State(p=disch_p, T=disch_T, fluid=p0.suc.fluid)
+    def _locate(self, attr, x, y):
+        """Speed, efficiency and extrapolated arrays for flow_v (x) and attr (y)."""
+        speeds, flows, values, effs = self._curve_family(attr)
+
+        # value of each curve at the sample flows (n_curves, n_samples)
+        curve_values = np.array([_interp(x, f, v) for f, v in zip(flows, values)])
+        curve_effs = np.array([_interp(x, f, e) for f, e in zip(flows, effs)])
+
+        # curves with values just below and above the sample value
+        idx = np.sum(curve_values <= y, axis=0) - 1
+        extrapolated = (idx < 0) | (idx >= len(speeds) - 1)
+        idx = np.clip(idx, 0, len(speeds) - 2)
+        samples = np.arange(len(y))
+        v0, v1 = curve_values[idx, samples], curve_values[idx + 1, samples]
+        factor = (y - v0) / (v1 - v0)
+
+        speed = speeds[idx] + factor * (speeds[idx + 1] - speeds[idx])
+        eff = curve_effs[idx, samples] + factor * (
+            curve_effs[idx + 1, samples] - curve_effs[idx, samples]
+        )
 
-        power_losses = current_curve.power_losses
+        # surge and stonewall flows at the located speed
+        flow_min = np.array([f[0] for f in flows])
+        flow_max = np.array([f[-1] for f in flows])
+        surge = flow_min[idx] + factor * (flow_min[idx + 1] - flow_min[idx])
+        stonewall = flow_max[idx] + factor * (flow_max[idx + 1] - flow_max[idx])
+        extrapolated |= (x < surge) | (x > stonewall)
 
-        point = Point(
-            suc=p0.suc,
-            disch=disch,
-            flow_v=flow_v,
-            speed=speed,
-            b=p0.b,
-            D=p0.D,
-            power_losses=power_losses,
+        return speed, eff, extrapolated
+
+    def _head_from_disch_p(self, flow_v, disch_p, sucs, suc_properties):
+        """Head (J/kg) of samples with their own suction and discharge pressure.
+
+        The discharge state of each sample is calculated with the efficiency
+        located on the map for the sample head, iterating until the efficiency
+        converges.
+        """
+        n = len(disch_p)
+        method = self.points[0].head_calc_func.__name__[len("head_pol_") :]
+        head_calc_func = self.points[0].head_calc_func
+        if sucs is None:
+            suc_p, suc_T = np.broadcast_arrays(
+                suc_properties["p"], suc_properties["T"], np.empty(n)
+            )[:2]
+            scratch = State(p=suc_p[0], T=suc_T[0], fluid=self.points[0].suc.fluid)
+        elif len(sucs) == 1:
+            sucs = sucs * n
+
+        head = np.empty(n)
+        for i in range(n):
+            if sucs is None:
+                scratch.update(p=suc_p[i], T=suc_T[i])
+                suc = scratch
+            else:
+                suc = sucs[i]
+
+            def located_eff(eff):
+                disch = disch_from_suc_disch_p_eff(
+                    suc, Q_(disch_p[i], "Pa"), eff, polytropic_method=method
+                )
+                head[i] = head_calc_func(suc, disch).m
+                return self._locate("head", flow_v[i : i + 1], head[i : i + 1])[1][0]
+
+            eff_0 = np.mean([curve.eff.m for curve in self.curves])
+            fixed_point(located_eff, eff_0, rtol=1e-6)
+
+        return head
+
+    def _curve_family(self, attr):
+        """Cached curves interpolated between the speeds (see _curve_family)."""
+        # impellers pickled before this cache was added do not have the attribute
+        families = self.__dict__.setdefault("_curve_families", {})
+        if attr not in families:
+            families[attr] = _curve_family(self.curves, attr)
+
+        return families[attr]
+
+    def _head_eff(self, flow_v, speed):
+        """Head (J/kg) and efficiency for arrays of flow_v (m³/s) and speed (rad/s).
+
+        The values are linearly interpolated in the curves used by Impeller.locate,
+        extrapolating outside the map, so no states or points are created.
+        """
+        speeds, flows, heads, effs = self._curve_family("head")
+        flow_v, speed = np.broadcast_arrays(
+            np.atleast_1d(flow_v).astype(float), np.atleast_1d(speed).astype(float)
         )
 
-        return point
+        curve_heads = np.array([_interp(flow_v, f, h) for f, h in zip(flows, heads)])
+        curve_effs = np.array([_interp(flow_v, f, e) for f, e in zip(flows, effs)])
+
+        idx = np.clip(np.searchsorted(speeds, speed), 1, len(speeds) - 1)
+        samples = np.arange(len(speed))
+        factor = (speed - speeds[idx - 1]) / (speeds[idx] - speeds[idx - 1])
+        head = curve_heads[idx - 1, samples] + factor * (
+            curve_heads[idx, samples] - curve_heads[idx - 1, samples]
+        )
+        eff = curve_effs[idx - 1, samples] + factor * (
+            curve_effs[idx, samples] - curve_effs[idx - 1, samples]
+        )
+
+        return head, eff
 
     @check_units
     def curve(self, speed=None):
@@ -606,6 +916,8 @@ class Impeller:
             A list of impeller can also be passed. In this case the curves will be
             converted based on the impeller with the closest suction speed of sound
             to the new suction condition.
+            A ccp.ImpellerLibrary can also be passed, and the impeller is selected
+            with ImpellerLibrary.nearest.
         suc : ccp.State
             The new suction condition to which we want to convert to.
         find : str, optional
@@ -622,48 +934,119 @@ class Impeller:
         converted_impeller : ccp.Impeller
             The new impeller with the converted performance map for the required
             suction condition.
+
+        Notes
+        -----
+        If ccp.config.IMPELLER_CACHE is set to a ccp.ImpellerCache, the converted
+        impeller is stored on disk and returned directly on subsequent calls with
+        the same arguments.
         """
-        all_converted_points = []
-        if isinstance(original_impeller, list):
-            speed_sound_diff = []
-            for impeller in original_impeller:
-                speed_sound_diff.append(
-                    impeller.points[0].suc.speed_sound().m - suc.speed_sound().m
-                )
-            original_impeller = original_impeller[np.argmin(np.abs(speed_sound_diff))]
+        (converted_impeller,) = cls.convert_from_many(
+            original_impeller, [suc], find=find, speed=speed
+        )
 
-        for curve in original_impeller.curves:
-            with multiprocessing.Pool() as pool:
-                converter_args = [(p, suc, find) for p in curve]
-                converted_points = pool.map(converter, converter_args)
+        return converted_impeller
 
-                if speed is None or speed == "same":
-                    speed_mean = np.mean([p.speed.magnitude for p in converted_points])
-                else:
-                    speed_mean = speed
-
-                converted_points = [
-                    Point.convert_from(
-                        p,
-                        suc=p.suc,
-                        find="volume_ratio",
-                        speed=speed_mean,
-                    )
-                    for p in converted_points
-                ]
+    @classmethod
+    def convert_from_many(
+        cls,
+        original_impeller,
+        sucs,
+        find="speed",
+        speed=None,
+        processes=None,
+        backend=None,
+        callback=None,
+    ):
+        """Convert performance map from an impeller to several suction conditions.
+
+        All curves for all suction conditions are converted in a single pool, with
+        one task for each curve that runs both conversion steps (see
+        Curve.convert_to). With ccp.config.WARM_START = True, the points of each
+        curve are converted in order of flow, using the discharge state of the
+        previous point as initial guess (see Point.solver_calls for the number of
+        iterations).
+
+        Parameters
+        ----------
+        original_impeller : ccp.Impeller, list
+            The original impeller. If a list is passed, each conversion uses the
+            impeller with the closest suction speed of sound to the new suction.
+            If a ccp.ImpellerLibrary is passed, each conversion uses the impeller
+            returned by ImpellerLibrary.nearest.
+        sucs : list
+            List of ccp.State with the new suction conditions.
+        find : str, optional
+            The method in which the curves will be converted.
+            See Impeller.convert_from.
+        speed : float, pint.Quantity, str, optional
+            Desired speed. See Impeller.convert_from.
+        processes : int, optional
+            Maximum number of workers. Default is the number of CPUs,
+            limited to the number of curves.
+        backend : str, optional
+            Parallel backend, "process" or "thread".
+            Default is ccp.config.PARALLEL_BACKEND.
+        callback : callable, optional
+            Function called as callback(done, total), with the number of point
+            conversions, each time a curve conversion is completed.
+
+        Returns
+        -------
+        converted_impellers : list
+            List with one converted ccp.Impeller for each suction condition.
+        """
+        originals = [closest_impeller(original_impeller, suc) for suc in sucs]
+        converted_impellers = [None] * len(sucs)
+
+        cache = ccp.config.IMPELLER_CACHE
+        cache_keys = [None] * len(sucs)
+        if cache is not None:
+            for i, (imp, suc) in enumerate(zip(originals, sucs)):
+                cache_keys[i] = cache.key(imp, suc, find=find, speed=speed)
+                converted_impellers[i] = cache.get(cache_keys[i])
+
+        missing = [i for i, imp in enumerate(converted_impellers) if imp is None]
+        if missing:
+            # one task for each curve of each conversion, with both conversion steps
+            curves = [(i, curve) for i in missing for curve in originals[i].curves]
+            curve_speed = None if speed is None or speed == "same" else speed
+            converter_args = [
+                (curve.points, sucs[i], find, curve_speed) for i, curve in curves
+            ]
+            total = 2 * sum(len(curve) for _, curve in curves)
 
-                all_converted_points += converted_points
+            if processes is None:
+                processes = multiprocessing.cpu_count()
+            processes = max(1, min(processes, len(converter_args)))
+            chunksize = max(1, len(converter_args) // (4 * processes))
 
-        converted_impeller = cls(all_converted_points)
-        if speed == "same":
-            all_converted_points = []
-            for curve in original_impeller.curves:
-                converted_curve = converted_impeller.curve(curve.speed)
-                all_converted_points += converted_curve.points
+            done = 0
+            points_by_conversion = {i: [] for i in missing}
+            with parallel.pool(processes, backend) as pool:
+                results = pool.imap(converter, converter_args, chunksize)
+                for (i, curve), points in zip(curves, results):
+                    points_by_conversion[i] += points
+                    done += 2 * len(curve)
+                    if callback is not None:
+                        callback(done, total)
 
-            converted_impeller = cls(all_converted_points)
+            for i in missing:
+                converted_impeller = cls(points_by_conversion[i])
+                if speed == "same":
+                    all_converted_points = []
+                    for curve in originals[i].curves:
+                        converted_curve = converted_impeller.curve(curve.speed)
+                        all_converted_points += converted_curve.points
 
-        return converted_impeller
+                    converted_impeller = cls(all_converted_points)
+
+                if cache is not None:
+                    cache.put(cache_keys[i], converted_impeller)
+
+                converted_impellers[i] = converted_impeller
+
+        return converted_impellers
 
     def _calc_new_points(self):
         """Calculate new dimensional points based on the suction condition."""
@@ -694,6 +1077,8 @@ class Impeller:
 
     def export_to_excel(self, path_name=None):
         """Export curves to excel file."""
+        from openpyxl import Workbook
+
         wb = Workbook()
         for curve in self.curves:
             sheet_name = f'{curve.speed.to("RPM"):.0f~P}'
@@ -817,6 +1202,7 @@ class Impeller:
             flow_type = "mass"
 
         points = []
+        curves_args = []
 
         curves = {}
         for k, v in args.items():
@@ -845,102 +1231,88 @@ class Impeller:
             for param in parameters
         }
 
-        if "eff" in curves:
-            if max(curves["eff"][speeds[0]]["x2"]) > 1:
-                for speed in speeds:
-                    curves["eff"][speed]["x2"] = [
-                        i / 100 for i in curves["eff"][speed]["x2"]
-                    ]
-
-        # create interpolated curves
-        curves_interpolated = {}
-        # dict to hold interpolated values for specific x values
-        points_interpolated = {}
-
-        for speed in speeds:
-            min_x = 0
-            max_x = 1e20
-            # get min and max flow
-            for n, curve in enumerate(curves):
-                if n == 0:
-                    power_losses = curves[curve][speed]["x3"]
-                else:
-                    if power_losses != curves[curve][speed]["x3"]:
-                        raise ValueError(
-                            f"There should be the same power losses values, for the same speed. \n"
-                            f"Currently we have different values for {speed.to(speed_units):.2f~P} "
-                            f"{speed_units}. \n"
-                            "Please check and try again."
-                        )
+        # flow (converted to flow_units) and values of each curve as arrays, with
+        # the unit conversion done once for each curve
+        curves_x = {}
+        curves_y = {}
+        for curve in curves:
+            curves_x[curve] = {}
+            curves_y[curve] = {}
+            for speed in speeds:
+                flow = Q_(
+                    np.asarray(curves[curve][speed]["x1"], dtype=float),
+                    args[f"flow_units_{curve}"],
+                )
                 if flow_units_list[f"flow_units_{curve}"] != flow_type:
                     if flow_units_list[f"flow_units_{curve}"] == "mass":
-                        flow_curve = [
-                            Q_(flow, args[f"flow_units_{curve}"]) / suc.rho()
-                            for flow in curves[curve][speed]["x1"]
-                        ]
-                        curves[curve][speed]["x1"] = [
-                            flow.to(flow_units).m for flow in flow_curve
-                        ]
+                        flow = flow / suc.rho()
                     else:
-                        flow_curve = [
-                            Q_(flow, args[f"flow_units_{curve}"]) * suc.rho()
-                            for flow in curves[curve][speed]["x1"]
-                        ]
-                        curves[curve][speed]["x1"] = [
-                            flow.to(flow_units).m for flow in flow_curve
-                        ]
-                else:
-                    flow_curve = [
-                        Q_(flow, args[f"flow_units_{curve}"])
-                        for flow in curves[curve][speed]["x1"]
-                    ]
-                    curves[curve][speed]["x1"] = [
-                        flow.to(flow_units).m for flow in flow_curve
-                    ]
-                if curves[curve][speed]["x1"][0] > min_x:
-                    min_x = curves[curve][speed]["x1"][0]
-                if curves[curve][speed]["x1"][-1] < max_x:
-                    max_x = curves[curve][speed]["x1"][-1]
+                        flow = flow * suc.rho()
+                curves_x[curve][speed] = flow.to(flow_units).m
+                curves_y[curve][speed] = np.asarray(
+                    curves[curve][speed]["x2"], dtype=float
+                )
 
-            points_x = np.linspace(min_x, max_x, number_of_points)
+        if "eff" in curves:
+            if curves_y["eff"][speeds[0]].max() > 1:
+                for speed in speeds:
+                    curves_y["eff"][speed] = curves_y["eff"][speed] / 100
 
+        for speed in speeds:
+            power_losses = curves[parameters[0]][speed]["x3"]
             for curve in curves:
-                curves_interpolated[curve] = {}
-                points_interpolated[curve] = {}
+                if power_losses != curves[curve][speed]["x3"]:
+                    raise ValueError(
+                        f"There should be the same power losses values, for the same speed. \n"
+                        f"Currently we have different values for {speed} "
+                        f"{speed_units}. \n"
+                        "Please check and try again."
+                    )
 
-                curves_interpolated[curve][speed] = PchipInterpolator(
-                    curves[curve][speed]["x1"],
-                    curves[curve][speed]["x2"],
-                    extrapolate=True,
-                )
-                points_interpolated[curve][speed] = curves_interpolated[curve][speed](
-                    points_x
+            # flow range covered by all curves
+            min_x = max([0] + [curves_x[curve][speed][0] for curve in curves])
+            max_x = min([1e20] + [curves_x[curve][speed][-1] for curve in curves])
+            points_x = np.linspace(min_x, max_x, number_of_points)
+
+            values = [
+                Q_(
+                    PchipInterpolator(
+                        curves_x[param][speed],
+                        curves_y[param][speed],
+                        extrapolate=True,
+                    )(points_x),
+                    args[f"{param}_units"],
                 )
+                for param in parameters[:2]
+            ]
+            flows = Q_(points_x, flow_units)
+            speed_ = Q_(float(speed), speed_units)
+            power_losses_ = Q_(power_losses, power_losses_units)
 
             args_list = []
-
-            for flow, param0, param1 in zip(
-                points_x,
-                points_interpolated[parameters[0]][speed],
-                points_interpolated[parameters[1]][speed],
-            ):
+            curves_args.append(args_list)
+            for i in range(number_of_points):
                 arg_dict = {
                     "suc": suc,
-                    "speed": Q_(float(speed), speed_units),
-                    parameters[0]: Q_(param0, args[f"{parameters[0]}_units"]),
-                    parameters[1]: Q_(param1, args[f"{parameters[1]}_units"]),
-                    "power_losses": Q_(power_losses, power_losses_units),
+                    "speed": speed_,
+                    parameters[0]: values[0][i],
+                    parameters[1]: values[1][i],
+                    "power_losses": power_losses_,
                     "b": b,
                     "D": D,
                 }
                 if flow_type == "volumetric":
-                    arg_dict["flow_v"] = Q_(flow, flow_units)
+                    arg_dict["flow_v"] = flows[i]
                 elif flow_type == "mass":
-                    arg_dict["flow_m"] = Q_(flow, flow_units)
+                    arg_dict["flow_m"] = flows[i]
                 args_list.append(arg_dict)
 
-            with multiprocessing.Pool() as pool:
-                points += pool.map(create_points_parallel, args_list)
+        tasks = [
+            group for args_list in curves_args for group in _solve_groups(args_list)
+        ]
+        with parallel.pool() as pool:
+            for group_points in pool.map(create_points_parallel, tasks):
+                points += group_points
 
         return cls(points)
 
@@ -1204,23 +1576,28 @@ class Impeller:
             **curves_path_dict,
         )
 
-    def save(self, file):
+    def save(self, file, results=False):
         """Save impeller to a toml file.
 
         Parameters
         ----------
         file : str or pathlib.Path
             Filename to which the data is saved.
+        results : bool, optional
+            If True, the calculated points are also saved, and the impeller is
+            loaded without solving the points again (see Point.save).
+            Default is False.
         """
 
         with open(file, mode="w") as f:
             # add points to file
-            dict_to_save = self._dict_to_save()
+            dict_to_save = self._dict_to_save(results=results)
             toml.dump(dict_to_save, f)
 
-    def _dict_to_save(self):
+    def _dict_to_save(self, results=False):
         dict_to_save = {
-            f"Point{i}": point._dict_to_save() for i, point in enumerate(self.points)
+            f"Point{i}": point._dict_to_save(results=results)
+            for i, point in enumerate(self.points)
         }
         return dict_to_save
 
@@ -1239,9 +1616,7 @@ class Impeller:
             Impeller object.
         """
         parameters = toml.load(file)
-        points = [
-            Point(**Point._dict_from_load(kwargs)) for kwargs in parameters.values()
-        ]
+        points = [Point._from_load(kwargs) for kwargs in parameters.values()]
 
         return cls(points)
 
@@ -1352,6 +1727,62 @@ def system_to_interpolate(x, *args):
     return [eq_1, eq_2]
 
 
+def _curve_family(curves, attr, points_between=10):
+    """Curves used by Impeller.locate and Impeller._head_eff.
+
+    Curves between each pair of speeds are interpolated as in Impeller.curve,
+    moving each point along the line that connects the points with the same index
+    in the two curves.
+
+    Returns
+    -------
+    speeds : np.array
+        Speed of each curve (rad/s).
+    flows, values, effs : list
+        Volumetric flow, attr value and efficiency arrays of each curve.
+    """
+    curves = sorted(curves, key=lambda c: c.speed.m)
+    number_of_points = max(len(c) for c in curves)
+
+    data = []
+    for curve in curves:
+        value = r_getattr(curve, attr)
+        value = value() if callable(value) else value
+        # resample curves with different number of points using the position
+        # along the curve
+        position = np.linspace(0, 1, len(curve))
+        new_position = np.linspace(0, 1, number_of_points)
+        data.append(
+            [
+                curve.speed.m,
+                np.interp(new_position, position, curve.flow_v.m),
+                np.interp(new_position, position, value.m),
+                np.interp(new_position, position, curve.eff.m),
+            ]
+        )
+
+    speeds, flows, values, effs = [], [], [], []
+    for (data0, data1), last in zip(
+        zip(data[:-1], data[1:]), [False] * (len(data) - 2) + [True]
+    ):
+        for factor in np.linspace(0, 1, points_between + 1, endpoint=last):
+            speeds.append(data0[0] + factor * (data1[0] - data0[0]))
+            flows.append(data0[1] + factor * (data1[1] - data0[1]))
+            values.append(data0[2] + factor * (data1[2] - data0[2]))
+            effs.append(data0[3] + factor * (data1[3] - data0[3]))
+
+    return np.array(speeds), flows, values, effs
+
+
+def _interp(x, xp, fp):
+    """Linear interpolation with linear extrapolation from the end segments."""
+    idx = np.clip(np.searchsorted(xp, x), 1, len(xp) - 1)
+    x0, x1 = xp[idx - 1], xp[idx]
+    f0, f1 = fp[idx - 1], fp[idx]
+
+    return f0 + (f1 - f0) * (x - x0) / (x1 - x0)
+
+
 def calculate_power_losses(power_losses_ref, speed_ref, speed):
     return power_losses_ref * (speed / speed_ref) ** 2.5
 
@@ -1390,15 +1821,59 @@ def impeller_example():
     return imp
 
 
+def closest_impeller(impellers, suc):
+    """Get impeller with the closest suction speed of sound to suc.
+
+    Parameters
+    ----------
+    impellers : ccp.Impeller, list, ccp.ImpellerLibrary
+        Impeller, sequence of impellers or impeller library.
+    suc : ccp.State
+        Suction state.
+
+    Returns
+    -------
+    impeller : ccp.Impeller
+        If a single impeller is passed it is returned unchanged. For a library,
+        the impeller returned by ImpellerLibrary.nearest is loaded.
+    """
+    if isinstance(impellers, Impeller):
+        return impellers
+    if hasattr(impellers, "nearest"):
+        return impellers.nearest(suc)
+
+    speed_sound_diff = [
+        impeller.points[0].suc.speed_sound().m - suc.speed_sound().m
+        for impeller in impellers
+    ]
+
+    return impellers[np.argmin(np.abs(speed_sound_diff))]
+
+
 def converter(x):
-    """Helper function used to parallelize conversion of points."""
-    point, suc, find = x
-    return Point.convert_from(point, suc=suc, find=find)
+    """Helper function used to parallelize conversion of the curves."""
+    points, suc, find, speed = x
+    return Curve(points).convert_to(suc, find=find, speed=speed).points
 
 
 def create_points_parallel(x):
-    """Helper function used to parallelize creation of points."""
-    return Point(**x)
+    """Helper function used to parallelize creation of the points of a curve."""
+    return _warm_started(
+        lambda kwargs, disch_guess: Point(**kwargs, disch_guess=disch_guess),
+        x,
+        [kwargs.get("flow_v", kwargs.get("flow_m")).m for kwargs in x],
+    )
+
+
+def _solve_groups(items):
+    """Split the items of a curve in the groups solved by each parallel task.
+
+    With ccp.config.WARM_START the whole curve is solved by one task, so that the
+    points can be warm started. Otherwise each point is a task.
+    """
+    if ccp.config.WARM_START:
+        return [list(items)]
+    return [[item] for item in items]
 
 
 def calc_min_head_point(x, speed, imp, min_head):
@@ -0,0 +1,283 @@
+"""Module with an on-disk library of impellers.
+
+Vendor performance maps are usually available for several suction conditions,
+gas compositions and impeller geometries. The :class:`ImpellerLibrary` stores
+each impeller in a toml file (saved with the calculated results, so loading
+does not solve the points again) and keeps an index with the suction condition,
+composition, speed range and geometry of each impeller. The reference impeller
+for a new condition is selected with a nearest neighbour query on the index and
+only the selected impellers are loaded.
+
+```{code-block} python
+import ccp
+
+library = ccp.ImpellerLibrary("path/to/library")
+library.add(impeller, name="case_a")
+...
+imp_conv = ccp.Impeller.convert_from(library, suc=new_suc)
+```
+"""
+
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ccp.config.units import check_units
+from ccp.config.utilities import lazy_import
+from ccp.impeller import Impeller
+
+spatial = lazy_import("scipy.spatial")
+
+# index columns and the units used to store them
+_index_units = {
+    "suc_p": "Pa",
+    "suc_T": "degK",
+    "speed_sound": "m/s",
+    "molar_mass": "kg/mol",
+    "speed_min": "rad/s",
+    "speed_max": "rad/s",
+    "flow_v_min": "m³/s",
+    "flow_v_max": "m³/s",
+    "b": "m",
+    "D": "m",
+}
+
+
+class ImpellerLibrary:
+    """On-disk library of impellers with an index for nearest neighbour queries.
+
+    The impellers are stored as toml files in the library directory and the
+    index is stored in the index.parquet file. Impellers are only loaded when
+    they are accessed (e.g. library["case_a"]), and the max_loaded most recently
+    used impellers are kept in memory.
+
+    Parameters
+    ----------
+    directory : str or pathlib.Path
+        Directory where the library is stored. It is created if it does not
+        exist.
+    max_loaded : int, optional
+        Maximum number of impellers kept in memory. Default is 32.
+
+    Examples
+    --------
+    >>> import ccp
+    >>> import tempfile
+    >>> library = ccp.ImpellerLibrary(tempfile.mkdtemp())
+    >>> len(library)
+    0
+    """
+
+    index_file = "index.parquet"
+
+    def __init__(self, directory, max_loaded=32):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_loaded = max_loaded
+
+        index_path = self.directory / self.index_file
+        if index_path.is_file():
+            self.index = pd.read_parquet(index_path)
+        else:
+            self.index = pd.DataFrame(
+                columns=["name", "file", *_index_units, "fluid"]
+            ).set_index("name")
+
+        self._loaded = OrderedDict()
+        self._trees = {}
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(directory={str(self.directory)!r}, "
+            f"impellers={len(self)})"
+        )
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, name):
+        return name in self.index.index
+
+    def __iter__(self):
+        return iter(self.names)
+
+    @property
+    def names(self):
+        """Names of the impellers in the library."""
+        return list(self.index.index)
+
+    def __getitem__(self, name):
+        """Load an impeller from the library."""
+        if name in self._loaded:
+            self._loaded.move_to_end(name)
+            return self._loaded[name]
+
+        if name not in self:
+            raise KeyError(name)
+        impeller = Impeller.load(self.directory / self.index.loc[name, "file"])
+
+        self._loaded[name] = impeller
+        while len(self._loaded) > self.max_loaded:
+            self._loaded.popitem(last=False)
+
+        return impeller
+
+    def add(self, impeller, name):
+        """Add an impeller to the library.
+
+        If the library already has an impeller with this name it is replaced.
+
+        Parameters
+        ----------
+        impeller : ccp.Impeller
+            Impeller to be added.
+        name : str
+            Name of the impeller in the library.
+        """
+        file = f"{name}.toml"
+        impeller.save(self.directory / file, results=True)
+
+        suc = impeller.points[0].suc
+        row = {
+            "file": file,
+            "suc_p": suc.p(),
+            "suc_T": suc.T(),
+            "speed_sound": suc.speed_sound(),
+            "molar_mass": suc.molar_mass(),
+            "speed_min": min(curve.speed for curve in impeller.curves),
+            "speed_max": max(curve.speed for curve in impeller.curves),
+            "flow_v_min": min(p.flow_v for p in impeller.points),
+            "flow_v_max": max(p.flow_v for p in impeller.points),
+            "b": impeller.points[0].b,
+            "D": impeller.points[0].D,
+            "fluid": json.dumps(suc.fluid),
+        }
+        for column, units in _index_units.items():
+            row[column] = row[column].to(units).m
+
+        index = self.index.drop(name, errors="ignore")
+        row = pd.DataFrame([row], index=pd.Index([name], name="name"))
+        self.index = pd.concat([index, row]) if len(index) else row
+        self._write_index()
+        self._loaded.pop(name, None)
+        self._trees = {}
+
+    def remove(self, name):
+        """Remove an impeller from the library.
+
+        Parameters
+        ----------
+        name : str
+            Name of the impeller in the library.
+        """
+        (self.directory / self.index.loc[name, "file"]).unlink(missing_ok=True)
+        self.index = self.index.drop(name)
+        self._write_index()
+        self._loaded.pop(name, None)
+        self._trees = {}
+
+    @check_units
+    def query(self, suc, k=1, b=None, D=None, speed=None):
+        """Names of the impellers closest to a suction condition.
+
+        The distance is calculated with the suction speed of sound and molar mass
+        (composition) and, if given, the impeller b and D. Each value is scaled by
+        its standard deviation in the library. The query uses a k-d tree, so only
+        O(log n) index entries are visited.
+
+        Parameters
+        ----------
+        suc : ccp.State
+            Suction state.
+        k : int, optional
+            Number of impellers. Default is 1.
+        b : float, pint.Quantity, optional
+            Impeller width (m).
+        D : float, pint.Quantity, optional
+            Impeller diameter (m).
+        speed : float, pint.Quantity, optional
+            Speed (rad/s). If given, only impellers with curves covering this
+            speed are returned.
+
+        Returns
+        -------
+        names : list
+            Names of the closest impellers, sorted by distance.
+        """
+        if len(self) == 0:
+            raise ValueError("The impeller library is empty.")
+
+        values = {
+            "speed_sound": suc.speed_sound().to(_index_units["speed_sound"]).m,
+            "molar_mass": suc.molar_mass().to(_index_units["molar_mass"]).m,
+        }
+        if b is not None:
+            values["b"] = b.to(_index_units["b"]).m
+        if D is not None:
+            values["D"] = D.to(_index_units["D"]).m
+
+        tree, scale = self._tree(tuple(values))
+        x = np.array(list(values.values())) / scale
+
+        if speed is not None:
+            speed = speed.to(_index_units["speed_min"]).m
+            valid = (self.index["speed_min"] <= speed) & (
+                speed <= self.index["speed_max"]
+            )
+            valid = valid.to_numpy()
+        else:
+            valid = np.ones(len(self), dtype=bool)
+
+        # increase the number of neighbours until k valid impellers are found
+        n = min(k, len(self))
+        while True:
+            _, idx = tree.query(x, k=n)
+            idx = [i for i in np.atleast_1d(idx) if valid[i]]
+            if len(idx) >= k or n == len(self):
+                break
+            n = min(2 * n, len(self))
+
+        return [self.index.index[i] for i in idx[:k]]
+
+    def nearest(self, suc, b=None, D=None, speed=None):
+        """Load the impeller closest to a suction condition.
+
+        See ImpellerLibrary.query for the parameters.
+
+        Returns
+        -------
+        impeller : ccp.Impeller
+            The closest impeller.
+        """
+        names = self.query(suc, k=1, b=b, D=D, speed=speed)
+        if not names:
+            raise ValueError(f"No impeller in the library has curves for {speed}.")
+
+        return self[names[0]]
+
+    def _tree(self, columns):
+        """k-d tree and scale for the index columns."""
+        if columns not in self._trees:
+            data = self.index[list(columns)].to_numpy(dtype=float)
+            scale = data.std(axis=0)
+            scale[scale == 0] = 1.0
+            self._trees[columns] = (spatial.cKDTree(data / scale), scale)
+
+        return self._trees[columns]
+
+    def _write_index(self):
+        # write to a temporary file first so that the index is never partially
+        # written
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(fd)
+        try:
+            self.index.to_parquet(tmp_path)
+            os.replace(tmp_path, self.directory / self.index_file)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
@@ -0,0 +1,80 @@
+"""Module with the worker pools used by the parallel calculations.
+
+Two backends are available:
+
+- "process": a multiprocessing.Pool. Each task pickles its arguments and
+  results (e.g. States and Points), but the calculations run in parallel.
+- "thread": a multiprocessing.pool.ThreadPool. There is no serialization cost
+  and the objects are shared with the caller, which is better for medium-sized
+  workloads and inside the Streamlit server. CoolProp holds the GIL during the
+  EOS calls, so these are not executed in parallel with this backend.
+
+The default backend is set in ccp.config.PARALLEL_BACKEND. The workers run
+with the configuration (EOS, polytropic method etc.) of the thread that
+created the pool. Thread workers also record their calls in the ccp.profile
+active in that thread; process workers are not profiled.
+
+Objects used by all tasks (e.g. a ccp.Train) can be given to pool as shared.
+They are sent once to each worker, instead of with the arguments of each task,
+and are obtained in the worker function with :func:`shared`.
+"""
+
+import multiprocessing
+import threading
+from multiprocessing.pool import ThreadPool
+
+import ccp.config
+from . import profiling
+
+BACKENDS = ("process", "thread")
+
+# object given to pool as shared, set in each worker
+_worker = threading.local()
+
+
+def _init_worker(options, stats=None, shared_object=None):
+    # thread-local for thread workers, process global for process workers
+    ccp.config._thread_local.overrides = options
+    profiling._attach(stats)
+    _worker.shared = shared_object
+
+
+def shared():
+    """Return the object given as shared to the pool of this worker."""
+    return _worker.shared
+
+
+def pool(processes=None, backend=None, shared=None):
+    """Create a pool of workers.
+
+    Parameters
+    ----------
+    processes : int, optional
+        Number of workers. Default is the number of CPUs.
+    backend : str, optional
+        "process" or "thread". Default is ccp.config.PARALLEL_BACKEND.
+    shared : object, optional
+        Object sent once to each worker (pickled once per process with the
+        "process" backend), which is returned by ccp.parallel.shared() in the
+        worker functions.
+
+    Returns
+    -------
+    pool : multiprocessing.pool.Pool
+        Pool (to be used as a context manager) with the map and imap methods.
+    """
+    if backend is None:
+        backend = ccp.config.PARALLEL_BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"backend must be one of {BACKENDS}, not {backend!r}.")
+
+    if backend == "thread":
+        pool_cls, stats = ThreadPool, profiling.current()
+    else:
+        pool_cls, stats = multiprocessing.Pool, None
+
+    return pool_cls(
+        processes,
+        initializer=_init_worker,
+        initargs=(ccp.config.snapshot(), stats, shared),
+    )
@@ -1,15 +1,19 @@
+import json
+import warnings
 from copy import copy
 
 import numpy as np
 import toml
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from scipy.optimize import newton
 
 import ccp.config
+from . import profiling
+from .profiling import newton
 from .state import State
 from ccp.config.units import check_units, Q_
-from ccp.config.utilities import r_getattr
+from ccp.config.utilities import lazy_import, r_getattr
+from ccp.plotly_theme import go, subplots
+
+pd = lazy_import("pandas")
 
 
 class Point:
@@ -65,6 +69,11 @@ class Point:
         The default is "schultz".
         The default value can be changed in a global level with:
         ccp.config.POLYTROPIC_METHOD = "<desired value>"
+    disch_guess : ccp.State, optional
+        Discharge state of a similar point with the same suction state (e.g. the
+        previous point in a curve). If given, it is used as the initial guess for
+        the iterative calculation of the discharge state instead of an isentropic
+        compression.
 
     Returns
     -------
@@ -133,6 +142,9 @@ class Point:
         Ratio between volume_ratio for this point and the original point from which it was converted from.
     polytropic_method : str
         Polytropic method used for head and efficiency calculation.
+    solver_calls : int
+        Number of function evaluations in the iterative calculation of the
+        discharge state (0 if the discharge state was not calculated iteratively).
     """
 
     @check_units
@@ -163,6 +175,7 @@ class Point:
         ambient_temperature=None,
         convection_constant=Q_(13.6, "W/(m²*degK)"),
         polytropic_method=None,
+        disch_guess=None,
     ):
         if polytropic_method is None:
             polytropic_method = ccp.config.POLYTROPIC_METHOD
@@ -199,6 +212,9 @@ class Point:
         self.convection_constant = convection_constant
         self.casing_heat_loss = None
 
+        self._disch_guess = disch_guess
+        self.solver_calls = 0
+
         # dummy state used to avoid copying states
         self._dummy_state = copy(self.suc)
 
@@ -237,7 +253,8 @@ class Point:
         kwargs_str = "_".join(sorted(kwargs_list))
 
         try:
-            getattr(self, "_calc_from_" + kwargs_str)()
+            with profiling.timed_calc("_calc_from_" + kwargs_str):
+                getattr(self, "_calc_from_" + kwargs_str)()
         except (ValueError, RuntimeError) as e:
             kwargs_repr = (
                 str(kwargs_dict)
@@ -261,6 +278,7 @@ class Point:
                 f"Could not calculate point with ccp.Point(**{kwargs_repr}).\n"
                 f"The following kwargs seems out of reasonable range: {out_of_range_dict}."
             )
+        del self._disch_guess
 
         self.reynolds = reynolds(self.suc, self.speed, self.b, self.D)
         self.mach = mach(self.suc, self.speed, self.D)
@@ -401,8 +419,12 @@ class Point:
         disch_v = suc.v() / volume_ratio
         disch_rho = 1 / disch_v
 
-        # consider first an isentropic compression
-        disch = State(rho=disch_rho, s=suc.s(), fluid=suc.fluid)
+        disch_T = _disch_T_guess(suc, volume_ratio, self._disch_guess)
+        if disch_T is None:
+            # consider first an isentropic compression
+            disch = State(rho=disch_rho, s=suc.s(), fluid=suc.fluid)
+        else:
+            disch = State(rho=disch_rho, T=disch_T, fluid=suc.fluid)
 
         def update_state(x, update_type):
             if update_type == "pressure":
@@ -416,12 +438,25 @@ class Point:
             return (new_eff - eff).magnitude
 
         try:
-            newton(update_state, disch.T().magnitude, args=("temperature",), tol=1e-1)
+            _, result = newton(
+                update_state,
+                disch.T().magnitude,
+                args=("temperature",),
+                tol=1e-1,
+                full_output=True,
+            )
         except ValueError:
             # re-instantiate disch, since update with temperature not converging
             # might break the state
             disch = State(rho=disch_rho, s=suc.s(), fluid=suc.fluid)
-            newton(update_state, disch.p().magnitude, args=("pressure",), tol=1e-1)
+            _, result = newton(
+                update_state,
+                disch.p().magnitude,
+                args=("pressure",),
+                tol=1e-1,
+                full_output=True,
+            )
+        self.solver_calls = result.function_calls
 
         self.disch = disch
         self.head = self.head_calc_func(suc, disch)
@@ -448,7 +483,9 @@ class Point:
         eff = self.eff
         head = self.head
         suc = self.suc
-        disch = disch_from_suc_head_eff(suc, head, eff)
+        disch, self.solver_calls = disch_from_suc_head_eff(
+            suc, head, eff, disch_guess=self._disch_guess, full_output=True
+        )
         self.disch = disch
         self.flow_m = self.flow_v * self.suc.rho()
         self.power = power_calc(self.flow_m, self.head, self.eff)
@@ -474,7 +511,9 @@ class Point:
         eff = self.eff
         head = self.head
         suc = self.suc
-        disch = disch_from_suc_head_eff(suc, head, eff)
+        disch, self.solver_calls = disch_from_suc_head_eff(
+            suc, head, eff, disch_guess=self._disch_guess, full_output=True
+        )
         self.disch = disch
         self.flow_v = self.flow_m / self.suc.rho()
         self.power = power_calc(self.flow_m, self.head, self.eff)
@@ -498,7 +537,13 @@ class Point:
 
     def _calc_from_eff_phi_psi_speed_suc(self):
         self.head = head_from_psi(self.D, self.psi, self.speed)
-        self.disch = disch_from_suc_head_eff(self.suc, self.head, self.eff)
+        self.disch, self.solver_calls = disch_from_suc_head_eff(
+            self.suc,
+            self.head,
+            self.eff,
+            disch_guess=self._disch_guess,
+            full_output=True,
+        )
         self.flow_v = flow_from_phi(self.D, self.phi, self.speed)
         self.flow_m = self.flow_v * self.suc.rho()
         self.power = power_calc(self.flow_m, self.head, self.eff)
@@ -821,44 +866,42 @@ class Point:
         psi_converted = original_point.psi
 
         if reynolds_correction:
-            rc_original = 0.988 / original_point.reynolds**0.243
-            rb_original = np.log(0.000125 + 13.67 / original_point.reynolds) / np.log(
-                original_point.surface_roughness.to("in").m
-                + (13.67 / original_point.reynolds)
-            )
-            ra_original = (
-                0.066
-                + 0.934
-                * ((4.8e6 * original_point.b.to("ft").m) / original_point.reynolds)
-                ** rc_original
-            )
-
             reynolds_converted = reynolds(
                 suc=suc, speed=speed, b=original_point.b, D=original_point.D
             )
-            rc_converted = 0.988 / reynolds_converted**0.243
-            rb_converted = np.log(0.000125 + 13.67 / reynolds_converted) / np.log(
-                original_point.surface_roughness.to("in").m
-                + (13.67 / reynolds_converted)
-            )
-            ra_converted = (
-                0.066
-                + 0.934
-                * ((4.8e6 * original_point.b.to("ft").m) / reynolds_converted)
-                ** rc_converted
+            eff_converted, psi_converted = reynolds_correction_eff_psi(
+                eff=original_point.eff.m,
+                psi=original_point.psi.m,
+                reynolds_original=original_point.reynolds.m,
+                reynolds_converted=reynolds_converted.m,
+                b=original_point.b.to("ft").m,
+                surface_roughness=original_point.surface_roughness.to("in").m,
             )
+            eff_converted = Q_(eff_converted, "dimensionless")
+            psi_converted = Q_(psi_converted, "dimensionless")
+
+        return cls._convert_from(
+            original_point,
+            suc=suc,
+            find=find,
+            speed=speed,
+            eff=eff_converted,
+            psi=psi_converted,
+            **kwargs,
+        )
 
-            eff_converted = 1 - (1 - original_point.eff) * (
-                ra_converted / ra_original
-            ) * (rb_converted / rb_original)
-            psi_converted = original_point.psi * (eff_converted / original_point.eff)
+    @classmethod
+    def _convert_from(cls, original_point, suc, find, speed, eff, psi, **kwargs):
+        """Convert point with the given (corrected) efficiency and psi.
 
+        See Point.convert_from.
+        """
         convert_point_options = {
             "speed": dict(
                 suc=suc,
-                eff=eff_converted,
+                eff=eff,
                 phi=original_point.phi,
-                psi=psi_converted,
+                psi=psi,
                 volume_ratio=original_point.volume_ratio,
                 b=original_point.b,
                 D=original_point.D,
@@ -866,9 +909,9 @@ class Point:
             ),
             "volume_ratio": dict(
                 suc=suc,
-                eff=eff_converted,
+                eff=eff,
                 phi=original_point.phi,
-                psi=psi_converted,
+                psi=psi,
                 speed=speed,
                 b=original_point.b,
                 D=original_point.D,
@@ -899,12 +942,16 @@ class Point:
         self.__dict__ = state
         self._add_point_plot()
 
-    def _dict_to_save(self):
-        """Returns a dict that will be saved to a toml file."""
-        return dict(
+    def _dict_to_save(self, results=False):
+        """Returns a dict that will be saved to a toml file.
+
+        If results is True, the dict also has the calculated point in the
+        "results" key (see _from_load).
+        """
+        dict_to_save = dict(
             p=str(self.suc.p()),
             T=str(self.suc.T()),
-            fluid=self.suc.fluid,
+            fluid=dict(self.suc.fluid),
             speed=str(self.speed),
             flow_v=str(self.flow_v),
             head=str(self.head),
@@ -913,6 +960,10 @@ class Point:
             b=str(self.b),
             D=str(self.D),
         )
+        if results:
+            dict_to_save["results"] = self._results_to_save()
+
+        return dict_to_save
 
     @staticmethod
     def _dict_from_load(dict_parameters):
@@ -925,10 +976,174 @@ class Point:
 
         return dict(suc=suc, **{k: Q_(v) for k, v in dict_parameters.items()})
 
-    def save(self, file_name):
-        """Save point to toml file."""
+    @classmethod
+    def _from_load(cls, dict_parameters):
+        """Create point from a dict loaded from a toml file.
+
+        If the dict has the point results (saved with results=True), the point is
+        created directly from them, without solving it, and the results are
+        verified on the first access (see _from_results). Results saved with
+        another EOS or polytropic method are ignored and the point is solved.
+        """
+        dict_parameters = dict(dict_parameters)
+        results = dict_parameters.pop("results", None)
+        if results is None or not _use_saved_results(results):
+            return cls(**cls._dict_from_load(dict_parameters))
+
+        return cls._from_results(
+            {
+                "fluid": dict_parameters["fluid"],
+                "polytropic_method": results["polytropic_method"],
+                "states": {
+                    k: {attr: Q_(v) for attr, v in state.items()}
+                    for k, state in results["states"].items()
+                },
+                "values": {
+                    **{k: None for k in results["none"]},
+                    **{k: Q_(v) for k, v in results["values"].items()},
+                },
+            }
+        )
+
+    def _results(self):
+        """Returns a dict with the calculated point, used by _from_results.
+
+        The dict has the fluid, the EOS, the polytropic method, the p and T of
+        each state attribute (suc, disch etc.) and the value of the other
+        attributes that are quantities or None.
+        """
+        results = {
+            "fluid": self.suc.fluid,
+            "EOS": self.suc.EOS,
+            "polytropic_method": self.head_calc_func.__name__[len("head_pol_") :],
+            "states": {},
+            "values": {},
+        }
+        attributes = {**self.__dict__.get("_unverified", {}), **self.__dict__}
+        for k, v in attributes.items():
+            if "plot" in k or k == "_dummy_state":
+                continue
+            if isinstance(v, State):
+                results["states"][k] = {"p": v.p(), "T": v.T()}
+            elif v is None or isinstance(v, Q_):
+                results["values"][k] = v
+
+        return results
+
+    def _results_to_save(self):
+        """Returns a dict with the results that will be saved to a toml file."""
+        results = self._results()
+
+        return {
+            **_results_settings(self),
+            "states": {
+                k: {attr: str(v) for attr, v in state.items()}
+                for k, state in results["states"].items()
+            },
+            "values": {
+                k: str(v) for k, v in results["values"].items() if v is not None
+            },
+            # toml has no null values
+            "none": [k for k, v in results["values"].items() if v is None],
+        }
+
+    @classmethod
+    def _from_results(cls, results):
+        """Create a point from a dict returned by _results.
+
+        The point is not calculated again, only the states are created from
+        their p and T (with the EOS in results, if given). The other values are
+        verified (see verify) on the first access to one of them.
+        """
+        point = cls.__new__(cls)
+        point.head_calc_func = globals()[f"head_pol_{results['polytropic_method']}"]
+        point.eff_calc_func = globals()[f"eff_pol_{results['polytropic_method']}"]
+        for k, v in results["states"].items():
+            setattr(
+                point,
+                k,
+                State(
+                    p=v["p"], T=v["T"], fluid=results["fluid"], EOS=results.get("EOS")
+                ),
+            )
+        point._unverified = dict(results["values"])
+        point.solver_calls = 0
+        point._dummy_state = copy(point.suc)
+        point._add_point_plot()
+
+        return point
+
+    def __getattr__(self, name):
+        # values of points created with _from_results are verified on the first
+        # access to one of them
+        unverified = self.__dict__.get("_unverified")
+        if unverified is None or name not in unverified:
+            raise AttributeError(
+                f"{self.__class__.__name__!r} object has no attribute {name!r}"
+            )
+        del self._unverified
+        for k, v in unverified.items():
+            self.__dict__.setdefault(k, v)
+        self.verify()
+
+        return self.__dict__[name]
+
+    def verify(self, rtol=1e-3):
+        """Verify the point results.
+
+        Points loaded from files saved with results=True are not solved again.
+        This method checks the saved results, calculating the head, volume ratio
+        and mass flow from the suction and discharge states, which is much faster
+        than solving the point. It is called on the first access to the results
+        of a loaded point.
+
+        Parameters
+        ----------
+        rtol : float, optional
+            Relative tolerance. Default is 1e-3.
+
+        Returns
+        -------
+        verified : bool
+            True if the results are consistent.
+
+        Raises
+        ------
+        ValueError
+            If the calculated values are different from the saved results.
+        """
+        calculated = {
+            "head": self.head_calc_func(self.suc, self.disch),
+            "volume_ratio": self.suc.v() / self.disch.v(),
+            "flow_m": self.suc.rho() * self.flow_v,
+        }
+        different = {}
+        for k, v in calculated.items():
+            saved = getattr(self, k)
+            if not np.isclose(v.to(saved.units).m, saved.m, rtol=rtol):
+                different[k] = (saved, v)
+
+        if different:
+            raise ValueError(
+                f"Point results are not consistent (saved, calculated): {different}"
+            )
+
+        return True
+
+    def save(self, file_name, results=False):
+        """Save point to toml file.
+
+        Parameters
+        ----------
+        file_name : str or pathlib.Path
+            Name of the file.
+        results : bool, optional
+            If True, the calculated point (discharge state, power, phi, psi,
+            Mach, Reynolds etc.) is also saved, and the point is loaded without
+            being solved again. Default is False.
+        """
         with open(file_name, mode="w") as f:
-            toml.dump(self._dict_to_save(), f)
+            toml.dump(self._dict_to_save(results=results), f)
 
     @classmethod
     def load(cls, file_name):
@@ -936,7 +1151,7 @@ class Point:
         with open(file_name) as f:
             parameters = toml.load(f)
 
-        return cls(**cls._dict_from_load(parameters))
+        return cls._from_load(parameters)
 
     def mach_limits(self, mmsp=None):
         """Calculate Mach lower and upper limits.
@@ -1285,7 +1500,7 @@ class Point:
             Plotly figure.
         """
         if fig is None:
-            fig = make_subplots(
+            fig = subplots.make_subplots(
                 rows=2,
                 cols=2,
                 specs=[
@@ -1317,6 +1532,269 @@ class Point:
         return fig
 
 
+class PointTable:
+    """Table with a sequence of points, e.g. the points of a flow sweep.
+
+    Each column is a pint.Quantity array with the attribute of all points and can
+    be accessed with table["head"] or, for state parameters, table["disch.p"].
+    Columns are calculated when they are first accessed.
+
+    Parameters
+    ----------
+    points : list
+        List with ccp.Point objects.
+
+    Examples
+    --------
+    >>> import ccp
+    >>> table = ccp.PointTable([])
+    >>> len(table)
+    0
+    """
+
+    columns = [
+        "flow_v",
+        "flow_m",
+        "speed",
+        "suc.p",
+        "suc.T",
+        "disch.p",
+        "disch.T",
+        "head",
+        "eff",
+        "power",
+        "phi",
+        "psi",
+        "volume_ratio",
+        "mach",
+        "reynolds",
+    ]
+
+    def __init__(self, points):
+        self.points = list(points)
+        self._columns = {}
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(points={len(self)})"
+
+    def __len__(self):
+        return len(self.points)
+
+    def __iter__(self):
+        return iter(self.points)
+
+    def __getitem__(self, item):
+        """Point (int or slice) or column (str) of the table."""
+        if not isinstance(item, str):
+            if isinstance(item, slice):
+                return self.__class__(self.points[item])
+            return self.points[item]
+
+        if item not in self._columns:
+            values = []
+            for point in self.points:
+                value = r_getattr(point, item)
+                if callable(value):
+                    value = value()
+                values.append(value)
+            if values and isinstance(values[0], Q_):
+                units = values[0].units
+                values = Q_(np.array([v.to(units).m for v in values]), units)
+            else:
+                values = np.array(values)
+            self._columns[item] = values
+
+        return self._columns[item]
+
+    def to_dataframe(self, columns=None, units=None):
+        """Create a pandas DataFrame with the table.
+
+        Parameters
+        ----------
+        columns : list, optional
+            Columns of the DataFrame. Default is PointTable.columns plus the
+            compressor parameters (e.g. mach_diff) available in the points.
+        units : dict, optional
+            Units for the columns, e.g. {"flow_m": "kg/h"}. Default is SI units.
+
+        Returns
+        -------
+        df : pandas.DataFrame
+            DataFrame with the magnitudes and one column per parameter.
+        """
+        if columns is None:
+            columns = list(self.columns)
+            if self.points:
+                columns += [
+                    attr
+                    for attr in ["mach_diff", "reynolds_ratio", "volume_ratio_ratio"]
+                    if getattr(self.points[0], attr, None) is not None
+                ]
+        if units is None:
+            units = {}
+
+        data = {}
+        for column in columns:
+            values = self[column]
+            if isinstance(values, Q_):
+                if column in units:
+                    values = values.to(units[column])
+                values = values.m
+            data[column] = values
+
+        return pd.DataFrame(data)
+
+
+def _results_to_frame(points, units=None):
+    """Create a table with one row per point, with the results of Point._results.
+
+    The states are stored in "{state}.{attr}" columns (e.g. "disch.p").
+    Quantities are stored in the units of the first point with that column and
+    None values as NaN.
+
+    Parameters
+    ----------
+    points : list
+        List of points.
+    units : dict, optional
+        Units of each column, which is updated with the new columns. Used to
+        create tables with the same units for different lists of points.
+
+    Returns
+    -------
+    table : pandas.DataFrame
+        Table with the points.
+    units : dict
+        Units of each column.
+    """
+    if units is None:
+        units = {}
+
+    rows = []
+    for point in points:
+        results = point._results()
+        row = {
+            "class": point.__class__.__name__,
+            "fluid": json.dumps(results["fluid"]),
+            "EOS": results["EOS"],
+            "polytropic_method": results["polytropic_method"],
+        }
+        for state, values in results["states"].items():
+            for attr, value in values.items():
+                row[f"{state}.{attr}"] = value
+        row.update(results["values"])
+        for column, value in row.items():
+            if isinstance(value, Q_):
+                column_units = units.setdefault(column, str(value.units))
+                row[column] = value.to(column_units).m
+            elif value is None:
+                row[column] = float("nan")
+        rows.append(row)
+
+    return pd.DataFrame(rows), units
+
+
+def _results_from_frame(table, units, point_classes=None):
+    """Create the points from a table created by _results_to_frame.
+
+    The points are created with Point._from_results, without being solved.
+
+    Parameters
+    ----------
+    table : pandas.DataFrame
+        Table with the points, without other columns.
+    units : dict
+        Units of each column.
+    point_classes : dict, optional
+        Dict with the name and the class of the points in the table.
+        Default is ccp.Point.
+
+    Returns
+    -------
+    points : list
+        List of points.
+    """
+    if point_classes is None:
+        point_classes = {"Point": Point}
+
+    points = []
+    for row in table.to_dict("records"):
+        results = {
+            "fluid": json.loads(row.pop("fluid")),
+            "EOS": row.pop("EOS"),
+            "polytropic_method": row.pop("polytropic_method"),
+            "states": {},
+            "values": {},
+        }
+        cls = point_classes[row.pop("class")]
+        for column, value in row.items():
+            if "." in column:
+                # states that are not defined for this point class are NaN
+                if not pd.isna(value):
+                    state, attr = column.split(".")
+                    results["states"].setdefault(state, {})[attr] = Q_(
+                        value, units[column]
+                    )
+            elif pd.isna(value):
+                results["values"][column] = None
+            else:
+                results["values"][column] = Q_(value, units[column])
+        points.append(cls._from_results(results))
+
+    return points
+
+
+def _results_settings(point):
+    """Settings saved with the results of a point (ccp version, EOS and method)."""
+    return {
+        "ccp_version": ccp.__version__,
+        "EOS": point.suc.EOS,
+        "polytropic_method": point.head_calc_func.__name__[len("head_pol_") :],
+    }
+
+
+def _use_saved_results(results):
+    """Check if the results saved in a toml file can be used.
+
+    The results are not used if they were saved with an EOS or polytropic method
+    different from the current ones in ccp.config. Results saved with another
+    ccp version are used, since they are verified on the first access.
+
+    Parameters
+    ----------
+    results : dict
+        The "results" table of the file, with the settings saved by
+        _results_settings.
+
+    Returns
+    -------
+    use : bool
+        False if the points must be solved again.
+    """
+    current = {
+        "EOS": ccp.config.EOS,
+        "polytropic_method": ccp.config.POLYTROPIC_METHOD,
+    }
+    different = {
+        k: (results[k], v) for k, v in current.items() if results.get(k, v) != v
+    }
+    if different:
+        warnings.warn(
+            f"Saved results ignored, calculated with different settings "
+            f"(saved, current): {different}. The points will be solved."
+        )
+        return False
+
+    version = results.get("ccp_version", ccp.__version__)
+    if version != ccp.__version__:
+        warnings.warn(
+            f"Results saved with ccp {version}, current version is "
+            f"{ccp.__version__}."
+        )
+
+    return True
+
+
 def plot_func(self, attr):
     def inner(*args, plot_kws=None, **kwargs):
         """Plot parameter versus volumetric flow.
@@ -1526,8 +2004,9 @@ def f_schultz(suc, disch):
     disch_s = copy(disch)
     disch_s.update(p=disch.p(), s=suc.s())
 
+    # same as head_isentropic, without calculating the isentropic state again
     h2s_h1 = disch_s.h() - suc.h()
-    h_isen = head_isentropic(suc, disch)
+    h_isen = head_pol(suc, disch_s).to("joule/kilogram")
 
     return h2s_h1 / h_isen
 
@@ -1633,9 +2112,6 @@ def eff_pol_mallen_saville(suc, disch):
     return (wp / dh).to("dimensionless")
 
 
-_ref_H = 0
-
-
 def head_reference(suc, disch, num_steps=100):
     r"""Reference head.
 
@@ -1695,9 +2171,10 @@ def head_reference(suc, disch, num_steps=100):
 
         T0 = suc.T().magnitude
 
-        global _ref_H
-
-        _ref_H = 0
+        # head of the last iteration, kept in the closure instead of a module
+        # global so that concurrent calls do not interfere
+        nonlocal ref_H
+        ref_H = 0
 
         # TODO implement p_intervals considering pressure ratio
         for p0, p1 in zip(p_intervals[:-1], p_intervals[1:]):
@@ -1706,18 +2183,16 @@ def head_reference(suc, disch, num_steps=100):
                 calc_step_discharge_temp, (T0 + 1e-3), args=(p1, p0, s0.h(), s0.v(), e)
             )
             s1 = State(p=p1, T=T1, fluid=suc.fluid)
-            _ref_H += head_pol(s0, s1)
+            ref_H += head_pol(s0, s1)
 
             T0 = T1
 
         return disch.T().magnitude - T1
 
+    ref_H = 0
     _ref_eff = newton(calc_eff, 0.8, args=(suc, disch))
 
-    return _ref_H, _ref_eff
-
-
-_ref_H_2017 = 0
+    return ref_H, _ref_eff
 
 
 def head_reference_2017(suc, disch, num_steps=100):
@@ -1778,8 +2253,8 @@ def head_reference_2017(suc, disch, num_steps=100):
         ).magnitude
 
     def calc_eff(e, suc, disch, p_intervals):
-        global _ref_H_2017
-        _ref_H_2017 = 0
+        nonlocal ref_H
+        ref_H = 0
         s0 = suc.s().magnitude
 
         for p0, p1 in zip(p_intervals[:-1], p_intervals[1:]):
@@ -1788,17 +2263,18 @@ def head_reference_2017(suc, disch, num_steps=100):
 
             s1 = newton(calc_step_discharge_z, (s0 + 1e-8), args=(s0, p1, p0, z0, R, e))
             state1 = ccp.State(p=p1, s=s1, fluid=suc.fluid)
-            _ref_H_2017 += ccp.point.head_pol(state0, state1)
+            ref_H += ccp.point.head_pol(state0, state1)
 
             s0 = s1
             T1 = state1.T().magnitude
 
         return disch.T().magnitude - T1
 
+    ref_H = 0
     eff0 = ccp.point.eff_pol_huntington(suc, disch)
     _ref_eff = newton(calc_eff, eff0, args=(suc, disch, p_intervals))
 
-    return _ref_H_2017, _ref_eff
+    return ref_H, _ref_eff
 
 
 def f_sandberg_colby(suc, disch):
@@ -1981,10 +2457,11 @@ def eff_pol_huntington(suc, disch):
     p3 = np.sqrt(p1 * p2)
 
     T3 = np.sqrt(T1 * T2)
+    state3 = State(p=p3, T=T3, fluid=suc.fluid)
     error = 1
     n = 0
     while error > 1e-10:
-        state3 = State(p=p3, T=T3, fluid=suc.fluid)
+        state3.update(p=p3, T=T3)
         s3 = state3.s()
         z3 = state3.z()
         cp3 = state3.cp()
@@ -2235,7 +2712,9 @@ def head_from_psi(D, psi, speed):
     return head.to("J/kg")
 
 
-def disch_from_suc_head_eff(suc, head, eff, polytropic_method=None):
+def disch_from_suc_head_eff(
+    suc, head, eff, polytropic_method=None, disch_guess=None, full_output=False
+):
     """Calculate discharge state from suction, head and efficiency.
 
     Parameters
@@ -2246,11 +2725,19 @@ def disch_from_suc_head_eff(suc, head, eff, polytropic_method=None):
         Polytropic head (J/kg).
     eff : pint.Quantity, float
         Polytropic efficiency (dimensionless).
+    disch_guess : ccp.State, optional
+        Discharge state of a similar point with the same suction state, used for
+        the initial guess of the discharge pressure. Default is an isentropic
+        compression.
+    full_output : bool, optional
+        If True, the number of function evaluations is also returned.
 
     Returns
     -------
     disch : ccp.State
         Discharge state.
+    function_calls : int
+        Number of function evaluations (only if full_output is True).
     """
     if polytropic_method is None:
         polytropic_method = ccp.config.POLYTROPIC_METHOD
@@ -2258,8 +2745,12 @@ def disch_from_suc_head_eff(suc, head, eff, polytropic_method=None):
     head_calc_func = globals()[f"head_pol_{polytropic_method}"]
     h_disch = head / eff + suc.h()
 
-    #  consider first an isentropic compression
-    disch = State(h=h_disch, s=suc.s(), fluid=suc.fluid)
+    disch_p = _disch_p_guess(suc, h_disch, disch_guess)
+    if disch_p is None:
+        #  consider first an isentropic compression
+        disch = State(h=h_disch, s=suc.s(), fluid=suc.fluid)
+    else:
+        disch = State(h=h_disch, p=disch_p, fluid=suc.fluid)
 
     def update_pressure(p):
         disch.update(h=h_disch, p=p)
@@ -2267,11 +2758,60 @@ def disch_from_suc_head_eff(suc, head, eff, polytropic_method=None):
 
         return (new_head - head).magnitude
 
-    newton(update_pressure, disch.p().magnitude, tol=1e-1)
+    _, result = newton(update_pressure, disch.p().magnitude, tol=1e-1, full_output=True)
 
+    if full_output:
+        return disch, result.function_calls
     return disch
 
 
+def _polytropic_exponent(suc, disch_guess):
+    """Exponent m in T2/T1 = (p2/p1)**m for the guess discharge state.
+
+    Returns None if the guess is not a compression from suc.
+    """
+    if disch_guess is None:
+        return None
+    pressure_ratio = (disch_guess.p() / suc.p()).m
+    temperature_ratio = (disch_guess.T() / suc.T()).m
+    if pressure_ratio <= 1 or temperature_ratio <= 1:
+        return None
+
+    return np.log(temperature_ratio) / np.log(pressure_ratio)
+
+
+def _disch_p_guess(suc, h_disch, disch_guess):
+    """Discharge pressure for h_disch extrapolated from a similar point.
+
+    The temperature rise is scaled with the enthalpy rise and the pressure is
+    calculated with the polytropic exponent of the similar point.
+    """
+    m = _polytropic_exponent(suc, disch_guess)
+    if m is None:
+        return None
+    dh_ratio = ((h_disch - suc.h()) / (disch_guess.h() - suc.h())).m
+    if dh_ratio <= 0:
+        return None
+    temperature_ratio = 1 + ((disch_guess.T() / suc.T()).m - 1) * dh_ratio
+
+    return suc.p() * temperature_ratio ** (1 / m)
+
+
+def _disch_T_guess(suc, volume_ratio, disch_guess):
+    """Discharge temperature for volume_ratio extrapolated from a similar point.
+
+    Uses the exponent n in T2/T1 = (v1/v2)**n of the similar point.
+    """
+    if _polytropic_exponent(suc, disch_guess) is None:
+        return None
+    volume_ratio_guess = (suc.v() / disch_guess.v()).m
+    if volume_ratio_guess <= 1 or volume_ratio.m <= 1:
+        return None
+    n = np.log((disch_guess.T() / suc.T()).m) / np.log(volume_ratio_guess)
+
+    return suc.T() * volume_ratio.m**n
+
+
 def disch_from_suc_disch_p_eff(suc, disch_p, eff, polytropic_method=None):
     """Calculate discharge state from suction, discharge pressure and efficiency.
 
@@ -2342,6 +2882,50 @@ def disch_from_suc_disch_T_head(suc, disch_T, head, polytropic_method=None):
     return disch
 
 
+def reynolds_correction_eff_psi(
+    eff, psi, reynolds_original, reynolds_converted, b, surface_roughness
+):
+    """ASME PTC 10 Reynolds correction of the efficiency and psi.
+
+    All arguments are magnitudes and can be floats or arrays, so that the
+    correction is calculated for all points of a curve at once.
+
+    Parameters
+    ----------
+    eff, psi : float, array
+        Efficiency and psi of the original points.
+    reynolds_original, reynolds_converted : float, array
+        Reynolds numbers of the original and converted points.
+    b : float, array
+        Impeller width (ft).
+    surface_roughness : float, array
+        Surface roughness (in).
+
+    Returns
+    -------
+    eff_converted, psi_converted : float, array
+        Corrected efficiency and psi.
+    """
+    rc_original = 0.988 / reynolds_original**0.243
+    rb_original = np.log(0.000125 + 13.67 / reynolds_original) / np.log(
+        surface_roughness + (13.67 / reynolds_original)
+    )
+    ra_original = 0.066 + 0.934 * ((4.8e6 * b) / reynolds_original) ** rc_original
+
+    rc_converted = 0.988 / reynolds_converted**0.243
+    rb_converted = np.log(0.000125 + 13.67 / reynolds_converted) / np.log(
+        surface_roughness + (13.67 / reynolds_converted)
+    )
+    ra_converted = 0.066 + 0.934 * ((4.8e6 * b) / reynolds_converted) ** rc_converted
+
+    eff_converted = 1 - (1 - eff) * (ra_converted / ra_original) * (
+        rb_converted / rb_original
+    )
+    psi_converted = psi * (eff_converted / eff)
+
+    return eff_converted, psi_converted
+
+
 @check_units
 def reynolds(suc, speed, b, D):
     """Calculate the Reynolds number.
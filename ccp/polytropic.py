@@ -0,0 +1,287 @@
+"""Module with array versions of the polytropic head and efficiency methods.
+
+The functions in ccp.point (e.g. head_pol_schultz, eff_pol_huntington) work on
+a pair of ccp.State objects, which is what ccp.Point needs. The functions in
+this module calculate the same methods for arrays of suction and discharge
+properties (SI magnitudes), which is useful to evaluate many points at once
+(e.g. historian data) or to compare the methods with each other.
+
+The methods that need states other than the suction and the discharge
+(isentropic discharge for Schultz, intermediate point for Huntington) use a
+single scratch ccp.State that is updated for each point, instead of creating
+new states.
+
+```{code-block} python
+from ccp import polytropic
+
+head, eff = polytropic.head_eff(sucs, dischs, method="huntington")
+polytropic.benchmark(sucs, dischs)
+```
+"""
+
+import time
+
+import numpy as np
+
+import ccp.config
+from ccp import Q_, State
+from ccp.config.utilities import lazy_import
+
+pd = lazy_import("pandas")
+
+_properties = ["p", "T", "h", "s", "rho", "z"]
+
+
+def properties(states):
+    """Property arrays of a list of states.
+
+    Parameters
+    ----------
+    states : ccp.State, list
+        State or list of states.
+
+    Returns
+    -------
+    properties : dict
+        Dict with p, T, h, s, rho and z arrays (SI units).
+    """
+    if isinstance(states, State):
+        states = [states]
+
+    return {
+        name: np.array([getattr(state, name)().m for state in states])
+        for name in _properties
+    }
+
+
+def properties_from_pT(p, T, fluid, EOS=None):
+    """Property arrays calculated from pressure and temperature arrays.
+
+    All properties are calculated with a single state.
+
+    Parameters
+    ----------
+    p : float, array
+        Pressure (Pa).
+    T : float, array
+        Temperature (degK).
+    fluid : dict
+        Dictionary with constituent and composition.
+    EOS : str, optional
+        Equation of state. Default is ccp.config.EOS.
+
+    Returns
+    -------
+    properties : dict
+        Dict with p, T, h, s, rho and z arrays (SI units).
+    """
+    p, T = np.broadcast_arrays(np.atleast_1d(p), np.atleast_1d(T))
+    state = State(p=p[0], T=T[0], fluid=fluid, EOS=EOS)
+    result = {name: np.empty(len(p)) for name in _properties}
+    for i in range(len(p)):
+        state.update(p=p[i], T=T[i])
+        for name in _properties:
+            result[name][i] = getattr(state, name)().m
+
+    return result
+
+
+def _head_pol(p1, v1, p2, v2):
+    n = np.log(p2 / p1) / np.log(v1 / v2)
+    return (n / (n - 1)) * (p2 * v2 - p1 * v1)
+
+
+def _schultz(suc, disch, scratch):
+    h2s = np.empty(len(suc["p"]))
+    v2s = np.empty(len(suc["p"]))
+    for i in range(len(h2s)):
+        scratch.update(p=disch["p"][i], s=suc["s"][i])
+        h2s[i] = scratch.h().m
+        v2s[i] = scratch.v().m
+
+    v1 = 1 / suc["rho"]
+    f = (h2s - suc["h"]) / _head_pol(suc["p"], v1, disch["p"], v2s)
+    head = f * _head_pol(suc["p"], v1, disch["p"], 1 / disch["rho"])
+
+    return head, head / (disch["h"] - suc["h"])
+
+
+def _mallen_saville(suc, disch, scratch):
+    head = (disch["h"] - suc["h"]) - (disch["s"] - suc["s"]) * (
+        disch["T"] - suc["T"]
+    ) / np.log(disch["T"] / suc["T"])
+
+    return head, head / (disch["h"] - suc["h"])
+
+
+def _sandberg_colby(suc, disch, scratch):
+    # f_sandberg_colby * head_pol, with the head_pol terms cancelled
+    Tm = (suc["T"] + disch["T"]) / 2
+    head = (disch["h"] - suc["h"]) - Tm * (disch["s"] - suc["s"])
+
+    return head, head / (disch["h"] - suc["h"])
+
+
+def _huntington(suc, disch, scratch):
+    p1, p2 = suc["p"], disch["p"]
+    s1, s2 = suc["s"], disch["s"]
+    z1, z2 = suc["z"], disch["z"]
+    ratio = p2 / p1
+    ln_ratio = np.log(ratio)
+
+    # the intermediate temperature of all points is iterated at once, and only
+    # the points that have not converged are updated
+    p3 = np.sqrt(p1 * p2)
+    T3 = np.sqrt(suc["T"] * disch["T"])
+    s3, z3, cp3 = np.empty(len(p1)), np.empty(len(p1)), np.empty(len(p1))
+    not_converged = np.ones(len(p1), dtype=bool)
+    for _ in range(100):
+        for i in np.flatnonzero(not_converged):
+            scratch.update(p=p3[i], T=T3[i])
+            s3[i] = scratch.s().m
+            z3[i] = scratch.z().m
+            cp3[i] = scratch.cp().m
+        b = (z1 + z2 - 2 * z3) / (np.sqrt(ratio) - 1) ** 2
+        a = z1 - b
+        c = (z2 - a - b * ratio) / ln_ratio
+        denominator = a * ln_ratio + b * (ratio - 1) + (c / 2) * ln_ratio**2
+        s3_ = s1 + (s2 - s1) * (
+            ((a / 2) * ln_ratio + b * (np.sqrt(ratio) - 1) + (c / 8) * ln_ratio**2)
+            / denominator
+        )
+        T3_new = np.where(not_converged, T3 * np.exp((s3_ - s3) / cp3), T3)
+        not_converged = abs(T3_new - T3) > 1e-10
+        T3 = T3_new
+        if not not_converged.any():
+            break
+    else:
+        raise RecursionError("Maximum number of iterations exceeded.")
+
+    R = scratch.gas_constant().m / scratch.molar_mass().m
+    eff = 1 / (1 + ((s2 - s1) / R) / denominator)
+
+    return (disch["h"] - suc["h"]) * eff, eff
+
+
+_methods = {
+    "schultz": _schultz,
+    "mallen_saville": _mallen_saville,
+    "sandberg_colby": _sandberg_colby,
+    "huntington": _huntington,
+}
+
+
+def head_eff(suc, disch, method=None, fluid=None, EOS=None):
+    """Polytropic head and efficiency for arrays of suction and discharge states.
+
+    Parameters
+    ----------
+    suc, disch : ccp.State, list, dict
+        Suction and discharge states, as a state, a list of states or a dict of
+        property arrays (see properties and properties_from_pT).
+    method : str, optional
+        Polytropic method: "schultz", "mallen_saville", "sandberg_colby" or
+        "huntington". Default is ccp.config.POLYTROPIC_METHOD.
+    fluid : dict, optional
+        Fluid composition. Required for the "schultz" and "huntington" methods
+        when the states are given as dicts.
+    EOS : str, optional
+        Equation of state used with fluid. Default is ccp.config.EOS.
+
+    Returns
+    -------
+    head : pint.Quantity
+        Polytropic head array (J/kg).
+    eff : pint.Quantity
+        Polytropic efficiency array (dimensionless).
+    """
+    if method is None:
+        method = ccp.config.POLYTROPIC_METHOD
+
+    suc, disch, scratch = _prepare(suc, disch, [method], fluid, EOS)
+    head, eff = _methods[method](suc, disch, scratch)
+
+    return Q_(head, "J/kg"), Q_(eff, "dimensionless")
+
+
+def benchmark(suc, disch, methods=None, fluid=None, EOS=None, repeat=3):
+    """Compare the time and results of the polytropic methods.
+
+    Parameters
+    ----------
+    suc, disch : ccp.State, list, dict
+        Suction and discharge states (see head_eff).
+    methods : list, optional
+        Methods to compare. Default is all methods. The results are compared to
+        the first method.
+    fluid : dict, optional
+        Fluid composition, see head_eff.
+    EOS : str, optional
+        Equation of state used with fluid. Default is ccp.config.EOS.
+    repeat : int, optional
+        Number of times each method is calculated. Default is 3.
+
+    Returns
+    -------
+    results : pd.DataFrame
+        DataFrame indexed by method with the best time (s), the time per point
+        (s) and the maximum relative difference of the head and efficiency to
+        the first method.
+    """
+    if methods is None:
+        methods = list(_methods)
+
+    suc, disch, scratch = _prepare(suc, disch, methods, fluid, EOS)
+
+    rows = []
+    for method in methods:
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            head, eff = _methods[method](suc, disch, scratch)
+            times.append(time.perf_counter() - start)
+        if not rows:
+            head_0, eff_0 = head, eff
+        rows.append(
+            dict(
+                method=method,
+                time=min(times),
+                time_per_point=min(times) / len(head),
+                head_diff=np.max(abs(head / head_0 - 1)),
+                eff_diff=np.max(abs(eff / eff_0 - 1)),
+            )
+        )
+
+    return pd.DataFrame(rows).set_index("method")
+
+
+def _prepare(suc, disch, methods, fluid, EOS):
+    """Property arrays of suc and disch and the scratch state for the methods."""
+    for method in methods:
+        if method not in _methods:
+            raise ValueError(
+                f"Polytropic method {method!r} not available. "
+                f"Options are: {', '.join(_methods)}."
+            )
+
+    if fluid is None and not isinstance(suc, dict):
+        state = suc if isinstance(suc, State) else suc[0]
+        fluid, EOS = state.fluid, state.EOS
+    scratch = None
+    if fluid is not None:
+        scratch = State(p=101325, T=300, fluid=fluid, EOS=EOS)
+    elif set(methods) & {"schultz", "huntington"}:
+        raise ValueError("fluid is required for the schultz and huntington methods.")
+
+    if not isinstance(suc, dict):
+        suc = properties(suc)
+    if not isinstance(disch, dict):
+        disch = properties(disch)
+
+    # broadcast the suction and discharge property arrays to the same shape
+    names = list(suc)
+    arrays = np.broadcast_arrays(*[suc[k] for k in names], *[disch[k] for k in names])
+    suc = dict(zip(names, arrays[: len(names)]))
+    disch = dict(zip(names, arrays[len(names) :]))
+
+    return suc, disch, scratch
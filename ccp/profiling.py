@@ -0,0 +1,332 @@
+"""Module with instrumentation for the ccp hot paths.
+
+The instrumentation is opt-in and has no effect unless a :func:`profile`
+context is active. Inside the context ccp records:
+
+- the number of ccp.State constructions and the time spent creating the
+  underlying EOS objects;
+- the number of State.update calls and the time spent in each input pair
+  (e.g. "p_T", "h_p", "p_s");
+- iterations, function calls and failures of the newton/fsolve/fixed_point
+  solvers, per call site (e.g. "ccp.point.disch_from_suc_head_eff");
+- calls and time of each Point._calc_from_* method.
+
+```{code-block} python
+import ccp
+
+with ccp.profile() as stats:
+    imp = ccp.Impeller.load_from_engauge_csv(...)
+
+print(stats)
+stats.to_json("profile.json")
+```
+
+Only calculations in the thread that entered the context (and in the workers
+of "thread" pools created inside it with ccp.parallel.pool) are recorded.
+Calculations that run in process-pool workers (e.g. Impeller.convert_from_many
+with processes > 1 and the "process" backend) are not recorded.
+"""
+
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+
+from ccp import solvers
+from ccp.config.utilities import lazy_import
+
+optimize = lazy_import("scipy.optimize")
+
+__all__ = ["profile", "ProfileStats", "newton", "fsolve", "fixed_point"]
+
+# each thread has its own stack of active ProfileStats, the innermost context
+# is the last one
+_local = threading.local()
+
+
+class ProfileStats:
+    """Statistics recorded inside a :func:`profile` context.
+
+    The statistics can be updated by more than one thread (e.g. workers of a
+    "thread" pool), so the add_* methods hold a lock. Calls in process-pool
+    workers are not counted.
+
+    Attributes
+    ----------
+    elapsed : float
+        Total time (s) spent inside the context.
+    states : dict
+        Number of State constructions ("calls") and time (s) spent creating the
+        EOS objects ("time").
+    updates : dict
+        Number of State.update calls ("calls") and time ("time") per input pair.
+    solvers : dict
+        For each call site: number of solver calls, iterations, function calls
+        and failures.
+    calc : dict
+        Number of calls and time for each Point._calc_from_* method.
+    """
+
+    def __init__(self):
+        self.elapsed = 0.0
+        self.states = {"calls": 0, "time": 0.0}
+        self.updates = {}
+        self.solvers = {}
+        self.calc = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return self.report()
+
+    def add_state(self, elapsed):
+        with self._lock:
+            self.states["calls"] += 1
+            self.states["time"] += elapsed
+
+    def add_update(self, inputs, elapsed):
+        with self._lock:
+            entry = self.updates.setdefault(inputs, {"calls": 0, "time": 0.0})
+            entry["calls"] += 1
+            entry["time"] += elapsed
+
+    def add_solver(self, site, iterations=0, function_calls=0, failed=False):
+        with self._lock:
+            entry = self.solvers.setdefault(
+                site,
+                {"calls": 0, "iterations": 0, "function_calls": 0, "failures": 0},
+            )
+            entry["calls"] += 1
+            entry["iterations"] += iterations
+            entry["function_calls"] += function_calls
+            entry["failures"] += int(failed)
+
+    def add_calc(self, method, elapsed):
+        with self._lock:
+            entry = self.calc.setdefault(method, {"calls": 0, "time": 0.0})
+            entry["calls"] += 1
+            entry["time"] += elapsed
+
+    def to_dict(self):
+        """Return the statistics as a dictionary."""
+        return {
+            "elapsed": self.elapsed,
+            "states": dict(self.states),
+            "updates": {k: dict(v) for k, v in self.updates.items()},
+            "solvers": {k: dict(v) for k, v in self.solvers.items()},
+            "calc": {k: dict(v) for k, v in self.calc.items()},
+        }
+
+    def to_json(self, path=None):
+        """Export the statistics as json.
+
+        Parameters
+        ----------
+        path : str or pathlib.Path, optional
+            File where the json is saved. If None, the json string is returned.
+
+        Returns
+        -------
+        json_str : str
+            Statistics as a json string.
+        """
+        json_str = json.dumps(self.to_dict(), indent=2)
+        if path is not None:
+            Path(path).write_text(json_str)
+
+        return json_str
+
+    def report(self):
+        """Return a text report of the statistics."""
+        lines = [
+            f"Elapsed time: {self.elapsed:.3f} s",
+            f"State constructions: {self.states['calls']} "
+            f"({self.states['time']:.3f} s)",
+            "",
+            f"{'State.update inputs':<50}{'calls':>10}{'time (s)':>12}",
+        ]
+        for inputs, entry in _sorted_by_time(self.updates):
+            lines.append(f"{inputs:<50}{entry['calls']:>10}{entry['time']:>12.3f}")
+
+        lines += [
+            "",
+            f"{'Solver call site':<50}{'calls':>10}{'iter':>10}{'fcalls':>10}"
+            f"{'failures':>10}",
+        ]
+        for site, entry in sorted(self.solvers.items()):
+            lines.append(
+                f"{site:<50}{entry['calls']:>10}{entry['iterations']:>10}"
+                f"{entry['function_calls']:>10}{entry['failures']:>10}"
+            )
+
+        lines += ["", f"{'Point calc method':<50}{'calls':>10}{'time (s)':>12}"]
+        for method, entry in _sorted_by_time(self.calc):
+            lines.append(f"{method:<50}{entry['calls']:>10}{entry['time']:>12.3f}")
+
+        return "\n".join(lines)
+
+
+def _sorted_by_time(entries):
+    return sorted(entries.items(), key=lambda item: item[1]["time"], reverse=True)
+
+
+def _stack():
+    try:
+        return _local.stack
+    except AttributeError:
+        _local.stack = []
+        return _local.stack
+
+
+def current():
+    """Return the active ProfileStats of this thread or None."""
+    stack = _stack()
+    if stack:
+        return stack[-1]
+    return None
+
+
+def _attach(stats):
+    # used by ccp.parallel to record the calls of thread workers in the profile
+    # active in the thread that created the pool
+    _local.stack = [] if stats is None else [stats]
+
+
+@contextmanager
+def profile():
+    """Record EOS calls, solver iterations and Point calculations.
+
+    The context is active only in the thread that entered it (and in the
+    workers of "thread" pools created inside it). Calls in process-pool
+    workers are not counted.
+
+    Yields
+    ------
+    stats : ProfileStats
+        Object that is filled with the statistics while the context is active.
+
+    Examples
+    --------
+    >>> import ccp
+    >>> with ccp.profile() as stats:
+    ...     pass
+    >>> stats.states["calls"]
+    0
+    """
+    stats = ProfileStats()
+    _stack().append(stats)
+    start = time.perf_counter()
+    try:
+        yield stats
+    finally:
+        stats.elapsed = time.perf_counter() - start
+        _stack().remove(stats)
+
+
+@contextmanager
+def timed_calc(method):
+    """Record the time of a Point._calc_from_* method in the active profile."""
+    stats = current()
+    if stats is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats.add_calc(method, time.perf_counter() - start)
+
+
+def _call_site():
+    # function that called the solver, e.g. ccp.point.disch_from_suc_head_eff
+    frame = sys._getframe(2)
+    code = frame.f_code
+    # co_qualname is only available in Python >= 3.11
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{frame.f_globals.get('__name__')}.{name}"
+
+
+def newton(func, x0, *args, **kwargs):
+    """scipy.optimize.newton that records iterations in the active profile.
+
+    Accepts the same arguments and returns the same values as
+    scipy.optimize.newton. For an array x0 the iterations are not reported by
+    scipy, and the call is recorded as failed if any element did not converge.
+    """
+    stats = current()
+    if stats is None:
+        return optimize.newton(func, x0, *args, **kwargs)
+
+    site = _call_site()
+    full_output = kwargs.pop("full_output", False)
+    try:
+        output = optimize.newton(func, x0, *args, full_output=True, **kwargs)
+    except (RuntimeError, ValueError):
+        stats.add_solver(site, failed=True)
+        raise
+
+    if np.size(x0) > 1:
+        # array version: (root, converged, zero_der)
+        root, converged, _ = output
+        stats.add_solver(site, failed=not np.all(converged))
+    else:
+        root, result = output
+        stats.add_solver(
+            site,
+            iterations=int(getattr(result, "iterations", 0)),
+            function_calls=int(getattr(result, "function_calls", 0)),
+            failed=not getattr(result, "converged", True),
+        )
+
+    if full_output:
+        return output
+    return root
+
+
+def fsolve(func, x0, *args, **kwargs):
+    """scipy.optimize.fsolve that records function calls in the active profile.
+
+    Accepts the same arguments and returns the same values as
+    scipy.optimize.fsolve. fsolve does not report iterations, so the number of
+    function calls is recorded for both.
+    """
+    stats = current()
+    if stats is None:
+        return optimize.fsolve(func, x0, *args, **kwargs)
+
+    site = _call_site()
+    full_output = kwargs.pop("full_output", False)
+    x, info, ier, msg = optimize.fsolve(func, x0, *args, full_output=True, **kwargs)
+    stats.add_solver(
+        site, iterations=info["nfev"], function_calls=info["nfev"], failed=ier != 1
+    )
+
+    if full_output:
+        return x, info, ier, msg
+    return x
+
+
+def fixed_point(func, x0, *args, **kwargs):
+    """ccp.solvers.fixed_point that records iterations in the active profile.
+
+    Accepts the same arguments and returns the same values as
+    ccp.solvers.fixed_point. Each call to func is recorded as an iteration.
+    """
+    stats = current()
+    if stats is None:
+        return solvers.fixed_point(func, x0, *args, **kwargs)
+
+    site = _call_site()
+    full_output = kwargs.pop("full_output", False)
+    x, converged, calls = solvers.fixed_point(
+        func, x0, *args, full_output=True, **kwargs
+    )
+    stats.add_solver(site, iterations=calls, function_calls=calls, failed=not converged)
+
+    if full_output:
+        return x, converged, calls
+    return x, converged
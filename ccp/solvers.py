@@ -0,0 +1,65 @@
+"""Module with the iterative solvers used by ccp that are not in scipy.
+
+Use the wrappers in ccp.profiling in the ccp calculations, so that the
+iterations are recorded in the active profile.
+"""
+
+__all__ = ["fixed_point"]
+
+
+def fixed_point(func, x0, rtol=1e-8, maxiter=20, full_output=False):
+    """Solve x = func(x) with secant acceleration.
+
+    The first iteration is a fixed-point step (x1 = func(x0)) and the next ones
+    use the secant method on the residual func(x) - x, so a func that is close
+    to linear converges in 2 or 3 calls.
+
+    Parameters
+    ----------
+    func : callable
+        Function of a float.
+    x0 : float
+        Initial guess.
+    rtol : float, optional
+        Relative tolerance, the solution satisfies
+        abs(func(x) - x) <= rtol * abs(x). Default is 1e-8.
+    maxiter : int, optional
+        Maximum number of calls to func. Default is 20.
+    full_output : bool, optional
+        If True, the number of calls to func is also returned. Default is False.
+
+    Returns
+    -------
+    x : float
+        Last value for which func was called (the solution if converged).
+    converged : bool
+        False if the tolerance was not reached in maxiter calls.
+    calls : int
+        Number of calls to func, only returned if full_output is True.
+
+    Examples
+    --------
+    >>> from ccp.solvers import fixed_point
+    >>> x, converged = fixed_point(lambda x: 0.5 * x + 150, 100.0)
+    >>> round(x, 6), converged
+    (300.0, True)
+    """
+    x, x_prev, residual_prev = x0, None, None
+    converged = False
+    for calls in range(1, maxiter + 1):
+        fx = func(x)
+        residual = fx - x
+        if abs(residual) <= rtol * abs(x):
+            converged = True
+            break
+        if calls == maxiter:
+            break
+        if x_prev is None or residual == residual_prev:
+            x_new = fx
+        else:
+            x_new = x - residual * (x - x_prev) / (residual - residual_prev)
+        x_prev, residual_prev, x = x, residual, x_new
+
+    if full_output:
+        return x, converged, calls
+    return x, converged
@@ -4,14 +4,16 @@ from warnings import warn
 import CoolProp.CoolProp as CP
 import numpy as np
 import ccp.config
-from scipy.optimize import newton
-from plotly import graph_objects as go
 from itertools import combinations
-from . import _RP
+from time import perf_counter
+from . import _refprop, _refprop_lock
+from . import profiling
+from .profiling import newton
 
 from . import Q_
 from .config.fluids import get_name, normalize_mix
 from .config.units import check_units
+from .plotly_theme import go
 
 
 class State(CP.AbstractState):
@@ -61,6 +63,8 @@ class State(CP.AbstractState):
     """
 
     def __new__(cls, *args, **kwargs):
+        # REFPROP path has to be set before the first state is created
+        _refprop()
         fluid = kwargs.get("fluid")
         if fluid is None:
             raise TypeError("A fluid is required. Provide as fluid=dict(...)")
@@ -70,6 +74,9 @@ class State(CP.AbstractState):
 
         _fluid = "&".join([get_name(name) for name in fluid.keys()])
 
+        stats = profiling.current()
+        if stats is not None:
+            start = perf_counter()
         try:
             state = super().__new__(cls, EOS, _fluid)
         except ValueError:
@@ -82,6 +89,8 @@ class State(CP.AbstractState):
                 except ValueError:
                     error_msg += f"\nCould not create state with {fluid1} + {fluid2}"
             raise ValueError(error_msg)
+        if stats is not None:
+            stats.add_state(perf_counter() - start)
         return state
 
     @check_units
@@ -97,6 +106,10 @@ class State(CP.AbstractState):
     ):
         # no call to super(). see :
         # http://stackoverflow.com/questions/18260095/
+        # store the EOS used to create the state so that copies use the same EOS
+        # regardless of the current ccp.config.EOS
+        if EOS is None:
+            EOS = ccp.config.EOS
         self.EOS = EOS
 
         constituents = []
@@ -222,17 +235,19 @@ class State(CP.AbstractState):
         # use REFPROP directly with forced gas condition if cp value does not converge
         if cp < 0:
             fluids = self._fluid.replace("&", "*")
-            r = _RP.REFPROPdll(
-                fluids,
-                "PTV",
-                "Cp",
-                _RP.MASS_BASE_SI,
-                0,
-                0,
-                self.p("kPa").m,
-                self.T().m,
-                self.get_mole_fractions(),
-            )
+            RP = _refprop()
+            with _refprop_lock:
+                r = RP.REFPROPdll(
+                    fluids,
+                    "PTV",
+                    "Cp",
+                    RP.MASS_BASE_SI,
+                    0,
+                    0,
+                    self.p("kPa").m,
+                    self.T().m,
+                    self.get_mole_fractions(),
+                )
             cp = Q_(r.Output[0], "joule/(kilogram kelvin)")
 
         if units:
@@ -511,7 +526,7 @@ class State(CP.AbstractState):
         return conductivity
 
     def __reduce__(self):
-        kwargs = dict(p=self.p(), T=self.T(), fluid=self.fluid)
+        kwargs = dict(p=self.p(), T=self.T(), fluid=self.fluid, EOS=self.EOS)
         return self._rebuild, (self.__class__, kwargs)
 
     @staticmethod
@@ -610,6 +625,9 @@ class State(CP.AbstractState):
         for item in ["kwargs", "self", "__class__"]:
             args.pop(item)
         args = [k for k, v in args.items() if v is not None]
+        stats = profiling.current()
+        if stats is not None:
+            start = perf_counter()
         try:
             if p is not None and T is not None:
                 super().update(CP.PT_INPUTS, p.magnitude, T.magnitude)
@@ -618,7 +636,7 @@ class State(CP.AbstractState):
             elif p is not None and h is not None:
                 super().update(CP.HmassP_INPUTS, h.magnitude, p.magnitude)
             elif p is not None and s is not None:
-                if ccp.config.EOS == "REFPROP":
+                if self.EOS == "REFPROP":
                     super().update(CP.PSmass_INPUTS, p.magnitude, s.magnitude)
                 else:
                     # ps update not available for some EOS, this is a workaround based on:
@@ -638,17 +656,19 @@ class State(CP.AbstractState):
                     # handle convergence error by forcing gas state directly with REFPROP
                     # calculate with p and T and update with their values
                     fluids = self._fluid.replace("&", "*")
-                    r = _RP.REFPROPdll(
-                        fluids,
-                        "DSV",
-                        "P,T",
-                        _RP.MASS_BASE_SI,
-                        0,
-                        0,
-                        rho.magnitude,
-                        s.magnitude,
-                        self.get_mole_fractions(),
-                    )
+                    RP = _refprop()
+                    with _refprop_lock:
+                        r = RP.REFPROPdll(
+                            fluids,
+                            "DSV",
+                            "P,T",
+                            RP.MASS_BASE_SI,
+                            0,
+                            0,
+                            rho.magnitude,
+                            s.magnitude,
+                            self.get_mole_fractions(),
+                        )
                     super().update(CP.PT_INPUTS, r.Output[0], r.Output[1])
             elif rho is not None and T is not None:
                 super().update(CP.DmassT_INPUTS, rho.magnitude, T.magnitude)
@@ -665,6 +685,9 @@ class State(CP.AbstractState):
             raise ValueError(
                 f"Could not define state with {args_dict} and {self.fluid}"
             ) from e
+        finally:
+            if stats is not None:
+                stats.add_update("_".join(args), perf_counter() - start)
 
     def get_coolprop_state(self):
         """Return a CoolProp state object."""
@@ -0,0 +1,153 @@
+import io
+import time
+import zipfile
+
+import pytest
+from numpy.testing import assert_allclose
+
+import ccp
+from ccp import Q_
+from ccp.app import jobs, session
+from ccp.app.calculations import denormalize, normalize, state_inputs
+from ccp.compressor import Point1Sec, StraightThrough
+
+
+def test_normalize_same_inputs_different_units():
+    fluid = {"Methane": 0.9, "ethane": 0.1}
+    inputs_1 = {
+        "suc": state_inputs(p=Q_(1, "bar"), T=Q_(300, "degK"), fluid=fluid),
+        "flow_m": Q_(3600, "kg/h"),
+        "reynolds_correction": True,
+    }
+    inputs_2 = {
+        "reynolds_correction": True,
+        "flow_m": Q_(1, "kg/s"),
+        "suc": state_inputs(
+            p=Q_(100, "kPa"), T=Q_(300, "degK"), fluid={"ethane": 0.1, "methane": 0.9}
+        ),
+    }
+
+    assert normalize(inputs_1) == normalize(inputs_2)
+    assert normalize(inputs_1) != normalize({**inputs_1, "flow_m": Q_(2, "kg/s")})
+
+
+def test_denormalize():
+    inputs = normalize(
+        {
+            "suc": state_inputs(
+                p=Q_(1, "bar"), T=Q_(300, "degK"), fluid={"methane": 1.0}
+            ),
+            "speed": Q_(1000, "RPM"),
+        }
+    )
+    kwargs = denormalize(inputs)
+
+    assert isinstance(kwargs["suc"], ccp.State)
+    assert_allclose(kwargs["suc"].p().m, 100000)
+    assert_allclose(kwargs["speed"].to("RPM").m, 1000)
+
+
+def count(n, _callback=None):
+    for i in range(1, n + 1):
+        time.sleep(0.01)
+        _callback(i, n)
+    return n
+
+
+def wait(job):
+    while not job.finished:
+        time.sleep(0.01)
+
+
+def test_job_done():
+    job = jobs.submit("count", count, 5)
+    wait(job)
+
+    assert job.status == "done"
+    assert job.progress == 1.0
+    assert job.result() == 5
+    assert jobs.pop("count") is job
+    assert jobs.get("count") is None
+
+
+def test_job_cancel():
+    job = jobs.submit("count", count, 1000)
+    time.sleep(0.05)
+    job.cancel()
+    wait(job)
+
+    assert job.status == "cancelled"
+    with pytest.raises(jobs.JobCancelled):
+        job.result()
+
+
+@pytest.fixture
+def straight_through():
+    def state(p, T):
+        return ccp.State(p=Q_(p, "bar"), T=Q_(T, "degK"), fluid={"methane": 1})
+
+    guarantee_point = ccp.Point(
+        suc=state(1, 300),
+        flow_v=Q_(1.5, "m³/s"),
+        speed=Q_(9000, "RPM"),
+        head=Q_(100, "kJ/kg"),
+        eff=0.8,
+        b=Q_(0.02, "m"),
+        D=Q_(0.35, "m"),
+    )
+    test_points = [
+        Point1Sec(
+            suc=state(1, 300),
+            disch=state(p, T),
+            flow_m=Q_(flow_m, "kg/s"),
+            speed=Q_(9000, "RPM"),
+            b=Q_(0.02, "m"),
+            D=Q_(0.35, "m"),
+            balance_line_flow_m=Q_(0.02, "kg/s"),
+            seal_gas_flow_m=Q_(0.01, "kg/s"),
+            seal_gas_temperature=Q_(300, "degK"),
+        )
+        for p, T, flow_m in [(2.0, 360, 0.7), (1.9, 358, 0.9), (1.7, 352, 1.1)]
+    ]
+
+    return StraightThrough(guarantee_point=guarantee_point, test_points=test_points)
+
+
+def save_session(compressor):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zip_file:
+        session.save_compressor(zip_file, "straight_through", compressor)
+    return buffer
+
+
+def test_session_load_results(straight_through, monkeypatch):
+    buffer = save_session(straight_through)
+
+    # results are used, the compressor is not calculated again
+    monkeypatch.setattr(StraightThrough, "__init__", None)
+    with zipfile.ZipFile(buffer) as zip_file:
+        loaded = session.load_compressor(zip_file, "straight_through", StraightThrough)
+
+    assert loaded == straight_through
+    assert isinstance(loaded.test_points[0], Point1Sec)
+    assert_allclose(loaded.test_points[0].Ts1r, straight_through.test_points[0].Ts1r)
+    assert_allclose(
+        loaded.points_rotor_sp[0].mach, straight_through.points_rotor_sp[0].mach
+    )
+    flow_v = Q_(1.2, "m³/s")
+    assert_allclose(
+        loaded.point(flow_v=flow_v, speed=loaded.speed).head,
+        straight_through.point(flow_v=flow_v, speed=straight_through.speed).head,
+    )
+
+
+def test_session_load_recalculates_with_other_config(straight_through):
+    buffer = save_session(straight_through)
+
+    with ccp.config.override(POLYTROPIC_METHOD="huntington"):
+        with zipfile.ZipFile(buffer) as zip_file:
+            loaded = session.load_compressor(
+                zip_file, "straight_through", StraightThrough
+            )
+
+    assert loaded.points_flange_sp[0].head_calc_func.__name__ == "head_pol_huntington"
@@ -0,0 +1,89 @@
+import pytest
+from numpy.testing import assert_allclose
+
+import ccp
+from ccp import Q_, State, Point, Impeller, ImpellerCache
+
+
+@pytest.fixture
+def imp1():
+    fluid = dict(methane=0.9, ethane=0.1)
+    suc = State(p=Q_(1.6995, "MPa"), T=311.55, fluid=fluid)
+
+    p0 = Point(
+        suc=suc,
+        flow_v=Q_(6501.67, "m**3/h"),
+        speed=Q_(11145, "RPM"),
+        head=Q_(179.275, "kJ/kg"),
+        eff=0.826357,
+        b=Q_(28.5, "mm"),
+        D=Q_(365, "mm"),
+    )
+    p1 = Point(
+        suc=suc,
+        flow_v=Q_(7016.72, "m**3/h"),
+        speed=Q_(11145, "RPM"),
+        head=Q_(173.057, "kJ/kg"),
+        eff=0.834625,
+        b=Q_(28.5, "mm"),
+        D=Q_(365, "mm"),
+    )
+
+    return Impeller([p0, p1])
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ImpellerCache(tmp_path / "cache")
+    ccp.config.IMPELLER_CACHE = cache
+    yield cache
+    ccp.config.IMPELLER_CACHE = None
+
+
+def test_cache_max_size(tmp_path):
+    assert ImpellerCache(tmp_path, max_size=1000).max_size == 1000
+    assert ImpellerCache(tmp_path, max_size="1 kB").max_size == 1000
+    assert ImpellerCache(tmp_path, max_size=Q_(2, "MB")).max_size == 2000000
+
+
+def test_cache_eviction(tmp_path):
+    cache = ImpellerCache(tmp_path, max_size=3500)
+    data = bytes(1000)
+    for key in ["a", "b", "c"]:
+        cache.put(key, data)
+    assert len(cache) == 3
+
+    # access "a" so that "b" is the least recently used entry
+    for key, mtime in zip(["a", "b", "c"], [3, 1, 2]):
+        path = cache._path(key)
+        ccp.cache.os.utime(path, (mtime, mtime))
+    cache.put("d", data)
+
+    assert "b" not in cache
+    assert all(key in cache for key in ["a", "c", "d"])
+    assert cache.size <= cache.max_size
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.get("a") is None
+
+
+def test_cache_key(imp1):
+    suc = State(p=Q_(0.2, "MPa"), T=301.58, fluid={"n2": 0.8, "co2": 0.2})
+    key = ImpellerCache.key(imp1, suc)
+
+    assert key == ImpellerCache.key(imp1, suc)
+    assert key != ImpellerCache.key(imp1, suc, speed="same")
+    suc.update(p=Q_(0.21, "MPa"), T=301.58)
+    assert key != ImpellerCache.key(imp1, suc)
+
+
+def test_cache_convert_from(imp1, cache):
+    new_suc = State(p=Q_(0.2, "MPa"), T=301.58, fluid={"n2": 0.8, "co2": 0.2})
+    imp2 = Impeller.convert_from(imp1, suc=new_suc, find="speed")
+    assert len(cache) == 1
+
+    imp2_cached = Impeller.convert_from(imp1, suc=new_suc, find="speed")
+    assert imp2_cached == imp2
+    assert_allclose(imp2_cached[0].speed, imp2[0].speed)
+    assert_allclose(imp2_cached[0].head, imp2[0].head)
@@ -9,6 +9,7 @@ from ccp.compressor import (
     PointFirstSection,
     PointSecondSection,
     BackToBack,
+    parameter_interpolation,
 )
 from ccp.point import Point
 from ccp.state import State
@@ -353,6 +354,52 @@ def test_straight_through(straight_through):
     assert_allclose(point_sp.eff, 0.820459, rtol=1e-5)
 
 
+def test_straight_through_callback(straight_through):
+    progress = []
+    StraightThrough(
+        guarantee_point=straight_through.guarantee_point,
+        test_points=straight_through.test_points,
+        callback=lambda done, total: progress.append((done, total)),
+    )
+    n = 2 * len(straight_through.test_points)
+    assert progress == [(i, n) for i in range(1, n + 1)]
+
+    def cancel(done, total):
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        StraightThrough(
+            guarantee_point=straight_through.guarantee_point,
+            test_points=straight_through.test_points,
+            callback=cancel,
+        )
+
+
+def test_straight_through_sweep(straight_through):
+    guarantee_point = straight_through.guarantee_point
+    progress = []
+    results = StraightThrough.sweep(
+        straight_through.test_points,
+        [guarantee_point, guarantee_point],
+        backend="thread",
+        callback=lambda done, total: progress.append((done, total)),
+    )
+    n = 2 * len(straight_through.test_points)
+    assert len(progress) == n and progress[-1] == (n, n)
+    assert len(results) == 2
+
+    point = straight_through.point(
+        flow_m=guarantee_point.flow_m, speed=straight_through.speed
+    )
+    assert_allclose(results["head"], point.head.m)
+    assert_allclose(results["pd"], point.disch.p().m)
+    assert results["compressor"][1] == straight_through
+    assert_allclose(
+        results["compressor"][1].points_flange_sp[0].disch.p(),
+        straight_through.points_flange_sp[0].disch.p(),
+    )
+
+
 def test_straight_through_calculate_speed(straight_through):
     straight_through = straight_through.calculate_speed_to_match_discharge_pressure()
     point_sp = straight_through.point(
@@ -373,6 +420,24 @@ def test_save_and_load_straight(straight_through):
     assert straight_through == straight_through_loaded
 
 
+def test_save_and_load_straight_results(straight_through):
+    file = Path(tempdir) / "straight_through_results.toml"
+    straight_through.save(file, results=True)
+
+    straight_through_loaded = StraightThrough.load(file)
+
+    assert straight_through == straight_through_loaded
+    assert_allclose(
+        straight_through_loaded.points_flange_sp[0].disch.p(),
+        straight_through.points_flange_sp[0].disch.p(),
+    )
+    assert_allclose(
+        straight_through_loaded.points_rotor_sp[0].mach,
+        straight_through.points_rotor_sp[0].mach,
+    )
+    assert_allclose(straight_through_loaded.head, straight_through.head)
+
+
 def test_point2sec():
     p = PointFirstSection(
         flow_m=Q_(4.325, "kg/s"),
@@ -1033,6 +1098,25 @@ def test_back_to_back_with_reynolds_correction(back_to_back):
     assert_allclose(p0r.power, 3375713.294289, 1e-4)
 
 
+def test_back_to_back_point_many(back_to_back):
+    back_to_back = BackToBack(**back_to_back)
+    flow_m = Q_([140000, 153951.321926329], "kg/h")
+
+    points = back_to_back.point_sec1_many(flow_m=flow_m, speed=back_to_back.speed)
+    p0f_sp = back_to_back.point_sec1(flow_m=flow_m[1], speed=back_to_back.speed)
+    assert len(points) == 2
+    assert_allclose(points["power"][1], p0f_sp.power)
+    assert_allclose(points["mach_diff"][1], p0f_sp.mach_diff)
+    assert_allclose(points["reynolds_ratio"][1], p0f_sp.reynolds_ratio)
+
+    points = back_to_back.point_sec2_many(
+        flow_m=Q_([50, 53.092244], "kg/s"), speed=back_to_back.speed
+    )
+    assert_allclose(points["power"][1], 3359509.626922, 1e-4)
+    df = points.to_dataframe(units={"power": "kW"})
+    assert_allclose(df["power"][1], 3359.509626922, 1e-4)
+
+
 def test_back_to_back_calculate_speed(back_to_back):
     back_to_back = BackToBack(**back_to_back, reynolds_correction=True)
     back_to_back = back_to_back.calculate_speed_to_match_discharge_pressure()
@@ -1052,3 +1136,22 @@ def test_save_and_load(back_to_back):
     back_to_back_loaded = BackToBack.load(file)
 
     assert back_to_back == back_to_back_loaded
+
+
+def test_parameter_interpolation():
+    phi_values = [0.3, 0.1, 0.2]
+    mach_values = [0.8, 0.5, 0.7]
+
+    assert_allclose(parameter_interpolation(0.15, phi_values, mach_values), 0.6)
+    assert_allclose(
+        parameter_interpolation(np.array([0.05, 0.25, 0.35]), phi_values, mach_values),
+        [0.4, 0.75, 0.85],
+    )
+    # values in the order of the test points (decreasing phi)
+    assert_allclose(
+        parameter_interpolation(0.25, phi_values[::-1], mach_values[::-1]), 0.75
+    )
+    result = parameter_interpolation(
+        Q_(0.15, "dimensionless"), Q_(phi_values), Q_(mach_values, "dimensionless")
+    )
+    assert_allclose(result.m, 0.6)
@@ -1,4 +1,8 @@
+import zipfile
+
 import pandas as pd
+import pytest
+import toml
 import ccp
 from numpy.testing import assert_allclose
 from tempfile import tempdir
@@ -75,7 +79,28 @@ def test_evaluation():
 
     loaded_evaluation = ccp.Evaluation.load(file)
     assert_allclose(loaded_evaluation.df["delta_eff"].mean(), 0.112725, rtol=1e-2)
+    assert len(loaded_evaluation.impellers_new) == len(evaluation.impellers_new)
     assert loaded_evaluation.impellers_new[0] == evaluation.impellers_new[0]
+    assert loaded_evaluation.impellers[0] == evaluation.impellers[0]
+
+    # points keep the settings they were saved with, matching the saved results
+    with zipfile.ZipFile(file) as zip_file:
+        file_format = toml.loads(zip_file.read("format.toml").decode("utf-8"))
+    assert file_format["version"] == 2
+    assert file_format["EOS"] == ccp.config.EOS
+    with ccp.config.override(POLYTROPIC_METHOD="sandberg_colby"):
+        with pytest.warns(UserWarning, match="polytropic_method"):
+            loaded_evaluation = ccp.Evaluation.load(file)
+        point = loaded_evaluation.impellers[0].points[0]
+    saved_point = evaluation.impellers[0].points[0]
+    assert point.head_calc_func.__name__ == saved_point.head_calc_func.__name__
+    assert point.suc.EOS == file_format["EOS"]
+
+    # each cluster impeller is converted to its own cluster center
+    for i, imp_new in enumerate(evaluation.impellers_new):
+        cluster = evaluation.df[evaluation.df["cluster"] == i].iloc[0]
+        assert_allclose(imp_new.points[0].suc.p("bar").m, cluster.ps_center)
+        assert_allclose(imp_new.points[0].suc.T("degC").m, cluster.Ts_center)
 
 
 def test_evaluation_calculate_points():
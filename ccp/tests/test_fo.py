@@ -85,3 +85,65 @@ def test_flow_orifice(fo1, fo2, fo3, fo4):
     assert_allclose(fo2.qm.to("kg/h").m, 36408.6871553386)
     assert_allclose(fo3.qm.to("kg/h").m, 36408.6871553386)
     assert_allclose(fo4.qm.to("kg/h").m, 36408.6871553386)
+
+
+def test_flow_orifice_solve_d(fo1):
+    d = ccp.FlowOrifice.solve(
+        state=fo1.state,
+        D=fo1.D,
+        find="d",
+        delta_p=fo1.delta_p,
+        flow_m=fo1.qm,
+    )
+    assert_allclose(d.to("mm").m, 170.0)
+
+    d_from_flow_v = ccp.FlowOrifice.solve(
+        state=fo1.state,
+        D=fo1.D,
+        find="d",
+        delta_p=fo1.delta_p,
+        flow_v=fo1.flow_v,
+    )
+    assert_allclose(d_from_flow_v.to("mm").m, 170.0)
+
+
+def test_flow_orifice_solve_delta_p(fo1, fo4):
+    delta_p = ccp.FlowOrifice.solve(
+        state=fo1.state, D=fo1.D, find="delta_p", d=fo1.d, flow_m=fo1.qm
+    )
+    assert_allclose(delta_p.to("bar").m, 0.1)
+
+    # fo4 state is updated to the upstream condition when instantiated
+    state_downstream = ccp.State(p=990000.0, T=313.15, fluid=fo4.state.fluid)
+    delta_p = ccp.FlowOrifice.solve(
+        state=state_downstream,
+        D=fo4.D,
+        find="delta_p",
+        d=fo4.d,
+        flow_m=fo4.qm,
+        state_upstream=False,
+    )
+    assert_allclose(delta_p.to("Pa").m, 10000.0, rtol=1e-6)
+
+
+def test_flow_orifice_solve_array(fo1):
+    qm = fo1.qm.to("kg/h").m
+    flow_m = Q_([0.8 * qm, qm, 1.2 * qm], "kg/h")
+    d = ccp.FlowOrifice.solve(
+        state=fo1.state, D=fo1.D, find="d", delta_p=fo1.delta_p, flow_m=flow_m
+    )
+    assert d.shape == (3,)
+    assert_allclose(d[1].to("mm").m, 170.0)
+    assert d[0] < d[1] < d[2]
+
+    delta_p = ccp.FlowOrifice.solve(
+        state=fo1.state, D=fo1.D, find="delta_p", d=d, flow_m=flow_m
+    )
+    assert_allclose(delta_p.to("bar").m, [0.1, 0.1, 0.1])
+
+
+def test_flow_orifice_solve_errors(fo1):
+    with pytest.raises(ValueError, match="find must be"):
+        ccp.FlowOrifice.solve(state=fo1.state, D=fo1.D, find="D", flow_m=1.0)
+    with pytest.raises(ValueError, match="delta_p must be given"):
+        ccp.FlowOrifice.solve(state=fo1.state, D=fo1.D, find="d", flow_m=1.0)
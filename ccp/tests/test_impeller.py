@@ -184,6 +184,64 @@ def test_impeller_disch_state(imp2):
     )
 
 
+def test_impeller_convert_from_many(imp1):
+    sucs = [
+        State(p=Q_(0.2, "MPa"), T=301.58, fluid={"n2": 1 - 1e-15, "co2": 1e-15}),
+        State(p=Q_(0.3, "MPa"), T=301.58, fluid={"n2": 1 - 1e-15, "co2": 1e-15}),
+    ]
+    progress = []
+    imps = Impeller.convert_from_many(
+        imp1,
+        sucs,
+        find="speed",
+        processes=2,
+        callback=lambda done, total: progress.append((done, total)),
+    )
+
+    # 2 suction states x 2 points x 2 conversion steps
+    assert progress[-1] == (8, 8)
+    assert len(imps) == 2
+    for imp_new, suc in zip(imps, sucs):
+        assert_allclose(imp_new[0].suc.p(), suc.p())
+        assert imp_new == Impeller.convert_from(imp1, suc=suc, find="speed")
+
+
+def test_impeller_convert_from_warm_start(imp1):
+    new_suc = State(p=Q_(0.2, "MPa"), T=301.58, fluid={"n2": 1 - 1e-15, "co2": 1e-15})
+    imp2 = Impeller.convert_from(imp1, suc=new_suc, find="speed")
+    with ccp.config.override(WARM_START=True):
+        imp2_warm = Impeller.convert_from(imp1, suc=new_suc, find="speed")
+
+    for p, p_warm in zip(imp2.points, imp2_warm.points):
+        assert_allclose(p_warm.head, p.head, rtol=1e-3)
+        assert_allclose(p_warm.eff, p.eff, rtol=1e-3)
+        assert_allclose(p_warm.speed, p.speed, rtol=1e-3)
+    # the second point starts from the first one
+    assert imp2_warm[1].solver_calls < imp2[1].solver_calls
+
+
+def test_curve_convert_to(imp1):
+    new_suc = State(p=Q_(0.2, "MPa"), T=301.58, fluid={"n2": 1 - 1e-15, "co2": 1e-15})
+    imp2 = Impeller.convert_from(imp1, suc=new_suc, find="speed")
+    curve = imp1.curves[0].convert_to(new_suc, find="speed")
+    assert curve == imp2.curves[0]
+
+    # vectorized Reynolds correction is the same as the one for each point
+    speed = Q_(8000, "RPM")
+    curve = imp1.curves[0].convert_to(new_suc, speed=speed, reynolds_correction=True)
+    for p_original, p in zip(imp1.curves[0], curve):
+        expected = Point.convert_from(
+            Point.convert_from(p_original, suc=new_suc, reynolds_correction=True),
+            suc=new_suc,
+            find="volume_ratio",
+            speed=speed,
+            reynolds_correction=True,
+        )
+        assert_allclose(p.eff, expected.eff, rtol=1e-8)
+        assert_allclose(p.head, expected.head, rtol=1e-8)
+        assert_allclose(p.speed, speed)
+
+
 def test_impeller2_new_suction(imp2):
     new_suc = State(p=Q_(0.2, "MPa"), T=301.58, fluid={"n2": 1 - 1e-15, "co2": 1e-15})
     imp2_new = Impeller.convert_from(imp2, suc=new_suc, find="speed")
@@ -247,6 +305,84 @@ def test_impeller_point(imp3):
         assert "Expected point is being extrapolated" in record[0].message.args[0]
 
 
+def test_impeller_point_many(imp3):
+    flow_m = Q_([70000, 90184], "kg/h")
+    with pytest.warns(UserWarning, match="Expected point is being extrapolated"):
+        points = imp3.point_many(flow_m=flow_m, speed=Q_(9300, "RPM"))
+    assert len(points) == 2
+    assert_allclose(points["flow_m"], flow_m.to("kg/s"))
+    assert_allclose(points["eff"][1], 0.782169, rtol=1e-4)
+    assert_allclose(points["head"][1], 97729.49349, rtol=1e-4)
+    assert_allclose(points["power"][1], 3130330.074989, rtol=1e-4)
+
+    p0 = imp3.point(flow_m=flow_m[0], speed=Q_(9300, "RPM"))
+    assert points[0] == p0
+
+
+def test_impeller_envelope(imp3):
+    envelope = imp3.envelope()
+    assert envelope.right_limits == ["stonewall"] * len(imp3.curves)
+    assert_allclose(envelope.lines["surge"][0], [c.flow_v[0] for c in imp3.curves])
+    assert_allclose(envelope.lines["stonewall"][1], [c.head[-1] for c in imp3.curves])
+    assert imp3.envelope() is envelope
+
+    p0 = imp3.point(flow_m=Q_(90184, "kg/h"), speed=Q_(9300, "RPM"))
+    assert envelope.contains(flow_v=p0.flow_v, head=p0.head)
+    inside = envelope.contains(
+        flow_v=Q_([p0.flow_v.m, p0.flow_v.m, 0.1 * p0.flow_v.m], "m³/s"),
+        head=Q_([p0.head.m, 2 * p0.head.m, p0.head.m], "J/kg"),
+    )
+    assert inside.tolist() == [True, False, False]
+
+    min_head = 0.9 * p0.head
+    envelope = imp3.envelope(min_head=min_head)
+    assert_allclose(envelope.lines["min_head"][1], min_head)
+    assert not envelope.contains(flow_v=p0.flow_v * 1.1, head=0.95 * min_head)
+
+
+def test_impeller_locate(imp3):
+    p0 = imp3.point(flow_m=Q_(90184, "kg/h"), speed=Q_(9300, "RPM"))
+    p1 = imp3.point(flow_m=Q_(80000, "kg/h"), speed=Q_(9000, "RPM"))
+
+    location = imp3.locate(
+        flow_m=Q_([p0.flow_m.m, p1.flow_m.m], "kg/s"),
+        disch_p=Q_([p0.disch.p().m, p1.disch.p().m], "Pa"),
+    )
+    assert_allclose(location["speed"], [p0.speed, p1.speed], rtol=1e-4)
+    assert location["extrapolated"].tolist() == [False, False]
+
+    location = imp3.locate(
+        flow_v=Q_([p0.flow_v.m, p1.flow_v.m], "m³/s"),
+        head=Q_([p0.head.m, 2 * p1.head.m], "J/kg"),
+    )
+    assert_allclose(location["speed"][0], p0.speed, rtol=1e-2)
+    assert_allclose(location["eff"][0], p0.eff, rtol=1e-2)
+    assert location["extrapolated"].tolist() == [False, True]
+
+    # sample with another suction and a flow below the surge flow
+    suc = ccp.State(
+        p=0.9 * p0.suc.p(), T=p0.suc.T() + Q_(10, "degK"), fluid=p0.suc.fluid
+    )
+    p2 = Point(
+        suc=suc,
+        flow_v=p0.flow_v,
+        speed=p0.speed,
+        head=p0.head,
+        eff=p0.eff,
+        b=p0.b,
+        D=p0.D,
+    )
+    location = imp3.locate(
+        flow_m=Q_([p2.flow_m.m, 0.5 * p2.flow_m.m], "kg/s"),
+        disch_p=Q_([p2.disch.p().m, p2.disch.p().m], "Pa"),
+        suc=suc,
+    )
+    assert_allclose(location["flow_v"][0], p0.flow_v)
+    assert_allclose(location["speed"][0], p0.speed, rtol=1e-2)
+    assert_allclose(location["head"][0], p0.head, rtol=1e-2)
+    assert location["extrapolated"].tolist() == [False, True]
+
+
 def test_conversion(imp3):
     new_suc = ccp.State(p=Q_(2000, "kPa"), T=300, fluid={"co2": 1})
     new_imp3 = ccp.Impeller.convert_from(imp3, suc=new_suc)
@@ -508,6 +644,34 @@ def test_impeller_from_head_power(imp3):
     assert_allclose(imp.power, imp3.power)
     assert_allclose(imp.eff, imp3.eff)
 
+    # same curves with volume and mass flow in other units
+    rho = imp3.points[0].suc.rho().m
+    head_curves_m3h = {
+        speed: dict(curve, x1=[x * 3600 for x in curve["x1"]])
+        for speed, curve in head_curves.items()
+    }
+    power_curves_kgs = {
+        speed: dict(curve, x1=[x * rho for x in curve["x1"]])
+        for speed, curve in power_curves.items()
+    }
+    head_x1 = [list(curve["x1"]) for curve in head_curves_m3h.values()]
+    imp = Impeller.load_from_dict(
+        suc=imp3.points[0].suc,
+        b=imp3.points[0].b,
+        D=imp3.points[0].D,
+        head_curves=head_curves_m3h,
+        power_curves=power_curves_kgs,
+        number_of_points=6,
+        flow_units="m³/h",
+        flow_units_power="kg/s",
+        head_units="J/kg",
+    )
+
+    assert_allclose(imp.head, imp3.head)
+    assert_allclose(imp.power, imp3.power)
+    # the input dicts are not changed
+    assert [curve["x1"] for curve in head_curves_m3h.values()] == head_x1
+
 
 def test_impeller_curve():
     imp = impeller_example()
@@ -643,6 +807,19 @@ def test_save_load():
     assert imp_fd == imp_fd_loaded
 
 
+def test_save_load_results():
+    imp = impeller_example()
+    file = Path(tempdir) / "imp_results.toml"
+    imp.save(file, results=True)
+
+    imp_loaded = Impeller.load(file)
+
+    assert imp == imp_loaded
+    assert_allclose(imp_loaded.disch.p(), imp.disch.p())
+    assert_allclose(imp_loaded.power, imp.power)
+    assert_allclose(imp_loaded.points[0].mach, imp.points[0].mach)
+
+
 def test_load_from_dict_isis():
     head_curves_dict = {
         "CURVES": [
@@ -0,0 +1,93 @@
+import json
+import subprocess
+import sys
+
+import ccp
+
+
+def run_python(code):
+    """Run code in a new interpreter and return the last line printed as json."""
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_import_time():
+    code = (
+        "import json, sys, time\n"
+        "t0 = time.perf_counter()\n"
+        "import ccp\n"
+        "import_time = time.perf_counter() - t0\n"
+        "print(json.dumps({'time': import_time, 'modules': list(sys.modules)}))\n"
+    )
+    result = run_python(code)
+
+    heavy_modules = [
+        "CoolProp",
+        "ctREFPROP",
+        "plotly",
+        "sklearn",
+        "pandas",
+        "openpyxl",
+        "tqdm",
+    ]
+    loaded = [m for m in heavy_modules if m in result["modules"]]
+    assert loaded == []
+    # measured ~0.5 s, mostly the pint registry
+    assert result["time"] < 3.0
+
+
+def test_compressor_import_does_not_load_pandas():
+    code = (
+        "import json, sys\n"
+        "import ccp.compressor\n"
+        "print(json.dumps('pandas' in sys.modules))\n"
+    )
+    assert run_python(code) is False
+
+
+def test_lazy_attributes():
+    assert ccp.State is ccp.state.State
+    assert ccp.Impeller is ccp.impeller.Impeller
+    assert "Evaluation" in dir(ccp)
+    assert "CP :" in ccp.__version__full
+
+    # submodules are available as ccp.<module> after "import ccp"
+    modules = [
+        "cache",
+        "compressor",
+        "curve",
+        "data_io",
+        "envelope",
+        "evaluation",
+        "fo",
+        "impeller",
+        "library",
+        "parallel",
+        "point",
+        "polytropic",
+        "profiling",
+        "similarity",
+        "solvers",
+        "state",
+        "train",
+    ]
+    code = (
+        "import json\n"
+        "import ccp\n"
+        f"print(json.dumps([getattr(ccp, m).__name__ for m in {modules!r}]))\n"
+    )
+    assert run_python(code) == [f"ccp.{m}" for m in modules]
+
+
+def test_plotly_template_registered_on_first_plot():
+    code = (
+        "import json\n"
+        "import ccp\n"
+        "from ccp.plotly_theme import go\n"
+        "fig = go.Figure()\n"
+        "import plotly.io as pio\n"
+        "print(json.dumps(pio.templates.default))\n"
+    )
+    assert run_python(code) == "ccp"
@@ -146,3 +146,57 @@ def test_filter_data_flag():
             },
         ),
     )
+
+
+@pytest.fixture
+def historian_reader():
+    return ccp.data_io.HistorianReader(
+        data_dir / "UTGCA_1231_A_1s.csv",
+        columns={
+            "UTGCA_1231_PIT_203_A": "ps",
+            "UTGCA_1231_TIT_202_A": "Ts",
+            "UTGCA_1231_PIT_204_A": "pd",
+            "UTGCA_1231_SE_02_S_A": "speed",
+        },
+        units={"ps": "kPa", "Ts": "degC", "pd": "kPa", "speed": "RPM"},
+        chunksize=1000,
+    )
+
+
+def test_historian_reader_csv(historian_reader):
+    chunks = list(historian_reader)
+    assert [len(chunk) for chunk in chunks] == [1000, 1000, 1000, 601]
+
+    df = pd.read_csv(data_dir / "UTGCA_1231_A_1s.csv", index_col=0, parse_dates=True)
+    df = df[list(historian_reader.columns)].rename(columns=historian_reader.columns)
+    assert_frame_equal(pd.concat(chunks), df, check_freq=False, check_names=False)
+
+
+def test_historian_reader_xlsx(historian_reader, tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+    df = pd.concat(historian_reader)[:50]
+
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["time"] + list(historian_reader.columns))
+    for time, row in zip(df.index, df.to_numpy()):
+        sheet.append([time.to_pydatetime()] + list(row))
+    workbook.save(tmp_path / "historian.xlsx")
+
+    reader = ccp.data_io.HistorianReader(
+        tmp_path / "historian.xlsx", columns=historian_reader.columns, chunksize=20
+    )
+    chunks = list(reader)
+    assert [len(chunk) for chunk in chunks] == [20, 20, 10]
+    assert_frame_equal(pd.concat(chunks), df, check_freq=False, check_names=False)
+
+
+def test_filter_chunks(historian_reader):
+    data_type = {"ps": "pressure", "Ts": "temperature", "speed": "speed"}
+    filtered = pd.concat(
+        ccp.data_io.filter_chunks(historian_reader, window=5, data_type=data_type)
+    )
+    expected = ccp.data_io.filter_data(
+        pd.concat(historian_reader), window=5, data_type=data_type
+    )
+    assert_frame_equal(filtered, expected)
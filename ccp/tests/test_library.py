@@ -0,0 +1,72 @@
+import pytest
+from numpy.testing import assert_allclose
+
+import ccp
+from ccp import Q_, State, Point, Impeller
+from ccp.impeller import closest_impeller
+
+
+def create_impeller(T, D=0.3):
+    fluid = {"methane": 1}
+    suc = State(p=Q_(1, "bar"), T=Q_(T, "degK"), fluid=fluid)
+    points = []
+    for speed, factor in [(9000, 1.0), (10000, 1.1)]:
+        for flow_v, pressure_ratio in [(1.0, 2.0), (1.2, 1.9), (1.4, 1.7)]:
+            p = pressure_ratio * factor
+            disch = State(p=Q_(p, "bar"), T=Q_(T * p**0.3, "degK"), fluid=fluid)
+            points.append(
+                Point(
+                    suc=suc,
+                    disch=disch,
+                    flow_v=Q_(flow_v * factor, "m³/s"),
+                    speed=Q_(speed, "RPM"),
+                    b=Q_(0.01, "m"),
+                    D=Q_(D, "m"),
+                )
+            )
+    return Impeller(points)
+
+
+@pytest.fixture
+def library(tmp_path):
+    library = ccp.ImpellerLibrary(tmp_path)
+    for T in [280, 300, 320, 340]:
+        library.add(create_impeller(T), name=f"T{T}")
+    library.add(create_impeller(300, D=0.5), name="T300_D500")
+    return library
+
+
+@pytest.fixture
+def suc():
+    return State(p=Q_(1, "bar"), T=Q_(318, "degK"), fluid={"methane": 1})
+
+
+def test_library_query(library, suc):
+    assert len(library) == 5
+    assert library.query(suc) == ["T320"]
+    assert set(library.query(suc, k=3)) == {"T320", "T300", "T300_D500"}
+    assert library.query(suc, D=Q_(500, "mm")) == ["T300_D500"]
+    assert library.query(suc, speed=Q_(20000, "RPM")) == []
+    with pytest.raises(ValueError):
+        library.nearest(suc, speed=Q_(20000, "RPM"))
+
+
+def test_library_lazy_load(library, suc):
+    library = ccp.ImpellerLibrary(library.directory, max_loaded=1)
+    assert library.names == ["T280", "T300", "T320", "T340", "T300_D500"]
+
+    imp = library.nearest(suc)
+    assert_allclose(imp.points[0].suc.T(), 320)
+    assert list(library._loaded) == ["T320"]
+    assert closest_impeller(library, suc) is imp
+
+    library["T280"]
+    assert list(library._loaded) == ["T280"]
+
+
+def test_library_remove(library, suc):
+    library.remove("T320")
+
+    assert "T320" not in ccp.ImpellerLibrary(library.directory)
+    assert not (library.directory / "T320.toml").exists()
+    assert library.query(suc, k=1, D=Q_(0.3, "m")) == ["T300"]
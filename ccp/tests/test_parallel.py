@@ -0,0 +1,65 @@
+import threading
+from copy import copy
+
+import pytest
+
+import ccp
+from ccp import Q_, State, parallel
+
+
+def get_eos(_):
+    return ccp.config.EOS
+
+
+def get_shared(i):
+    return parallel.shared()[i]
+
+
+def test_config_override_is_thread_local():
+    global_eos = ccp.config.EOS
+    results = {}
+
+    def worker():
+        results["thread"] = ccp.config.EOS
+
+    with ccp.config.override(EOS="PR"):
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        results["main"] = ccp.config.EOS
+
+    assert results == {"main": "PR", "thread": global_eos}
+    assert ccp.config.EOS == global_eos
+
+
+def test_config_override_invalid():
+    with pytest.raises(ValueError):
+        with ccp.config.override(eos="HEOS"):
+            pass
+
+
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_pool_uses_caller_config(backend):
+    with ccp.config.override(EOS="PR"):
+        with parallel.pool(2, backend=backend) as pool:
+            assert pool.map(get_eos, range(4)) == ["PR"] * 4
+
+
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_pool_shared(backend):
+    with parallel.pool(2, backend=backend, shared=[10, 20, 30]) as pool:
+        assert pool.map(get_shared, range(3)) == [10, 20, 30]
+
+
+def test_pool_invalid_backend():
+    with pytest.raises(ValueError):
+        parallel.pool(backend="mpi")
+
+
+def test_state_copy_keeps_eos():
+    with ccp.config.override(EOS="HEOS"):
+        state = State(p=Q_(1, "bar"), T=Q_(300, "degK"), fluid={"methane": 1})
+    state_copy = copy(state)
+
+    assert state.EOS == "HEOS"
+    assert state_copy.EOS == "HEOS"
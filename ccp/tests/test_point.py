@@ -5,6 +5,7 @@ from ccp.point import *
 from pathlib import Path
 from tempfile import tempdir
 import pickle
+import toml
 
 skip = False  # skip slow tests
 
@@ -95,6 +96,25 @@ def test_point_eff_flow_v_head_speed_suc(
     assert_allclose(point_eff_flow_v_head_speed_suc.power, 319149.832746, rtol=1e-4)
 
 
+def test_point_disch_guess(suc_0, disch_0, point_eff_flow_v_head_speed_suc):
+    # guess from a point with a lower head, as the previous point in a curve
+    guess = Point(suc=suc_0, head=80000, eff=0.797811, flow_v=1, speed=1, b=1, D=1)
+    point = Point(
+        suc=suc_0,
+        head=82876.226229,
+        eff=0.797811,
+        flow_v=1,
+        speed=1,
+        b=1,
+        D=1,
+        disch_guess=guess.disch,
+    )
+    assert point.disch == disch_0
+    assert_allclose(point.head, point_eff_flow_v_head_speed_suc.head, rtol=1e-4)
+    assert_allclose(point.volume_ratio, 2.304715, rtol=1e-4)
+    assert point.solver_calls < point_eff_flow_v_head_speed_suc.solver_calls
+
+
 @pytest.fixture
 def point_eff_flow_m_head_speed_suc(suc_0):
     point_eff_flow_v_head_speed_suc = Point(
@@ -514,6 +534,51 @@ def test_save_load(point_disch_flow_v_speed_suc):
     assert point_disch_flow_v_speed_suc == point_0_loaded
 
 
+def test_save_load_results(suc_0):
+    point = Point(suc=suc_0, flow_v=1, speed=1000, head=82876, eff=0.8, b=1, D=1)
+    file = Path(tempdir) / "point_results.toml"
+    point.save(file, results=True)
+    point_loaded = Point.load(file)
+
+    assert point == point_loaded
+    assert_allclose(point_loaded.disch.p(), point.disch.p())
+    assert_allclose(point_loaded.disch.T(), point.disch.T())
+    assert_allclose(point_loaded.power, point.power)
+    assert_allclose(point_loaded.phi, point.phi)
+    assert_allclose(point_loaded.psi, point.psi)
+    assert_allclose(point_loaded.mach, point.mach)
+    assert_allclose(point_loaded.reynolds, point.reynolds)
+    assert point_loaded.casing_area is None
+    assert point_loaded.verify()
+
+    point_loaded.head = 1.1 * point_loaded.head
+    with pytest.raises(ValueError, match="head"):
+        point_loaded.verify()
+
+
+def test_save_load_results_settings(suc_0):
+    point = Point(suc=suc_0, flow_v=1, speed=1000, head=82876, eff=0.8, b=1, D=1)
+    file = Path(tempdir) / "point_results_settings.toml"
+    point.save(file, results=True)
+    parameters = toml.load(file)
+    assert parameters["results"]["ccp_version"] == ccp.__version__
+    assert parameters["results"]["EOS"] == suc_0.EOS
+    assert parameters["results"]["polytropic_method"] == "schultz"
+
+    # results are verified on the first access
+    parameters["results"]["values"]["head"] = "90000 J/kg"
+    point_loaded = Point._from_load(parameters)
+    with pytest.raises(ValueError, match="head"):
+        point_loaded.power
+
+    # results saved with another method are ignored
+    parameters["results"]["polytropic_method"] = "huntington"
+    with pytest.warns(UserWarning, match="polytropic_method"):
+        point_loaded = Point._from_load(parameters)
+    assert point_loaded.solver_calls > 0
+    assert_allclose(point_loaded.head, 82876)
+
+
 def test_pickle(point_disch_flow_v_speed_suc):
     pickled_point = pickle.loads(pickle.dumps(point_disch_flow_v_speed_suc))
     assert pickled_point == point_disch_flow_v_speed_suc
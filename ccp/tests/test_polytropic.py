@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+import ccp.point
+from ccp import Q_, State, polytropic
+
+
+@pytest.fixture
+def states():
+    fluid = {"methane": 1}
+    sucs = [State(p=Q_(30, "bar"), T=Q_(300, "degK"), fluid=fluid) for _ in range(3)]
+    dischs = [
+        State(p=Q_(30 * ratio, "bar"), T=Q_(300 * ratio**0.3, "degK"), fluid=fluid)
+        for ratio in [1.5, 2.0, 3.0]
+    ]
+    return sucs, dischs
+
+
+@pytest.mark.parametrize(
+    "method", ["schultz", "mallen_saville", "sandberg_colby", "huntington"]
+)
+def test_head_eff(states, method):
+    sucs, dischs = states
+    head, eff = polytropic.head_eff(sucs, dischs, method=method)
+
+    for i, (suc, disch) in enumerate(zip(sucs, dischs)):
+        expected_head = getattr(ccp.point, f"head_pol_{method}")(suc, disch)
+        expected_eff = getattr(ccp.point, f"eff_pol_{method}")(suc, disch)
+        assert_allclose(head[i], expected_head, rtol=1e-8)
+        assert_allclose(eff[i], expected_eff, rtol=1e-8)
+
+
+def test_head_eff_properties(states):
+    sucs, dischs = states
+    fluid = sucs[0].fluid
+    suc = polytropic.properties_from_pT(Q_(30, "bar").to("Pa").m, 300, fluid)
+    disch = polytropic.properties(dischs)
+
+    head, eff = polytropic.head_eff(suc, disch, method="huntington", fluid=fluid)
+    expected_head, expected_eff = polytropic.head_eff(sucs, dischs, method="huntington")
+    assert_allclose(head, expected_head)
+    assert_allclose(eff, expected_eff)
+
+    with pytest.raises(ValueError, match="fluid is required"):
+        polytropic.head_eff(suc, disch, method="schultz")
+
+
+def test_benchmark(states):
+    sucs, dischs = states
+    results = polytropic.benchmark(sucs, dischs, repeat=1)
+
+    assert list(results.index) == [
+        "schultz",
+        "mallen_saville",
+        "sandberg_colby",
+        "huntington",
+    ]
+    assert results.loc["schultz", "eff_diff"] == 0
+    assert np.all(results["eff_diff"] < 1e-2)
+    assert np.all(results["time"] > 0)
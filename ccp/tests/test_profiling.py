@@ -0,0 +1,120 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+import ccp
+from ccp import Q_, State, Point
+
+
+@pytest.fixture
+def suc():
+    return State(p=Q_(1, "bar"), T=Q_(300, "degK"), fluid={"methane": 1})
+
+
+def test_profile_counts(suc):
+    with ccp.profile() as stats:
+        Point(
+            suc=suc,
+            flow_v=Q_(1, "m³/s"),
+            speed=Q_(1000, "RPM"),
+            head=Q_(50, "kJ/kg"),
+            eff=0.8,
+            b=Q_(0.01, "m"),
+            D=Q_(0.3, "m"),
+        )
+
+    assert stats.states["calls"] > 0
+    assert stats.updates["h_s"]["calls"] == 1
+    assert stats.updates["p_h"]["calls"] > 1
+
+    solver = stats.solvers["ccp.point.disch_from_suc_head_eff"]
+    assert solver["calls"] == 1
+    assert solver["iterations"] > 0
+    assert solver["failures"] == 0
+
+    assert stats.calc["_calc_from_eff_flow_v_head_speed_suc"]["calls"] == 1
+    assert stats.elapsed >= stats.calc["_calc_from_eff_flow_v_head_speed_suc"]["time"]
+
+
+def test_profile_inactive(suc):
+    with ccp.profile() as stats:
+        pass
+    suc.update(p=Q_(2, "bar"), T=Q_(300, "degK"))
+
+    assert stats.updates == {}
+    assert ccp.profiling.current() is None
+
+
+def test_profile_nested(suc):
+    with ccp.profile() as outer:
+        suc.update(p=Q_(2, "bar"), T=Q_(300, "degK"))
+        with ccp.profile() as inner:
+            suc.update(p=Q_(3, "bar"), T=Q_(300, "degK"))
+
+    assert outer.updates["p_T"]["calls"] == 1
+    assert inner.updates["p_T"]["calls"] == 1
+
+
+def test_profile_solver_failure():
+    with ccp.profile() as stats:
+        with pytest.raises(RuntimeError):
+            ccp.profiling.newton(lambda x: x**2 + 1, 1.0, maxiter=5)
+
+    (site,) = stats.solvers
+    assert site.endswith("test_profiling.test_profile_solver_failure")
+    assert stats.solvers[site]["failures"] == 1
+
+
+def test_profile_newton_array():
+    x0 = np.array([1.0, 1.0])
+    with ccp.profile() as stats:
+        root = ccp.profiling.newton(lambda x: x**2 - np.array([2.0, 3.0]), x0)
+        root_full, converged, zero_der = ccp.profiling.newton(
+            lambda x: x**2 - np.array([2.0, 3.0]), x0, full_output=True
+        )
+
+    assert_allclose(root, np.sqrt([2, 3]))
+    assert_allclose(root_full, root)
+    assert converged.all()
+    (site,) = stats.solvers
+    assert stats.solvers[site]["calls"] == 2
+    assert stats.solvers[site]["failures"] == 0
+
+
+def test_profile_thread_local():
+    with ccp.profile():
+        with ThreadPoolExecutor(1) as executor:
+            assert executor.submit(ccp.profiling.current).result() is None
+        with ccp.parallel.pool(1, backend="thread") as pool:
+            stats = pool.apply(ccp.profiling.current)
+        assert stats is ccp.profiling.current()
+
+
+def test_fixed_point():
+    with ccp.profile() as stats:
+        # linear function, converged after the fixed-point and one secant step
+        x, converged = ccp.profiling.fixed_point(lambda x: 0.5 * x + 150, 100.0)
+        assert converged
+        assert x == pytest.approx(300)
+
+        x, converged = ccp.profiling.fixed_point(lambda x: x + 1, 1.0, maxiter=4)
+        assert not converged
+
+    (site,) = stats.solvers
+    assert stats.solvers[site]["calls"] == 2
+    assert stats.solvers[site]["function_calls"] == 3 + 4
+    assert stats.solvers[site]["failures"] == 1
+
+
+def test_profile_json(suc, tmp_path):
+    with ccp.profile() as stats:
+        suc.update(p=Q_(2, "bar"), T=Q_(300, "degK"))
+
+    stats.to_json(tmp_path / "profile.json")
+    data = json.loads((tmp_path / "profile.json").read_text())
+
+    assert data["updates"]["p_T"]["calls"] == 1
+    assert "State.update inputs" in stats.report()
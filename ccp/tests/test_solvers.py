@@ -0,0 +1,15 @@
+import pytest
+
+from ccp.solvers import fixed_point
+
+
+def test_fixed_point():
+    # linear function, converged after the fixed-point and one secant step
+    x, converged, calls = fixed_point(lambda x: 0.5 * x + 150, 100.0, full_output=True)
+    assert converged
+    assert x == pytest.approx(300)
+    assert calls == 3
+
+    x, converged, calls = fixed_point(lambda x: x + 1, 1.0, maxiter=4, full_output=True)
+    assert not converged
+    assert calls == 4
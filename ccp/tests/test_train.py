@@ -0,0 +1,58 @@
+import pytest
+from numpy.testing import assert_allclose
+
+import ccp
+from ccp import Q_, State, Point, Impeller
+
+
+@pytest.fixture
+def imp():
+    fluid = {"methane": 1}
+    suc = State(p=Q_(30, "bar"), T=Q_(300, "degK"), fluid=fluid)
+    points = []
+    for speed, factor in [(9000, 1.0), (11000, 1.2)]:
+        for flow_v, pressure_ratio in [(0.1, 2.0), (0.15, 1.9), (0.2, 1.7)]:
+            p = 30 * pressure_ratio * factor
+            disch = State(
+                p=Q_(p, "bar"), T=Q_(300 * (p / 30) ** 0.3, "degK"), fluid=fluid
+            )
+            points.append(
+                Point(
+                    suc=suc,
+                    disch=disch,
+                    flow_v=Q_(flow_v * factor, "m³/s"),
+                    speed=Q_(speed, "RPM"),
+                    b=Q_(0.03, "m"),
+                    D=Q_(0.4, "m"),
+                )
+            )
+    return Impeller(points)
+
+
+def test_train_point(imp):
+    train = ccp.Train(
+        [imp, imp], cooler_T=Q_(35, "degC"), cooler_delta_p=Q_(0.5, "bar")
+    )
+    suc = imp.points[0].suc
+    flow_m = Q_(3, "kg/s")
+    speed = Q_(10000, "RPM").to("rad/s")
+
+    p0, p1 = train.point(suc=suc, flow_m=flow_m, speed=speed)
+    expected = imp.point(flow_m=flow_m, speed=speed)
+    # the map head is interpolated in the curves, not through the discharge state
+    assert_allclose(p0.disch.p(), expected.disch.p(), rtol=1e-2)
+    assert_allclose(p1.suc.p(), p0.disch.p() - Q_(0.5, "bar"))
+    assert_allclose(p1.suc.T(), Q_(35, "degC").to("degK"))
+    assert_allclose(p1.speed, speed)
+
+    disch_p = p1.disch.p()
+    points = train.point(suc=suc, flow_m=flow_m, disch_p=disch_p)
+    assert_allclose(points[0].speed, speed, rtol=1e-5)
+    assert_allclose(points[1].disch.p(), disch_p, rtol=1e-5)
+
+    tables = train.point_many(
+        suc, flow_m=flow_m, disch_p=[disch_p.m, disch_p.m], backend="thread"
+    )
+    assert len(tables) == 2
+    assert_allclose(tables[0]["speed"], [speed.m, speed.m], rtol=1e-5)
+    assert_allclose(tables[1]["disch.p"], [disch_p.m, disch_p.m], rtol=1e-5)
@@ -0,0 +1,259 @@
+"""Module with compressor trains, impellers in series with coolers between them.
+
+The discharge of each stage goes through a cooler (outlet temperature and
+pressure drop) to the suction of the next stage. All stages are driven by the
+same shaft line, each stage at the train speed times its speed ratio.
+
+The performance of each stage at its actual suction is obtained from the stage
+map at the same volumetric flow and speed, keeping the map head and efficiency
+(same flow and head coefficients, without the volume ratio correction used in
+Impeller.convert_from). The map head and efficiency are interpolated in the
+curves cached by each impeller, so the only iterative calculation in each stage
+is the discharge state.
+
+```{code-block} python
+import ccp
+
+train = ccp.Train([imp_lp, imp_hp], cooler_T=Q_(40, "degC"))
+points = train.point(suc=suc, flow_m=Q_(20, "kg/s"), disch_p=Q_(120, "bar"))
+tables = train.point_many(sucs, flow_m=flows_m, disch_p=disch_ps)
+```
+"""
+
+import multiprocessing
+
+import numpy as np
+
+from ccp import Q_, State, Point, PointTable, parallel
+from ccp.config.units import check_units
+from ccp.impeller import calculate_power_losses
+from ccp.profiling import newton
+
+
+class Train:
+    """Compressor train with impellers in series.
+
+    Parameters
+    ----------
+    impellers : list
+        List of ccp.Impeller, one for each stage, from the first to the last.
+    cooler_T : pint.Quantity, float, array, optional
+        Outlet temperature (degK) of the coolers after each stage, except the
+        last one. A single value is used for all coolers and np.nan is used for
+        stages without cooler. Default is no coolers.
+    cooler_delta_p : pint.Quantity, float, array, optional
+        Pressure drop (Pa) between each stage and the next one.
+        Default is 0.
+    speed_ratios : list, optional
+        Ratio between the speed of each stage and the train speed.
+        Default is 1 for all stages.
+
+    Examples
+    --------
+    >>> import ccp
+    >>> imp = ccp.impeller_example()
+    >>> train = ccp.Train([imp, imp], cooler_T=Q_(30, "degC"))
+    >>> train
+    Train(stages=2)
+    """
+
+    @check_units
+    def __init__(
+        self, impellers, cooler_T=None, cooler_delta_p=None, speed_ratios=None
+    ):
+        self.impellers = list(impellers)
+        n = len(self.impellers) - 1
+
+        if cooler_T is None:
+            cooler_T = Q_(np.nan, "degK")
+        if cooler_delta_p is None:
+            cooler_delta_p = Q_(0, "Pa")
+        if speed_ratios is None:
+            speed_ratios = 1.0
+
+        self.cooler_T = Q_(np.broadcast_to(cooler_T.m, n).astype(float), "degK")
+        self.cooler_delta_p = Q_(
+            np.broadcast_to(cooler_delta_p.m, n).astype(float), "Pa"
+        )
+        self.speed_ratios = np.broadcast_to(speed_ratios, n + 1).astype(float)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(stages={len(self.impellers)})"
+
+    def __len__(self):
+        return len(self.impellers)
+
+    def __getitem__(self, item):
+        return self.impellers[item]
+
+    @check_units
+    def point(self, suc, flow_m, speed=None, disch_p=None):
+        """Calculate the train operating point.
+
+        Parameters
+        ----------
+        suc : ccp.State
+            Suction state of the first stage.
+        flow_m : pint.Quantity, float
+            Mass flow (kg/s).
+        speed : pint.Quantity, float, optional
+            Train speed (rad/s).
+        disch_p : pint.Quantity, float, optional
+            Discharge pressure of the last stage (Pa). If given, the train speed
+            is calculated.
+
+        Returns
+        -------
+        points : list
+            List with one ccp.Point for each stage.
+        """
+        if (speed is None) == (disch_p is None):
+            raise ValueError("Either speed or disch_p must be defined.")
+
+        if speed is not None:
+            return self._stage_points(suc, flow_m, speed.m)
+
+        # the discharge states of the last iteration are the initial guesses
+        # for the next one
+        last_points = []
+
+        def residual(speed_):
+            last_points[:] = self._stage_points(suc, flow_m, speed_, last_points)
+            return last_points[-1].disch.p().m - disch_p.m
+
+        curve_speeds = [c.speed.m for c in self.impellers[0].curves]
+        speed_0 = np.mean(curve_speeds) / self.speed_ratios[0]
+        try:
+            speed = newton(
+                residual, speed_0, x1=1.05 * speed_0, tol=1e-6 * speed_0, maxiter=50
+            )
+        except (RuntimeError, ValueError) as e:
+            raise ValueError(
+                f"Could not calculate the train speed for disch_p={disch_p:~P}."
+            ) from e
+
+        return self._stage_points(suc, flow_m, speed, last_points)
+
+    @check_units
+    def point_many(
+        self,
+        sucs,
+        flow_m,
+        speed=None,
+        disch_p=None,
+        processes=None,
+        backend=None,
+        callback=None,
+    ):
+        """Calculate the train operating point for several cases in parallel.
+
+        Parameters
+        ----------
+        sucs : ccp.State, list
+            Suction state of the first stage for each case, or one state for
+            all cases.
+        flow_m : pint.Quantity, float, array
+            Mass flow (kg/s) for each case.
+        speed : pint.Quantity, float, array, optional
+            Train speed (rad/s) for each case.
+        disch_p : pint.Quantity, float, array, optional
+            Discharge pressure of the last stage (Pa) for each case.
+        processes : int, optional
+            Maximum number of workers. Default is the number of CPUs.
+        backend : str, optional
+            Parallel backend, "process" or "thread".
+            Default is ccp.config.PARALLEL_BACKEND.
+        callback : callable, optional
+            Function called as callback(done, total) each time a group of cases
+            is completed.
+
+        Returns
+        -------
+        tables : list
+            List with one ccp.PointTable for each stage, with the points of all
+            cases.
+        """
+        if (speed is None) == (disch_p is None):
+            raise ValueError("Either speed or disch_p must be defined.")
+        if isinstance(sucs, State):
+            sucs = [sucs]
+
+        target = speed if speed is not None else disch_p
+        n = np.broadcast(np.empty(len(sucs)), flow_m.m, target.m).size
+        if len(sucs) == 1:
+            sucs = sucs * n
+        flow_m = np.broadcast_to(flow_m.m, n)
+        target = np.broadcast_to(target.m, n)
+        target_name = "speed" if speed is not None else "disch_p"
+        cases = [
+            dict(suc=suc, flow_m=flow_m_, **{target_name: target_})
+            for suc, flow_m_, target_ in zip(sucs, flow_m, target)
+        ]
+
+        # calculate the cached curves before the impellers are sent to the workers
+        for impeller in self.impellers:
+            impeller._curve_family("head")
+
+        if processes is None:
+            processes = multiprocessing.cpu_count()
+        processes = max(1, min(processes, n))
+        chunks = np.array_split(np.arange(n), min(n, 4 * processes))
+        args = [[cases[i] for i in chunk] for chunk in chunks]
+
+        # the train is sent once to each worker, the tasks only have the cases
+        done = 0
+        results = []
+        with parallel.pool(processes, backend, shared=self) as pool:
+            for chunk_points in pool.imap(_train_points, args):
+                results += chunk_points
+                done += len(chunk_points)
+                if callback is not None:
+                    callback(done, n)
+
+        return [PointTable(stage_points) for stage_points in zip(*results)]
+
+    def _stage_points(self, suc, flow_m, speed, guesses=None):
+        """Points of each stage for a train speed (rad/s) magnitude."""
+        if not guesses:
+            guesses = [None] * len(self.impellers)
+
+        points = []
+        for i, (impeller, guess) in enumerate(zip(self.impellers, guesses)):
+            if i > 0:
+                disch = points[-1].disch
+                cooler_T = self.cooler_T[i - 1]
+                suc = State(
+                    p=disch.p() - self.cooler_delta_p[i - 1],
+                    T=disch.T() if np.isnan(cooler_T.m) else cooler_T,
+                    fluid=disch.fluid,
+                )
+
+            stage_speed = Q_(speed * self.speed_ratios[i], "rad/s")
+            flow_v = flow_m * suc.v()
+            head, eff = impeller._head_eff(flow_v.m, stage_speed.m)
+            p0 = impeller.points[0]
+            points.append(
+                Point(
+                    suc=suc,
+                    flow_m=flow_m,
+                    speed=stage_speed,
+                    head=Q_(head[0], "J/kg"),
+                    eff=Q_(eff[0], "dimensionless"),
+                    b=p0.b,
+                    D=p0.D,
+                    power_losses=calculate_power_losses(
+                        impeller.curves[0].power_losses,
+                        impeller.curves[0].speed,
+                        stage_speed,
+                    ),
+                    disch_guess=None if guess is None else guess.disch,
+                )
+            )
+
+        return points
+
+
+def _train_points(cases):
+    """Worker function used by Train.point_many."""
+    train = parallel.shared()
+    return [train.point(**case) for case in cases]
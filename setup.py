@@ -82,9 +82,10 @@ setup(
             "sphinx-panels",
             "sphinx-copybutton",
             "sphinx-rtd-theme",
+            "asv",
         ],
     },
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
     license="Apache License 2.0",
     classifiers=[
         # Trove classifiers